@@ -18,6 +18,7 @@ from .config import MAINNET, TESTNET, AvantisConfig
 from .errors import (
     ApiError,
     AvantisError,
+    CircuitOpenError,
     ConfigError,
     DelegationError,
     DigestMismatchError,
@@ -58,6 +59,7 @@ __all__ = [
     "TriggerType",
     "AvantisError",
     "ApiError",
+    "CircuitOpenError",
     "ConfigError",
     "ValidationError",
     "SigningError",
@@ -0,0 +1,94 @@
+"""Small asyncio helpers shared by the bulk/fan-out, paging and callback paths."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[T]], limit: int, *, return_exceptions: bool = False
+) -> list[Any]:
+    """``asyncio.gather`` with at most ``limit`` awaitables in flight.
+
+    Results keep input order. With ``return_exceptions`` a failure is
+    returned in its slot instead of cancelling the rest (bulk submissions
+    report per-item outcomes).
+    """
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    gate = asyncio.Semaphore(limit)
+
+    async def _run(aw: Awaitable[T]) -> T:
+        async with gate:
+            return await aw
+
+    return await asyncio.gather(
+        *(_run(aw) for aw in aws), return_exceptions=return_exceptions
+    )
+
+
+async def dispatch(callback: Callable[[T], Awaitable[None] | None] | None, event: T) -> None:
+    """Hand ``event`` to a sync or async user callback (``None``: no-op)."""
+    if callback is None:
+        return
+    result = callback(event)
+    if asyncio.iscoroutine(result):
+        await result
+
+
+# Keys under which the history / twap-app APIs wrap a page's records.
+_PAGE_KEYS = ("data", "items", "results", "records", "trades", "orders", "twaps", "portfolio")
+
+
+def page_items(page: Any) -> list[Any]:
+    """The record list of one API page (a bare list or a wrapper object)."""
+    if isinstance(page, list):
+        return page
+    if isinstance(page, dict):
+        for key in _PAGE_KEYS:
+            if isinstance(page.get(key), list):
+                return page[key]
+        for value in page.values():
+            if isinstance(value, list):
+                return value
+    return []
+
+
+async def iter_pages(
+    fetch_page: Callable[[int], Awaitable[Any]],
+    *,
+    page_size: int,
+    prefetch: int = 4,
+    start: int = 0,
+) -> AsyncIterator[Any]:
+    """Records of ``fetch_page(0), fetch_page(1), ...`` in order, with up to
+    ``prefetch`` pages requested ahead of the consumer.
+
+    Stops after the first short page (fewer than ``page_size`` records).
+    Pages fetched past the end are discarded; leaving the loop early
+    cancels the outstanding requests.
+    """
+    if prefetch < 1:
+        raise ValueError("prefetch must be >= 1")
+    pending: deque[asyncio.Task[Any]] = deque()
+    next_page = start
+    try:
+        while True:
+            while len(pending) < prefetch:
+                pending.append(asyncio.ensure_future(fetch_page(next_page)))
+                next_page += 1
+            items = page_items(await pending.popleft())
+            for item in items:
+                yield item
+            if len(items) < page_size:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from decimal import Decimal
 from typing import Any
 
 from eth_abi import encode as abi_encode
 from eth_utils import keccak, to_bytes
 
+from .._aio import iter_pages
 from ..base_api import ExecutingApi
 from ..config import AvantisConfig
 from ..errors import ConfigError, DelegationError
 from ..execution import ExecutionEngine
 from ..markets.models import PairInfo, strip_upside_suffix
+from ..ratelimit import Priority
 from ..signing import BaseSigner, sign_intent
 from ..transport import HttpTransport
 from ..txbuilder import TxBuilderClient
@@ -51,7 +53,10 @@ class AccountApi(ExecutingApi):
         addr = trader or self.trader
         assert self._t is not None
         data = await self._t.json(
-            "GET", f"{self._cfg.core_api_url}/user-data", params={"trader": addr}
+            "GET",
+            f"{self._cfg.core_api_url}/user-data",
+            params={"trader": addr},
+            hedge="user-data",
         )
         user_data = UserData.model_validate(data)
         if user_data.positions:
@@ -73,6 +78,7 @@ class AccountApi(ExecutingApi):
         include_canceled: bool = False,
         page: int = 0,
         page_size: int = 20,
+        priority: Priority | None = None,
     ) -> Any:
         """TWAP orders with their per-slice trades (twap-app API; ``page`` is
         0-based)."""
@@ -86,6 +92,29 @@ class AccountApi(ExecutingApi):
                 "pageNum": page,
                 "pageSize": page_size,
             },
+            priority=priority,
+        )
+
+    def iter_twaps(
+        self,
+        trader: str | None = None,
+        *,
+        include_canceled: bool = False,
+        page_size: int = 100,
+        prefetch: int = 4,
+    ) -> AsyncIterator[Any]:
+        """Every TWAP order across all pages, ``prefetch`` pages requested
+        ahead of the consumer at ``Priority.BACKGROUND``."""
+        return iter_pages(
+            lambda page: self.twaps(
+                trader,
+                include_canceled=include_canceled,
+                page=page,
+                page_size=page_size,
+                priority=Priority.BACKGROUND,
+            ),
+            page_size=page_size,
+            prefetch=prefetch,
         )
 
     async def twap(self, twap_id: int) -> dict[str, Any] | None:
@@ -158,7 +187,7 @@ class AccountApi(ExecutingApi):
             spender=spender,
             amountUsdc=amount,
         )
-        return await self._route(calldata, wait)
+        return await self._route(calldata, wait, delegatable=False)
 
     async def register_delegate(
         self,
@@ -208,7 +237,7 @@ class AccountApi(ExecutingApi):
         calldata = await self._txb.calldata(
             "/v2/delegate/remove", trader=self.trader, delegate=delegate
         )
-        return await self._route(calldata, wait)
+        return await self._route(calldata, wait, delegatable=False)
 
     # ------------------------------------------------------------------ claims / misc
 
@@ -56,10 +56,14 @@ class ExecutingApi:
             cd_params["delegate"] = delegate
         return await self._txb.calldata(path, **cd_params)
 
-    async def _route(self, calldata: CallData, wait: bool) -> ExecutionReceipt:
+    async def _route(
+        self, calldata: CallData, wait: bool, *, delegatable: bool = True
+    ) -> ExecutionReceipt:
+        """Submit in the configured mode. Non-delegatable calldata never goes
+        out from a direct-mode lane: it must be sent by the signer itself."""
         if self._engine.is_relayer_mode:
             return await self._engine.submit_passthrough(calldata, wait=wait)
-        return await self._engine.submit_direct(calldata, wait=wait)
+        return await self._engine.submit_direct(calldata, wait=wait, lane=delegatable)
 
     async def _passthrough_or_direct(
         self, path: str, params: dict[str, Any], wait: bool, *, delegatable: bool = True
@@ -67,7 +71,7 @@ class ExecutingApi:
         if not delegatable:
             self._require_caller_is_signer(path)
         calldata = await self._calldata(path, params, delegatable=delegatable)
-        return await self._route(calldata, wait)
+        return await self._route(calldata, wait, delegatable=delegatable)
 
     def _require_caller_is_signer(self, what: str) -> None:
         """Guard for calls where msg.sender identity matters (referral, approve,
@@ -0,0 +1,177 @@
+"""Per-upstream circuit breakers for the shared HTTP transport.
+
+Each upstream (a configured service base URL, or the bare host for any other
+URL) has a breaker. ``failure_threshold`` consecutive failed attempts
+(transport errors, 502/503/504) *open* it: every request to that upstream
+then fails at once with :class:`~avantis_trader_sdk.errors.CircuitOpenError`
+instead of running its retry sleeps. While open, a background task probes
+the upstream every ``reset_s`` (backing off to ``max_reset_s``): the breaker
+is *half-open* during a probe and closes again on the first healthy answer.
+
+Strategies can read :meth:`CircuitBreakers.state` / :meth:`~CircuitBreakers.states`
+or pass ``on_change`` to pause quoting while an upstream is down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from enum import Enum
+from urllib.parse import urlsplit
+
+from .errors import CircuitOpenError
+
+
+class BreakerState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+@dataclass
+class Breaker:
+    upstream: str
+    probe_url: str
+    state: BreakerState = BreakerState.CLOSED
+    failures: int = 0  # consecutive
+    opened_at: float = 0.0
+    reset_s: float = 0.0  # current open period
+    trips: int = 0
+
+
+Probe = Callable[[str], Awaitable[bool]]
+
+
+class CircuitBreakers:
+    """Breakers keyed by upstream, shared by one :class:`HttpTransport`."""
+
+    def __init__(
+        self,
+        routes: Mapping[str, str] | None = None,
+        *,
+        failure_threshold: int = 5,
+        reset_s: float = 10.0,
+        max_reset_s: float = 60.0,
+        on_change: Callable[[str, BreakerState], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        # longest prefix first, so /batched-market is not taken for its parent
+        self._routes = sorted(
+            ((base.rstrip("/"), name) for base, name in (routes or {}).items() if base),
+            key=lambda route: -len(route[0]),
+        )
+        self.failure_threshold = failure_threshold
+        self.reset_s = reset_s
+        self.max_reset_s = max_reset_s
+        self.on_change = on_change
+        self._clock = clock
+        self._breakers: dict[str, Breaker] = {}
+        self._probes: dict[str, asyncio.Task[None]] = {}
+        self._probe: Probe | None = None
+
+    def bind(self, probe: Probe) -> None:
+        """Set the health check used by background probes (the transport
+        binds a short GET on the upstream's base URL)."""
+        self._probe = probe
+
+    def _upstream(self, url: str) -> tuple[str, str]:
+        """(upstream name, probe URL) for ``url``."""
+        for base, name in self._routes:
+            if url.startswith(base):
+                return name, base
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        return host, host
+
+    def _breaker(self, url: str) -> Breaker:
+        name, base = self._upstream(url)
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = Breaker(upstream=name, probe_url=base)
+        return breaker
+
+    # ------------------------------------------------------------------ state
+
+    def state(self, url_or_upstream: str) -> BreakerState:
+        """State of the breaker guarding a URL (or an upstream name)."""
+        known = self._breakers.get(url_or_upstream)
+        if known is not None:
+            return known.state
+        return self._breaker(url_or_upstream).state
+
+    def states(self) -> dict[str, BreakerState]:
+        return {name: b.state for name, b in self._breakers.items()}
+
+    def _set(self, breaker: Breaker, state: BreakerState) -> None:
+        if breaker.state is not state:
+            breaker.state = state
+            if self.on_change is not None:
+                self.on_change(breaker.upstream, state)
+
+    # ------------------------------------------------------------------ gating
+
+    def check(self, url: str) -> None:
+        """Raise :class:`CircuitOpenError` unless ``url``'s upstream is closed."""
+        breaker = self._breaker(url)
+        if breaker.state is BreakerState.CLOSED:
+            return
+        retry_in = max(0.0, breaker.opened_at + breaker.reset_s - self._clock())
+        raise CircuitOpenError(
+            f"{breaker.upstream} is failing; circuit {breaker.state.value} "
+            f"(next probe in {retry_in:.1f}s)",
+            upstream=breaker.upstream,
+            retry_in_s=retry_in,
+            url=url,
+        )
+
+    def success(self, url: str) -> None:
+        breaker = self._breaker(url)
+        breaker.failures = 0
+        if breaker.state is not BreakerState.CLOSED:
+            self._close(breaker)
+
+    def failure(self, url: str) -> None:
+        breaker = self._breaker(url)
+        breaker.failures += 1
+        if breaker.state is BreakerState.CLOSED and breaker.failures >= self.failure_threshold:
+            self._open(breaker, self.reset_s)
+
+    def _open(self, breaker: Breaker, reset_s: float) -> None:
+        breaker.opened_at = self._clock()
+        breaker.reset_s = reset_s
+        breaker.trips += 1
+        self._set(breaker, BreakerState.OPEN)
+        task = self._probes.get(breaker.upstream)
+        if self._probe is not None and (task is None or task.done()):
+            self._probes[breaker.upstream] = asyncio.create_task(self._probe_loop(breaker))
+
+    def _close(self, breaker: Breaker) -> None:
+        breaker.failures = 0
+        breaker.reset_s = 0.0
+        self._set(breaker, BreakerState.CLOSED)
+
+    async def _probe_loop(self, breaker: Breaker) -> None:
+        assert self._probe is not None
+        while breaker.state is not BreakerState.CLOSED:
+            await asyncio.sleep(max(0.0, breaker.opened_at + breaker.reset_s - self._clock()))
+            self._set(breaker, BreakerState.HALF_OPEN)
+            try:
+                healthy = await self._probe(breaker.probe_url)
+            except Exception:
+                healthy = False
+            if healthy:
+                self._close(breaker)
+            else:
+                breaker.opened_at = self._clock()
+                breaker.reset_s = min(breaker.reset_s * 2, self.max_reset_s)
+                self._set(breaker, BreakerState.OPEN)
+
+    async def aclose(self) -> None:
+        for task in self._probes.values():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._probes.clear()
@@ -15,15 +15,20 @@ from __future__ import annotations
 import asyncio
 import threading
 from functools import cached_property
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from .circuit import CircuitBreakers
 from .config import AvantisConfig
 from .execution import ExecutionEngine
+from .ratelimit import RateLimiter
 from .signing import BaseSigner, LocalSigner
-from .transport import HttpTransport
+from .transport import Hedging, HttpTransport
 from .txbuilder import TxBuilderClient
 from .types import ExecutionMode
 
+if TYPE_CHECKING:
+    from .execution.order_grid import OrderGrid
+
 
 class AsyncAvantis:
     """Async-first Avantis v2 client."""
@@ -34,25 +39,39 @@ class AsyncAvantis:
             signer = LocalSigner(self.config.private_key)
         self.signer = signer
 
-        self.transport = HttpTransport(timeout_s=self.config.timeout_s)
+        self.transport = HttpTransport(
+            timeout_s=self.config.timeout_s,
+            hedging=Hedging() if self.config.hedge_reads else None,
+            limiter=(
+                RateLimiter(self.config.service_urls(), self.config.rate_limits)
+                if self.config.rate_limits
+                else None
+            ),
+            breakers=(
+                CircuitBreakers(self.config.service_urls())
+                if self.config.circuit_breakers
+                else None
+            ),
+        )
         self.txb = TxBuilderClient(self.transport, self.config.tx_builder_url)
         self.engine = ExecutionEngine(self.config, self.signer, self.transport, self.txb)
 
-        self._meta: dict[str, Any] | None = None
-        self._meta_lock = asyncio.Lock()
-
     # ------------------------------------------------------------------ bootstrap
 
     async def meta(self) -> dict[str, Any]:
-        """Cached /v2/meta bootstrap (addresses, domains, enums, units, defaults)."""
-        if self._meta is None:
-            async with self._meta_lock:
-                if self._meta is None:
-                    self._meta = await self.txb.meta()
-        return self._meta
+        """Cached /v2/meta bootstrap (addresses, domains, enums, units,
+        defaults); the same cache the execution engine signs from."""
+        return await self.engine.meta()
 
     async def chain_id(self) -> int:
-        return int((await self.meta())["chainId"])
+        return await self.engine.chain_id()
+
+    def start_refresh(self) -> None:
+        """Keep /v2/meta, the markets snapshot, open interests and
+        orderbook snapshots refreshed in the background (stopped by
+        :meth:`aclose`)."""
+        self.engine.meta_cache.start()
+        self.markets.start_refresh()
 
     # ------------------------------------------------------------------ namespaces
 
@@ -142,9 +161,22 @@ class AsyncAvantis:
 
         return LocalIntentBuilder.from_meta(await self.meta())
 
+    async def order_grid(self, **kwargs: Any) -> OrderGrid:
+        """Pre-signed order grid for this trader (see
+        execution/order_grid.py); kwargs go to ``OrderGrid``."""
+        from .execution.order_grid import OrderGrid
+
+        return OrderGrid(
+            await self.local_intents(), self.engine, trader=self.trade.trader, **kwargs
+        )
+
     # ------------------------------------------------------------------ lifecycle
 
     async def aclose(self) -> None:
+        if "markets" in self.__dict__:
+            await self.markets.stop_refresh()
+        if "trade" in self.__dict__ and self.trade._confirmations is not None:
+            await self.trade._confirmations.aclose()
         await self.engine.aclose()
         await self.transport.aclose()
 
@@ -204,6 +236,9 @@ class Avantis:
     def meta(self) -> dict[str, Any]:
         return self._run(self._async.meta())
 
+    def start_refresh(self) -> None:
+        self._loop.call_soon_threadsafe(self._async.start_refresh)
+
     def close(self) -> None:
         self._run(self._async.aclose())
         self._loop.call_soon_threadsafe(self._loop.stop)
@@ -4,6 +4,7 @@ All functions take human-unit numbers (USDC, plain prices, leverage as a
 multiplier, percentages as plain numbers where 1 = 1%).
 """
 
+from .constraints import ConstraintTable, OrderCandidate, validate_orders
 from .fees import (
     MakerTakerFee,
     maker_or_taker_fee_p,
@@ -12,7 +13,13 @@ from .fees import (
     skew_adjusted_open_fee,
 )
 from .liquidation import estimate_liquidation_price
-from .liquidity import available_liquidity, max_position_size
+from .liquidity import (
+    LiquiditySurface,
+    OiDelta,
+    available_liquidity,
+    liquidity_surface,
+    max_position_size,
+)
 from .pnl import (
     adjusted_max_gain_p,
     gross_pnl,
@@ -46,6 +53,9 @@ __all__ = [
     "MakerTakerFee",
     "available_liquidity",
     "max_position_size",
+    "liquidity_surface",
+    "LiquiditySurface",
+    "OiDelta",
     "tp_percent_to_price",
     "tp_price_to_percent",
     "sl_percent_to_price",
@@ -53,4 +63,7 @@ __all__ = [
     "pnl_order_min_sl",
     "validate_order",
     "OrderValidation",
+    "ConstraintTable",
+    "OrderCandidate",
+    "validate_orders",
 ]
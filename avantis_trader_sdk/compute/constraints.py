@@ -0,0 +1,171 @@
+"""Per-pair constraint table for batch pre-trade validation.
+
+``validate_order`` re-derives every limit (leverage envelope, headroom
+through the group info, Upside-adjusted max gain, ...) from the pydantic
+models on each call. :class:`ConstraintTable` flattens them once per
+snapshot into typed-array columns, one slot per pair, and
+:func:`validate_orders` checks a whole batch against the columns, producing
+exactly the errors ``validate_order`` would: both run the rules through
+``validation._check_order``.
+
+Rebuild the table when the snapshot changes (``table.data_version`` vs
+``snapshot.data_version``). Headroom is stored without the wallet-OI term,
+which is applied per order from ``OrderCandidate.wallet_oi``; market hours
+are evaluated at validation time (``PairInfo.market_open_at``).
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .liquidity import _headroom_ex_wallet
+from .pnl import adjusted_max_gain_p
+from .validation import OrderValidation, _check_order
+
+if TYPE_CHECKING:
+    from ..markets.models import PairInfo
+
+
+@dataclass
+class OrderCandidate:
+    """One prospective open for :func:`validate_orders` (same fields and
+    meaning as the ``validate_order`` keywords)."""
+
+    pair_index: int
+    collateral: float
+    leverage: float
+    is_long: bool
+    is_upside: bool | None = None
+    limit_price: float | None = None
+    market_price: float | None = None
+    take_profit_percent: float | None = None
+    stop_loss_percent: float | None = None
+    dynamic_spread_p: float | None = None
+    wallet_oi: float = 0.0
+    open_trades_on_pair: int = 0
+
+
+class ConstraintTable:
+    """Columnar per-pair limits from one ``TradingSnapshot``."""
+
+    def __init__(self, snapshot) -> None:
+        self.data_version = snapshot.data_version
+        self.max_trades_per_pair = snapshot.max_trades_per_pair
+        self.slots: dict[int, int] = {}
+        self.symbols: list[str] = []
+        self.pairs: list[PairInfo] = []  # per slot (market hours)
+        self.listed = array("b")
+        self.close_only = array("b")
+        self.is_upside = array("b")
+        self.min_leverage = array("d")
+        self.max_leverage = array("d")
+        self.pnl_min_leverage = array("d")
+        self.pnl_max_leverage = array("d")
+        self.min_position = array("d")
+        self.max_wallet_oi = array("d")
+        self.headroom_long = array("d")  # before the wallet-OI term
+        self.headroom_short = array("d")
+        self.max_gain_p = array("d")
+        self.upside_max_gain_p = array("d")  # net of the Upside profit share
+        self.max_sl_p = array("d")
+
+        for info, long, short in _headroom_ex_wallet(snapshot):
+            self.slots[info.index] = len(self.symbols)
+            self.symbols.append(info.symbol)
+            self.pairs.append(info)
+            self.listed.append(info.is_pair_listed)
+            self.close_only.append(info.additional_params.close_only_mode)
+            self.is_upside.append(info.is_upside)
+            lev = info.leverages
+            self.min_leverage.append(lev.min_leverage)
+            self.max_leverage.append(lev.max_leverage)
+            self.pnl_min_leverage.append(lev.pnl_min_leverage)
+            self.pnl_max_leverage.append(lev.pnl_max_leverage)
+            self.min_position.append(info.min_lev_pos_usdc)
+            self.max_wallet_oi.append(info.max_wallet_oi)
+            self.headroom_long.append(long)
+            self.headroom_short.append(short)
+            values = info.values
+            self.max_gain_p.append(values.max_gain_p)
+            self.upside_max_gain_p.append(
+                adjusted_max_gain_p(
+                    values.max_gain_p, info.pnl_fees.tier_p, info.pnl_fees.fees_p
+                )
+                if info.pnl_fees.tier_p
+                else values.max_gain_p
+            )
+            self.max_sl_p.append(values.max_sl_p)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def is_current(self, snapshot) -> bool:
+        return snapshot.data_version is not None and snapshot.data_version == self.data_version
+
+    def headroom(self, pair_index: int, *, is_long: bool, wallet_oi: float = 0.0) -> float:
+        """``max_position_size`` for one pair and side."""
+        slot = self.slots[pair_index]
+        side = self.headroom_long if is_long else self.headroom_short
+        return max(min(side[slot], max(self.max_wallet_oi[slot] - wallet_oi, 0)), 0)
+
+    def market_open(self, now: float | None = None) -> array:
+        """``PairInfo.is_market_open`` for every slot at ``now``."""
+        now = time.time() if now is None else now
+        return array("b", (info.market_open_at(now) for info in self.pairs))
+
+
+def validate_orders(
+    table: ConstraintTable,
+    orders: Sequence[OrderCandidate],
+    *,
+    now: float | None = None,
+) -> list[OrderValidation]:
+    """``validate_order`` for a whole batch against a :class:`ConstraintTable`.
+
+    Results keep input order. A candidate for a pair missing from the table
+    gets a single ``unknown pair index`` error.
+    """
+    market_open = table.market_open(now)
+    slots = table.slots
+    max_trades = table.max_trades_per_pair
+    results = []
+    for order in orders:
+        v = OrderValidation()
+        results.append(v)
+        slot = slots.get(order.pair_index)
+        if slot is None:
+            v.errors.append(f"unknown pair index {order.pair_index}")
+            continue
+        leverage = order.leverage
+        is_upside = bool(table.is_upside[slot]) if order.is_upside is None else order.is_upside
+        _check_order(
+            v.errors,
+            symbol=table.symbols[slot],
+            listed=bool(table.listed[slot]),
+            close_only=bool(table.close_only[slot]),
+            market_open=bool(market_open[slot]),
+            leverage=leverage,
+            min_leverage=(table.pnl_min_leverage if is_upside else table.min_leverage)[slot],
+            max_leverage=(table.pnl_max_leverage if is_upside else table.max_leverage)[slot],
+            position_size=order.collateral * leverage,
+            min_position=table.min_position[slot],
+            max_position=table.headroom(
+                order.pair_index, is_long=order.is_long, wallet_oi=order.wallet_oi
+            ),
+            max_trades=max_trades,
+            open_trades=order.open_trades_on_pair,
+            is_long=order.is_long,
+            is_upside=is_upside,
+            limit_price=order.limit_price,
+            market_price=order.market_price,
+            take_profit_percent=order.take_profit_percent,
+            max_tp_p=(table.upside_max_gain_p if is_upside else table.max_gain_p)[slot],
+            stop_loss_percent=order.stop_loss_percent,
+            max_sl_p=table.max_sl_p[slot],
+            dynamic_spread_p=order.dynamic_spread_p,
+        )
+    return results
@@ -1,11 +1,20 @@
 """Open-interest headroom / max position size.
 
 Mirrors avantis-ui-v2 lib/trade.ts ``availableLiquidity``.
+:func:`liquidity_surface` evaluates the same constraints for every pair at
+once (typed-array columns), optionally after local OI deltas such as our
+own pending orders.
 """
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..markets.models import PairInfo
 
 
 @dataclass
@@ -82,3 +91,105 @@ def max_position_size(pair_info, snapshot, *, is_long: bool, wallet_oi: float =
         liquidity_sell=pair_info.liquidity.get("sell", float("inf")),
     )
     return liq.long if is_long else liq.short
+
+
+@dataclass
+class OiDelta:
+    """A local OI change not yet in the snapshot (e.g. one of our pending
+    orders): ``size_usdc`` notional added on ``pair_index``'s side. Negative
+    sizes release OI (a pending close)."""
+
+    pair_index: int
+    is_long: bool
+    size_usdc: float
+
+
+def _headroom_ex_wallet(
+    snapshot, pending: Iterable[OiDelta] = ()
+) -> Iterator[tuple[PairInfo, float, float]]:
+    """``(pair_info, long, short)`` headroom of every pair before the wallet
+    term, with ``pending`` applied to pair, group and total OI."""
+    infos = snapshot.pairs
+    pair_delta: dict[int, list[float]] = {}
+    group_delta: dict[str, float] = {}
+    total_delta = 0.0
+    for delta in pending:
+        info = infos.get(delta.pair_index)
+        if info is None:
+            raise ValueError(f"unknown pair index {delta.pair_index}")
+        sides = pair_delta.setdefault(delta.pair_index, [0.0, 0.0])
+        sides[0 if delta.is_long else 1] += delta.size_usdc
+        key = str(info.group_index)
+        group_delta[key] = group_delta.get(key, 0.0) + delta.size_usdc
+        total_delta += delta.size_usdc
+
+    max_open_left = max(snapshot.max_open_interest - (snapshot.total_oi + total_delta), 0)
+    for info in snapshot.pair_infos.values():
+        key = str(info.group_index)
+        group = snapshot.group_info.get(key)
+        group_max = getattr(group, "group_max_oi", 0.0) or 0.0
+        group_oi = (getattr(group, "group_oi", 0.0) or 0.0) + group_delta.get(key, 0.0)
+        values = info.values
+        group_share = group_max * values.group_open_interest_percentage_p / 100
+        long_oi, short_oi = info.open_interest.long, info.open_interest.short
+        if info.index in pair_delta:
+            long_oi += pair_delta[info.index][0]
+            short_oi += pair_delta[info.index][1]
+        pair_left = max(info.pair_max_oi - long_oi - short_oi, 0)
+        shared = min(max_open_left, max(group_max - group_oi, 0))
+        yield (
+            info,
+            min(
+                shared,
+                min(pair_left, max(group_share * (values.max_long_oi_p / 100) - long_oi, 0)),
+                info.liquidity.get("buy", float("inf")),
+            ),
+            min(
+                shared,
+                min(pair_left, max(group_share * (values.max_short_oi_p / 100) - short_oi, 0)),
+                info.liquidity.get("sell", float("inf")),
+            ),
+        )
+
+
+class LiquiditySurface:
+    """Long/short headroom (USDC) of every pair, one column slot per pair."""
+
+    def __init__(self) -> None:
+        self.slots: dict[int, int] = {}
+        self.pair_indexes = array("q")
+        self.long = array("d")
+        self.short = array("d")
+
+    def __len__(self) -> int:
+        return len(self.pair_indexes)
+
+    def __getitem__(self, pair_index: int) -> Liquidity:
+        slot = self.slots[pair_index]
+        return Liquidity(long=self.long[slot], short=self.short[slot])
+
+    def headroom(self, pair_index: int, *, is_long: bool) -> float:
+        slot = self.slots[pair_index]
+        return (self.long if is_long else self.short)[slot]
+
+
+def liquidity_surface(
+    snapshot, *, wallet_oi: float = 0.0, pending: Iterable[OiDelta] = ()
+) -> LiquiditySurface:
+    """:func:`available_liquidity` for every pair and both sides in one pass.
+
+    ``pending`` deltas (our own unfilled orders, fills not yet in the
+    snapshot) are applied to the pair, group and protocol OI before the
+    constraints are evaluated, and count toward ``wallet_oi``; without
+    them ``surface[pair].long`` equals ``max_position_size(..., is_long=True)``.
+    """
+    pending = list(pending)
+    wallet_oi += sum(delta.size_usdc for delta in pending)
+    surface = LiquiditySurface()
+    for info, long, short in _headroom_ex_wallet(snapshot, pending):
+        wallet_left = max(info.max_wallet_oi - wallet_oi, 0)
+        surface.slots[info.index] = len(surface.pair_indexes)
+        surface.pair_indexes.append(info.index)
+        surface.long.append(max(min(long, wallet_left), 0))
+        surface.short.append(max(min(short, wallet_left), 0))
+    return surface
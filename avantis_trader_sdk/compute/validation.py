@@ -54,85 +54,130 @@ def validate_order(
     v = OrderValidation()
     if is_upside is None:
         is_upside = bool(getattr(pair_info, "is_upside", False))
-    position_size = collateral * leverage
+    lev = pair_info.leverages
+    max_tp = pair_info.values.max_gain_p
+    if take_profit_percent is not None and is_upside and pair_info.pnl_fees.tier_p:
+        from .pnl import adjusted_max_gain_p
+
+        max_tp = adjusted_max_gain_p(max_tp, pair_info.pnl_fees.tier_p, pair_info.pnl_fees.fees_p)
+    _check_order(
+        v.errors,
+        symbol=pair_info.symbol,
+        listed=pair_info.is_pair_listed,
+        close_only=pair_info.additional_params.close_only_mode,
+        market_open=pair_info.is_market_open,
+        leverage=leverage,
+        min_leverage=lev.pnl_min_leverage if is_upside else lev.min_leverage,
+        max_leverage=lev.pnl_max_leverage if is_upside else lev.max_leverage,
+        position_size=collateral * leverage,
+        min_position=pair_info.min_lev_pos_usdc,
+        max_position=max_position_size(
+            pair_info, snapshot, is_long=is_long, wallet_oi=wallet_oi
+        ),
+        max_trades=snapshot.max_trades_per_pair,
+        open_trades=open_trades_on_pair,
+        is_long=is_long,
+        is_upside=is_upside,
+        limit_price=limit_price,
+        market_price=market_price,
+        take_profit_percent=take_profit_percent,
+        max_tp_p=max_tp,
+        stop_loss_percent=stop_loss_percent,
+        max_sl_p=pair_info.values.max_sl_p,
+        dynamic_spread_p=dynamic_spread_p,
+    )
+    return v
+
 
+def _check_order(
+    errors: list[str],
+    *,
+    symbol: str,
+    listed: bool,
+    close_only: bool,
+    market_open: bool,
+    leverage: float,
+    min_leverage: float,
+    max_leverage: float,
+    position_size: float,
+    min_position: float,
+    max_position: float,
+    max_trades: int,
+    open_trades: int,
+    is_long: bool,
+    is_upside: bool,
+    limit_price: float | None,
+    market_price: float | None,
+    take_profit_percent: float | None,
+    max_tp_p: float,
+    stop_loss_percent: float | None,
+    max_sl_p: float,
+    dynamic_spread_p: float | None,
+) -> None:
+    """The validation rules on already-resolved limits, appending to
+    ``errors``; shared by :func:`validate_order` and the batch
+    ``compute.validate_orders`` so both report the same rules and text."""
     # pair state
-    if not pair_info.is_pair_listed:
-        v.errors.append(f"{pair_info.symbol} is delisted")
-    if pair_info.additional_params.close_only_mode:
-        v.errors.append(f"{pair_info.symbol} is in close-only mode")
-    if not pair_info.is_market_open:
-        v.errors.append(f"{pair_info.symbol} market is closed")
+    if not listed:
+        errors.append(f"{symbol} is delisted")
+    if close_only:
+        errors.append(f"{symbol} is in close-only mode")
+    if not market_open:
+        errors.append(f"{symbol} market is closed")
 
     # leverage envelope
-    lev = pair_info.leverages
-    min_lev = lev.pnl_min_leverage if is_upside else lev.min_leverage
-    max_lev = lev.pnl_max_leverage if is_upside else lev.max_leverage
-    if leverage < min_lev or leverage > max_lev:
-        v.errors.append(f"leverage {leverage}x outside [{min_lev}, {max_lev}]")
+    if leverage < min_leverage or leverage > max_leverage:
+        errors.append(f"leverage {leverage}x outside [{min_leverage}, {max_leverage}]")
 
     # size limits
-    if position_size < pair_info.min_lev_pos_usdc:
-        v.errors.append(
-            f"position {position_size:.2f} USDC below minimum {pair_info.min_lev_pos_usdc}"
+    if position_size < min_position:
+        errors.append(f"position {position_size:.2f} USDC below minimum {min_position}")
+    if position_size > max_position:
+        errors.append(
+            f"position {position_size:.2f} USDC exceeds available headroom {max_position:.2f}"
         )
-    max_pos = max_position_size(pair_info, snapshot, is_long=is_long, wallet_oi=wallet_oi)
-    if position_size > max_pos:
-        v.errors.append(f"position {position_size:.2f} USDC exceeds available headroom {max_pos:.2f}")
 
     # trades per pair
-    if snapshot.max_trades_per_pair and open_trades_on_pair >= snapshot.max_trades_per_pair:
-        v.errors.append(f"max {snapshot.max_trades_per_pair} trades per pair reached")
+    if max_trades and open_trades >= max_trades:
+        errors.append(f"max {max_trades} trades per pair reached")
 
     # limit price direction
     if limit_price is not None and market_price is not None:
         if is_long and limit_price >= market_price:
-            v.errors.append("limit price must be below market for longs")
+            errors.append("limit price must be below market for longs")
         if not is_long and limit_price <= market_price:
-            v.errors.append("limit price must be above market for shorts")
+            errors.append("limit price must be above market for shorts")
 
     # TP bounds
-    if take_profit_percent is not None:
-        max_tp = pair_info.values.max_gain_p
-        if is_upside and pair_info.pnl_fees.tier_p:
-            from .pnl import adjusted_max_gain_p
-
-            max_tp = adjusted_max_gain_p(
-                max_tp, pair_info.pnl_fees.tier_p, pair_info.pnl_fees.fees_p
-            )
-        if take_profit_percent > max_tp:
-            v.errors.append(f"take profit {take_profit_percent}% above max {max_tp:.0f}%")
+    if take_profit_percent is not None and take_profit_percent > max_tp_p:
+        errors.append(f"take profit {take_profit_percent}% above max {max_tp_p:.0f}%")
 
     # SL bounds
     if stop_loss_percent is not None:
-        if stop_loss_percent > pair_info.values.max_sl_p:
-            v.errors.append(
-                f"stop loss {stop_loss_percent}% above max {pair_info.values.max_sl_p}%"
-            )
+        if stop_loss_percent > max_sl_p:
+            errors.append(f"stop loss {stop_loss_percent}% above max {max_sl_p}%")
         # UI rule: slPLimit = (priceImpactBenefit + SL_BUFFER_SPREAD) * leverage,
         # spread and buffer both in plain percent units; Upside floors at
         # max(slPLimit, MIN_UPSIDE_SL_P) and the pnlOrderMinSL curve.
         sl_limit = (
-            ((dynamic_spread_p or 0.0) + SL_BUFFER_SPREAD_P) * leverage
+            (dynamic_spread_p + SL_BUFFER_SPREAD_P) * leverage
             if dynamic_spread_p is not None
             else 0.0
         )
         if is_upside:
             min_sl = max(sl_limit, MIN_UPSIDE_SL_P, pnl_order_min_sl(leverage))
             if stop_loss_percent < min_sl:
-                v.errors.append(f"Upside stop loss must be >= {min_sl:.2f}%")
+                errors.append(f"Upside stop loss must be >= {min_sl:.2f}%")
         elif dynamic_spread_p is not None and stop_loss_percent < sl_limit:
-            v.errors.append(
+            errors.append(
                 f"stop loss can't be less than {sl_limit:.2f}% to guarantee execution"
             )
 
     # spread sanity
     if dynamic_spread_p is not None:
         if dynamic_spread_p / 2 > SPREAD_ERROR_THRESHOLD_P:
-            v.errors.append(f"spread too high ({dynamic_spread_p:.3f}%)")
+            errors.append(f"spread too high ({dynamic_spread_p:.3f}%)")
         elif dynamic_spread_p * leverage >= SPREAD_LOSS_THRESHOLD_P:
-            v.errors.append(
+            errors.append(
                 f"spread x leverage = {dynamic_spread_p * leverage:.1f}% >= {SPREAD_LOSS_THRESHOLD_P}%"
             )
-
-    return v
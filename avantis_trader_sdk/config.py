@@ -133,6 +133,10 @@ class AvantisConfig:
     # with the trader EOA directly (delegate/API keys are fresh EOAs and
     # need no RPC at all).
     rpc_url: str | None = None
+    # More Base RPCs. Reads go to the fastest healthy endpoint of rpc_url +
+    # rpc_urls, broadcasts to all of them (AVANTIS_RPC_URL may also list
+    # several, comma-separated).
+    rpc_urls: list[str] = field(default_factory=list)
 
     # service endpoints
     network: str = "mainnet"
@@ -159,11 +163,26 @@ class AvantisConfig:
     # the backend budgets 2M for the same call class), and the blitz relayer
     # caps relays at 3M.
     default_gas_limit: int = 2_000_000
+    # Processes relaying for the same account each take a distinct worker id
+    # out of 2**exec_nonce_worker_bits; it fills the top bits of every
+    # ERC-7821 nonce key (ExecNonceAllocator), so their keys never collide.
+    exec_nonce_worker_id: int = 0
+    exec_nonce_worker_bits: int = 0
 
     # behavior
     timeout_s: float = 30.0
     relay_poll_interval_s: float = 1.0
     relay_poll_timeout_s: float = 60.0
+    # Hedge the latency-critical idempotent GETs (trading snapshot, user-data,
+    # last prices, batched-market status) past their p95; see Hedging.
+    hedge_reads: bool = False
+    # Client-side requests/second per upstream service (ratelimit.SERVICES),
+    # e.g. {"core": 10, "data": 5}; orders queue ahead of reads. Empty: off.
+    rate_limits: dict[str, float] = field(default_factory=dict)
+    # Fail fast (CircuitOpenError) on an upstream after repeated transport
+    # errors / 502-504, probing it in the background until it recovers.
+    # Opt-in: callers must then handle CircuitOpenError.
+    circuit_breakers: bool = False
 
     extra: dict = field(default_factory=dict)
 
@@ -189,6 +208,15 @@ class AvantisConfig:
         cfg.private_key = os.getenv("AVANTIS_PRIVATE_KEY") or None
         cfg.trader_address = os.getenv("AVANTIS_TRADER_ADDRESS") or None
         cfg.rpc_url = os.getenv("AVANTIS_RPC_URL") or None
+        for attr, env in (
+            ("exec_nonce_worker_id", "AVANTIS_EXEC_NONCE_WORKER_ID"),
+            ("exec_nonce_worker_bits", "AVANTIS_EXEC_NONCE_WORKER_BITS"),
+        ):
+            if os.getenv(env):
+                try:
+                    setattr(cfg, attr, int(os.environ[env]))
+                except ValueError as exc:
+                    raise ConfigError(f"{env} must be an integer") from exc
         exec_env = os.getenv("AVANTIS_EXECUTION")
         if exec_env:
             cfg.execution = ExecutionMode(exec_env.lower())
@@ -212,6 +240,26 @@ class AvantisConfig:
                 setattr(cfg, attr, f"{base}{prefix}")
         return cfg
 
+    def service_urls(self) -> dict[str, str]:
+        """Base URL -> service name (rate limiter and circuit breakers)."""
+        return {
+            self.tx_builder_url: "tx-builder",
+            self.core_api_url: "core",
+            self.batched_market_url: "batched-market",
+            self.relayer_url: "blitz",
+            self.feed_url: "feed",
+            self.risk_v2_api_url: "risk-v2",
+            self.data_api_url: "data",
+            self.twap_api_url: "twap",
+            self.history_api_url: "history",
+        }
+
+    @property
+    def rpc_endpoints(self) -> list[str]:
+        """Every configured RPC URL, ``rpc_url`` first, deduplicated."""
+        urls = [u.strip() for u in (self.rpc_url or "").split(",")] + list(self.rpc_urls)
+        return list(dict.fromkeys(u for u in urls if u))
+
     def validate_for_signing(self) -> None:
         if not self.private_key:
             raise ConfigError(
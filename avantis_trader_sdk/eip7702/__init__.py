@@ -1,3 +1,3 @@
-from .account import Call, GelatoDelegationEncoder, encode_nonce
+from .account import Call, ExecNonceAllocator, GelatoDelegationEncoder, encode_nonce
 
-__all__ = ["Call", "GelatoDelegationEncoder", "encode_nonce"]
+__all__ = ["Call", "ExecNonceAllocator", "GelatoDelegationEncoder", "encode_nonce"]
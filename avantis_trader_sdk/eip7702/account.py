@@ -17,13 +17,16 @@ Replicates ``@gelatocloud/gasless`` ``toGelatoSmartAccount().encodeCallData``
 
 from __future__ import annotations
 
+import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
 from eth_abi import encode as abi_encode
 from eth_utils import keccak, to_bytes, to_checksum_address
 
+from ..errors import ConfigError
 from ..signing.base import BaseSigner
 
 # ERC-7821: callType=0x01 (batch), execType=0x00, selector=0x78210001 (op-data mode)
@@ -67,6 +70,69 @@ def fresh_nonce(salt: int = 0) -> int:
     return encode_nonce(int(time.time() * 1000) * 1000 + salt, 0)
 
 
+class ExecNonceAllocator:
+    """Collision-free ERC-7821 execution nonces for one signing key.
+
+    :meth:`next` hands out a fresh 192-bit key (sequence 0) per call. Keys
+    follow the :func:`fresh_nonce` convention (microseconds since the epoch)
+    but are taken from a per-process counter that never repeats: each key is
+    ``max(previous + 1, now_us)``, so any number of relays in the same
+    microsecond get distinct keys, and a restarted process resumes above
+    the wall clock. Sustained rates beyond 1M/s simply run the counter
+    ahead of the clock.
+
+    Across processes sharing a key, give each a ``worker_id`` out of
+    ``2**worker_bits``: the top ``worker_bits`` of every key carry the id.
+
+    :meth:`next_sequential` is the ordered alternative: it reuses one key
+    and increments its 64-bit sequence, which the account only accepts in
+    order (use :meth:`sync` to realign after a dropped relay).
+
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        *,
+        worker_id: int = 0,
+        worker_bits: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if not 0 <= worker_bits <= 64 or not 0 <= worker_id < 2**worker_bits:
+            raise ConfigError("worker_id must fit in worker_bits (at most 64 bits)")
+        self._counter_bits = 192 - worker_bits
+        self._prefix = worker_id << self._counter_bits
+        self._clock = clock
+        self._last = 0
+        self._seqs: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def next(self) -> int:
+        """A nonce on a never-used key (sequence 0)."""
+        now_us = int(self._clock() * 1_000_000)
+        with self._lock:
+            self._last = max(self._last + 1, now_us)
+            counter = self._last
+        if counter >> self._counter_bits:
+            raise ConfigError("execution nonce key space exhausted for this worker_bits")
+        return encode_nonce(self._prefix | counter, 0)
+
+    def next_sequential(self, key: int) -> int:
+        """The next nonce on ``key`` (sequence 0, 1, 2, ... per key)."""
+        if not 0 <= key < 2**192:
+            raise ConfigError("ERC-7821 nonce key must fit in 192 bits")
+        with self._lock:
+            seq = self._seqs.get(key, 0)
+            self._seqs[key] = seq + 1
+        return encode_nonce(key, seq)
+
+    def sync(self, key: int, seq: int) -> None:
+        """Set the next sequence :meth:`next_sequential` hands out for ``key``
+        (e.g. the account's on-chain ``getNonce(key)``)."""
+        with self._lock:
+            self._seqs[key] = seq
+
+
 @dataclass
 class Call:
     to: str
@@ -89,6 +155,7 @@ class GelatoDelegationEncoder:
     chain_id: int
     delegation_address: str
     builder_code: str | None = None  # optional 0x-hex calldata suffix
+    exec_nonces: ExecNonceAllocator = field(default_factory=ExecNonceAllocator, repr=False)
     _auth_cache: dict[int, dict[str, Any]] = field(default_factory=dict, repr=False)
 
     # -- core encoding --------------------------------------------------------
@@ -115,7 +182,7 @@ class GelatoDelegationEncoder:
 
     def encode_call_data(self, calls: list[Call], nonce: int | None = None) -> bytes:
         """Full ``execute(mode, executionData)`` calldata with signed opData."""
-        nonce = fresh_nonce() if nonce is None else nonce
+        nonce = self.exec_nonces.next() if nonce is None else nonce
         signature = self.sign_execute(calls, nonce)
         nonce_key = nonce >> 64
         op_data = nonce_key.to_bytes(24, "big") + signature  # abi.encodePacked(uint192, bytes)
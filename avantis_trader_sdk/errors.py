@@ -64,6 +64,21 @@ class UpstreamError(ApiError):
     """502 UPSTREAM_ERROR / RPC_ERROR from the API side."""
 
 
+class CircuitOpenError(ApiError):
+    """An upstream's circuit breaker is open: failing fast without a request.
+
+    ``upstream`` names the service (or host); ``retry_in_s`` is the time
+    until the next recovery probe.
+    """
+
+    def __init__(
+        self, message: str, *, upstream: str, retry_in_s: float, url: str | None = None
+    ) -> None:
+        super().__init__(message, code="CIRCUIT_OPEN", url=url)
+        self.upstream = upstream
+        self.retry_in_s = retry_in_s
+
+
 class SigningError(AvantisError):
     """Local signing failure."""
 
@@ -5,13 +5,20 @@ from .batched_market import (
     BatchedMarketOutcome,
 )
 from .engine import ExecutionEngine
+from .lanes import Lane, LaneScheduler
+from .order_grid import GridOrder, OrderGrid
 from .relayer import RelayerClient
-from .rpc import JsonRpcClient
+from .rpc import JsonRpcClient, RpcEndpoint
 
 __all__ = [
     "ExecutionEngine",
+    "GridOrder",
+    "Lane",
+    "LaneScheduler",
+    "OrderGrid",
     "RelayerClient",
     "JsonRpcClient",
+    "RpcEndpoint",
     "BatchedMarketClient",
     "BatchedMarketEvent",
     "BatchedMarketEventHook",
@@ -269,7 +269,10 @@ class BatchedMarketClient:
         """Replay the persisted lifecycle events for a trackingId."""
         params = {"afterSeq": after_seq} if after_seq is not None else None
         data = await self._t.json(
-            "GET", f"{self._base}/tracking-id/{tracking_id}/status", params=params
+            "GET",
+            f"{self._base}/tracking-id/{tracking_id}/status",
+            params=params,
+            hedge="batched-market-status",
         )
         return [
             BatchedMarketEvent(
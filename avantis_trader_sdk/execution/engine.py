@@ -20,12 +20,13 @@ are signed intents submitted to the core API price-triggers endpoint (see
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Sequence
 from typing import Any
 
 from ..config import AvantisConfig
-from ..eip7702 import Call, GelatoDelegationEncoder
-from ..eip7702.account import fresh_nonce
+from ..eip7702 import Call, ExecNonceAllocator, GelatoDelegationEncoder
 from ..errors import ConfigError, RelayError
+from ..refresh import Refreshing
 from ..signing import BaseSigner, sign_intent
 from ..transport import HttpTransport
 from ..txbuilder import TxBuilderClient
@@ -39,6 +40,7 @@ from ..types import (
     IntentPayload,
 )
 from .batched_market import BatchedMarketClient, BatchedMarketEventHook
+from .lanes import LaneScheduler
 from .relayer import RelayerClient
 from .rpc import JsonRpcClient
 
@@ -68,11 +70,16 @@ class ExecutionEngine:
             timeout_s=config.relay_poll_timeout_s,
         )
         self.rpc: JsonRpcClient | None = (
-            JsonRpcClient(config.rpc_url, config.timeout_s) if config.rpc_url else None
+            JsonRpcClient(config.rpc_endpoints, config.timeout_s)
+            if config.rpc_endpoints
+            else None
         )
-        self._chain_id: int | None = None
-        self._trading_router: str | None = None
+        # The one /v2/meta cache (AsyncAvantis.meta() reads it too). The
+        # catalog rarely changes, so once loaded it is never waited on again:
+        # a stale copy is served while a background fetch replaces it.
+        self.meta_cache: Refreshing[dict[str, Any]] = Refreshing(txbuilder.meta, ttl_s=300.0)
         self._encoder: GelatoDelegationEncoder | None = None
+        self.lanes: LaneScheduler | None = None
 
     # ------------------------------------------------------------------ utils
 
@@ -81,19 +88,16 @@ class ExecutionEngine:
             raise ConfigError("This operation requires a signing key (AVANTIS_PRIVATE_KEY).")
         return self.signer
 
+    async def meta(self) -> dict[str, Any]:
+        """Cached /v2/meta bootstrap (addresses, domains, enums, units, defaults)."""
+        return await self.meta_cache.get()
+
     async def chain_id(self) -> int:
         """Chain id from /v2/meta (cached; never hard-coded)."""
-        if self._chain_id is None:
-            meta = await self.txb.meta()
-            self._chain_id = int(meta["chainId"])
-            self._trading_router = meta["addresses"]["tradingRouter"]
-        return self._chain_id
+        return int((await self.meta())["chainId"])
 
     async def trading_router(self) -> str:
-        if self._trading_router is None:
-            await self.chain_id()
-        assert self._trading_router is not None
-        return self._trading_router
+        return (await self.meta())["addresses"]["tradingRouter"]
 
     async def encoder(self) -> GelatoDelegationEncoder:
         if self._encoder is None:
@@ -102,6 +106,10 @@ class ExecutionEngine:
                 chain_id=await self.chain_id(),
                 delegation_address=self.config.delegation_address,
                 builder_code=self.config.builder_code,
+                exec_nonces=ExecNonceAllocator(
+                    worker_id=self.config.exec_nonce_worker_id,
+                    worker_bits=self.config.exec_nonce_worker_bits,
+                ),
             )
         return self._encoder
 
@@ -149,7 +157,7 @@ class ExecutionEngine:
         account_nonce = await self._authorization_nonce(signer.address)
         # Encode once with a pinned exec nonce, estimate gas on those exact
         # bytes, and reuse the same nonce in the final payload.
-        exec_nonce = fresh_nonce()
+        exec_nonce = encoder.exec_nonces.next()
         data = encoder.encode_call_data(calls, exec_nonce)
         gas = await self._estimate_gas_or_default(signer.address, "0x" + data.hex())
         # The UI attaches the authorization on every tx (idempotent once the
@@ -168,6 +176,7 @@ class ExecutionEngine:
         calldata: CallData | None = None,
         wait: bool = True,
         on_event: BatchedMarketEventHook | None = None,
+        signature: str | None = None,
     ) -> ExecutionReceipt:
         """Sign a market intent and execute it through the batched-market API.
 
@@ -184,6 +193,9 @@ class ExecutionEngine:
         diagnostics, the terminal, even when it raises) while the SDK settles
         the outcome; see
         :data:`~avantis_trader_sdk.execution.batched_market.BatchedMarketEventHook`.
+
+        ``signature`` takes a signature already made over ``payload`` by the
+        configured signer (bulk paths sign every intent before submitting).
         """
         signer = self._require_signer()
         if (
@@ -196,7 +208,8 @@ class ExecutionEngine:
                 "intents); TP/SL through trade.update_tp_sl / trade.partial_tp_sl "
                 "(core-API price-triggers)."
             )
-        signed = sign_intent(payload, signer)
+        if signature is None:
+            signature = sign_intent(payload, signer).signature
 
         eip7702: dict[str, Any] | None = None
         if calldata is not None:
@@ -207,7 +220,7 @@ class ExecutionEngine:
             int(order_type),
             {
                 "userIntent": payload.encoded_intent,
-                "userSignature": signed.signature,
+                "userSignature": signature,
             },
             eip7702,
             wait=wait,
@@ -244,8 +257,41 @@ class ExecutionEngine:
 
     # -------------------------------------------------------------- direct
 
-    async def submit_direct(self, calldata: CallData, *, wait: bool = True) -> ExecutionReceipt:
-        """Sign the calldata as a normal type-2 tx; broadcast via RPC or tx-builder relay."""
+    def use_lanes(self, signers: Sequence[BaseSigner], **kwargs: Any) -> LaneScheduler:
+        """Send direct-mode transactions from a pool of delegate EOAs instead
+        of the configured signer alone (see :class:`~.lanes.LaneScheduler`;
+        ``kwargs`` go to its constructor). Every lane key must be a registered
+        delegate of the trader with ETH for gas.
+
+        The configured key must itself be a delegate (``trader_address`` set
+        to another address): only then does the tx-builder wrap calldata in
+        ``delegatedAction``, which any lane may send. Calls that must come
+        from the caller's own address still go out from the configured key.
+        """
+        if self.rpc is None:
+            raise ConfigError("Direct-mode lanes need AVANTIS_RPC_URL for nonces and receipts.")
+        signer = self._require_signer()
+        trader = self.config.trader_address
+        if not trader or trader.lower() == signer.address.lower():
+            raise ConfigError(
+                "Direct-mode lanes send delegatedAction calldata, which is only built "
+                "for a delegate key: sign with a delegate and set AVANTIS_TRADER_ADDRESS "
+                "to the trader."
+            )
+        self.lanes = LaneScheduler(self.rpc, signers, **kwargs)
+        return self.lanes
+
+    async def submit_direct(
+        self, calldata: CallData, *, wait: bool = True, lane: bool = True
+    ) -> ExecutionReceipt:
+        """Sign the calldata as a normal type-2 tx; broadcast via RPC or tx-builder relay.
+
+        With :meth:`use_lanes` the transaction goes out from the least-loaded
+        lane EOA instead of the configured signer; ``lane=False`` keeps it on
+        the configured signer (calls whose ``msg.sender`` must be the caller).
+        """
+        if self.lanes is not None and lane:
+            return await self._submit_on_lane(self.lanes, calldata, wait=wait)
         signer = self._require_signer()
         if self.rpc is not None:
             nonce = await self.rpc.get_transaction_count(signer.address)
@@ -280,6 +326,31 @@ class ExecutionEngine:
             "Alternatively use execution='relayer' (gasless, no RPC required)."
         )
 
+    async def _submit_on_lane(
+        self, lanes: LaneScheduler, calldata: CallData, *, wait: bool
+    ) -> ExecutionReceipt:
+        assert self.rpc is not None
+        gas = await self._estimate_gas_or_default(calldata.to, calldata.data, calldata.value_wei)
+        max_fee, priority = await self.rpc.gas_fees()
+        _lane, tx_hash = await lanes.send(
+            {
+                "chainId": await self.chain_id(),
+                "to": calldata.to,
+                "data": calldata.data,
+                "value": calldata.value_wei,
+                "gas": gas,
+                "maxFeePerGas": max_fee,
+                "maxPriorityFeePerGas": priority,
+            }
+        )
+        receipt = ExecutionReceipt(route="rpc", tx_hash=tx_hash, description=calldata.description)
+        if wait:
+            try:
+                receipt.raw = await self.rpc.wait_for_receipt(tx_hash)
+            finally:
+                lanes.settle(tx_hash)
+        return receipt
+
     async def submit_via_txbuilder_relay(
         self, raw_transaction: str, *, wait: bool = True
     ) -> ExecutionReceipt:
@@ -305,6 +376,7 @@ class ExecutionEngine:
         return self.config.execution is ExecutionMode.RELAYER
 
     async def aclose(self) -> None:
+        await self.meta_cache.stop()
         if self.rpc is not None:
             await self.rpc.aclose()
 
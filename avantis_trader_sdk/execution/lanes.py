@@ -0,0 +1,169 @@
+"""Direct-mode submission lanes: several delegate EOAs broadcasting in parallel.
+
+A direct-mode transaction is ordered by its sender's account nonce, so every
+order from one key queues behind that key's oldest unmined transaction. A
+:class:`LaneScheduler` spreads orders over a pool of signer EOAs (the
+*lanes*), each registered as a delegate of the trader. The configured key
+must be a delegate too, so the tx-builder wraps the calldata in
+``delegatedAction``, which only names the trader: any enabled delegate can
+send it. Calls that must come from the caller's own address (approvals,
+referral and LP actions) bypass the lanes.
+
+Each lane tracks its next nonce locally (read once from the RPC, then
+incremented per broadcast; re-read after a failed send) and its unmined
+transactions. New orders go to the lane with the fewest pending
+transactions. A lane whose oldest pending transaction is older than
+``stall_s`` is *stalled*: it receives no new orders until that transaction
+mines or is dropped from the mempool (after which the lane re-reads its
+nonce), so one stuck transaction no longer holds up the rest of the flow.
+:meth:`LaneScheduler.poll` (or the :meth:`~LaneScheduler.start` background
+task) checks pending receipts and updates the stall flags.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..errors import ConfigError, RpcError
+from ..signing import BaseSigner
+from .rpc import JsonRpcClient
+
+
+@dataclass
+class Lane:
+    signer: BaseSigner
+    nonce: int | None = None  # next nonce to send with (None: read from the RPC)
+    pending: dict[str, float] = field(default_factory=dict)  # tx hash -> sent at
+    reserved: int = 0  # picked, not yet broadcast
+    sent: int = 0
+    stalled: bool = False
+    resync: bool = False  # re-read the nonce before the next send
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    @property
+    def address(self) -> str:
+        return self.signer.address
+
+    @property
+    def load(self) -> int:
+        return len(self.pending) + self.reserved
+
+
+class LaneScheduler:
+    """Route direct-mode transactions over a pool of delegate EOAs.
+
+    >>> lanes = client.engine.use_lanes([LocalSigner(k) for k in delegate_keys])
+    >>> lanes.start()              # track receipts, flag stalled lanes
+    >>> await client.trade.market_open(...)   # sent from the least-loaded lane
+    """
+
+    def __init__(
+        self,
+        rpc: JsonRpcClient,
+        signers: Sequence[BaseSigner],
+        *,
+        stall_s: float = 30.0,
+        poll_s: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not signers:
+            raise ConfigError("LaneScheduler needs at least one signer")
+        addresses = [s.address.lower() for s in signers]
+        if len(set(addresses)) != len(addresses):
+            raise ConfigError("LaneScheduler signers must be distinct EOAs")
+        self._rpc = rpc
+        self.lanes = [Lane(signer) for signer in signers]
+        self.stall_s = stall_s
+        self.poll_s = poll_s
+        self._clock = clock
+        self._by_hash: dict[str, Lane] = {}
+        self._task: asyncio.Task[None] | None = None
+        self.last_error: Exception | None = None
+
+    def __len__(self) -> int:
+        return len(self.lanes)
+
+    # ------------------------------------------------------------------ routing
+
+    def pick(self) -> Lane:
+        """The lane for the next order: healthy before stalled, then the
+        fewest pending, then the fewest sent."""
+        return min(self.lanes, key=lambda lane: (lane.stalled, lane.load, lane.sent))
+
+    async def send(self, tx: dict[str, Any]) -> tuple[Lane, str]:
+        """Sign ``tx`` (everything but ``nonce``) on the least-loaded lane and
+        broadcast it; returns the lane and the transaction hash."""
+        lane = self.pick()
+        lane.reserved += 1
+        try:
+            async with lane._lock:
+                if lane.nonce is None or lane.resync:
+                    lane.resync = False
+                    lane.nonce = await self._rpc.get_transaction_count(lane.address)
+                raw, tx_hash = lane.signer.sign_transaction({**tx, "nonce": lane.nonce})
+                try:
+                    await self._rpc.send_raw_transaction(raw)
+                except RpcError:
+                    lane.nonce = None  # unknown whether it landed: re-read next time
+                    raise
+                lane.nonce += 1
+                lane.sent += 1
+                lane.pending[tx_hash] = self._clock()
+                self._by_hash[tx_hash] = lane
+        finally:
+            lane.reserved -= 1
+        return lane, tx_hash
+
+    def settle(self, tx_hash: str) -> None:
+        """Mark ``tx_hash`` mined (or dropped) and re-evaluate its lane."""
+        lane = self._by_hash.pop(tx_hash, None)
+        if lane is not None:
+            lane.pending.pop(tx_hash, None)
+            self._update_stall(lane)
+
+    def _update_stall(self, lane: Lane) -> None:
+        oldest = min(lane.pending.values(), default=None)
+        stalled = oldest is not None and self._clock() - oldest > self.stall_s
+        if lane.stalled and not stalled:
+            lane.resync = True  # replaced or dropped txs leave gaps
+        lane.stalled = stalled
+
+    # ------------------------------------------------------------------ tracking
+
+    async def poll(self) -> None:
+        """Check the receipts of every pending transaction (and, on stalled
+        lanes, whether it was dropped) and refresh the stall flags."""
+        for lane in self.lanes:
+            for tx_hash in list(lane.pending):
+                if await self._rpc.get_receipt(tx_hash) is not None:
+                    self.settle(tx_hash)
+                elif lane.stalled and await self._rpc.get_transaction(tx_hash) is None:
+                    self.settle(tx_hash)  # dropped from the mempool: never mines
+            self._update_stall(lane)
+
+    def start(self) -> None:
+        """Run :meth:`poll` every ``poll_s`` in a background task (errors are
+        kept in :attr:`last_error`)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.poll()
+                self.last_error = None
+            except Exception as exc:  # keep routing on the last known state
+                self.last_error = exc
+            await asyncio.sleep(self.poll_s)
@@ -13,47 +13,29 @@ on-chain.
 
 from __future__ import annotations
 
+import heapq
 import secrets
+import threading
 import time
+from collections.abc import Callable
 from decimal import Decimal
 from typing import Any
 
 from eth_abi import encode as abi_encode
 from eth_account.messages import _hash_eip191_message, encode_typed_data
-from eth_utils import to_bytes, to_checksum_address
+from eth_utils import keccak, to_bytes, to_checksum_address
 
 from ..errors import ConfigError
 from ..intents_schema import (
     INTENT_TYPES,
     REFERRAL_INTENTS,
     TNC_STRING,
+    Field,
     referral_domain,
     trading_domain,
 )
 from ..signing.intents import _EIP712_DOMAIN_FIELDS, to_int_message
-from ..types import IntentPayload
-
-USDC = 10**6
-P10 = 10**10
-
-
-def _scale(value: float | int | str | Decimal, factor: int) -> int:
-    """Human units -> raw integer via exact decimal scaling.
-
-    Binary-float multiplication can truncate one unit low
-    (``int(0.0003 * 1e10) == 2_999_999``, bites low-priced pair prices and
-    TP/SL); a float's ``str()`` is its shortest exact decimal representation,
-    so scaling through Decimal gives the raw value the user actually meant.
-    """
-    return int(Decimal(str(value)) * factor)
-
-
-def _usdc(value: float | int | str | Decimal) -> int:
-    return _scale(value, USDC)
-
-
-def _p10(value: float | int | str | Decimal) -> int:
-    return _scale(value, P10)
+from ..types import IntentPayload, Num, to_1e10, to_usdc
 
 # Solidity struct component order for abi.encode(struct). Identical to the
 # typed-data order except DelegateReq (declares expiry, tnc, deadline).
@@ -83,20 +65,88 @@ def _code_bytes32(code: str) -> str:
 
 
 class NoncePool:
-    """Random 256-bit unordered nonces with local dedup (parallel-order safe)."""
-
-    def __init__(self) -> None:
-        self._used: set[int] = set()
+    """Random 256-bit unordered nonces with local dedup (parallel-order safe).
+
+    A nonce only has to stay unique while an intent carrying it can still
+    execute, i.e. until its deadline. Each nonce is filed under its deadline
+    (``ttl_ms`` from now when none is given) in ``bucket_ms`` buckets, and
+    whole buckets are dropped ``grace_ms`` after they expire, so memory is
+    bounded by the signing rate times the deadline window (amortized O(1)
+    per nonce: each is inserted and evicted once).
+
+    Thread-safe. Across processes, give each worker a ``worker_id`` out of
+    ``2**worker_bits``: the top ``worker_bits`` of every nonce carry the id,
+    so workers draw from disjoint ranges and cannot collide.
+    """
 
-    def next(self) -> int:
-        while True:
-            nonce = secrets.randbits(256)
-            if nonce not in self._used:
-                self._used.add(nonce)
-                return nonce
+    def __init__(
+        self,
+        *,
+        ttl_ms: int = 120_000,
+        grace_ms: int = 60_000,
+        bucket_ms: int = 1_000,
+        worker_id: int = 0,
+        worker_bits: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if not 0 <= worker_bits <= 64 or not 0 <= worker_id < 2**worker_bits:
+            raise ConfigError("worker_id must fit in worker_bits (at most 64 bits)")
+        self.ttl_ms = ttl_ms
+        self.grace_ms = grace_ms
+        self._bucket_ms = bucket_ms
+        self._random_bits = 256 - worker_bits
+        self._prefix = worker_id << self._random_bits
+        self._clock = clock
+        self._used: dict[int, int] = {}  # nonce -> deadline bucket
+        self._buckets: dict[int, set[int]] = {}
+        self._expiry: list[int] = []  # min-heap of bucket keys
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._used)
+
+    def next(self, deadline_ms: int | None = None) -> int:
+        """A fresh nonce, reserved until ``deadline_ms`` (+ grace)."""
+        now_ms = int(self._clock() * 1000)
+        bucket = (deadline_ms if deadline_ms is not None else now_ms + self.ttl_ms)
+        bucket //= self._bucket_ms
+        with self._lock:
+            self._evict(now_ms)
+            while True:
+                nonce = self._prefix | secrets.randbits(self._random_bits)
+                if nonce not in self._used:
+                    break
+            self._used[nonce] = bucket
+            members = self._buckets.get(bucket)
+            if members is None:
+                members = self._buckets[bucket] = set()
+                heapq.heappush(self._expiry, bucket)
+            members.add(nonce)
+            return nonce
 
     def release(self, nonce: int) -> None:
-        self._used.discard(nonce)
+        """Forget a nonce that was never submitted."""
+        with self._lock:
+            bucket = self._used.pop(nonce, None)
+            if bucket is not None:
+                self._buckets[bucket].discard(nonce)
+
+    def _evict(self, now_ms: int) -> None:
+        horizon = (now_ms - self.grace_ms) // self._bucket_ms
+        expiry, buckets, used = self._expiry, self._buckets, self._used
+        while expiry and expiry[0] < horizon:
+            for nonce in buckets.pop(heapq.heappop(expiry)):
+                del used[nonce]
+
+
+def _stringify(value: Any) -> Any:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, dict):
+        return {k: _stringify(v) for k, v in value.items()}
+    return value
 
 
 def _abi_schema(kind: str) -> tuple[str, list[str]]:
@@ -136,6 +186,175 @@ def _abi_values(kind: str, message: dict[str, Any]) -> list[Any]:
     return values
 
 
+def _encode_type(types: dict[str, list[Field]], kind: str) -> str:
+    """EIP-712 ``encodeType``: the primary struct, then referenced structs
+    sorted by name."""
+    deps = sorted({f["type"] for f in types[kind] if f["type"] in types})
+
+    def one(name: str) -> str:
+        return name + "(" + ",".join(f"{f['type']} {f['name']}" for f in types[name]) + ")"
+
+    return one(kind) + "".join(one(dep) for dep in deps)
+
+
+def _word(type_: str, value: Any) -> bytes:
+    """One 32-byte EIP-712 / ABI word for a static field."""
+    if type_ == "bool":
+        return (1 if value else 0).to_bytes(32, "big")
+    if type_ == "address":
+        return to_bytes(hexstr=value).rjust(32, b"\x00")
+    if type_ == "bytes32":
+        return to_bytes(hexstr=value) if isinstance(value, str) else bytes(value)
+    if type_.startswith("uint"):
+        return int(value).to_bytes(32, "big")
+    if type_.startswith("int"):
+        return int(value).to_bytes(32, "big", signed=True)
+    raise ValueError(f"{type_} is not a static 32-byte field")
+
+
+def _domain_separator(domain: dict[str, Any]) -> bytes:
+    return keccak(
+        keccak(_encode_type({"EIP712Domain": _EIP712_DOMAIN_FIELDS}, "EIP712Domain").encode())
+        + keccak(domain["name"].encode())
+        + keccak(domain["version"].encode())
+        + _word("uint256", domain["chainId"])
+        + _word("address", domain["verifyingContract"])
+    )
+
+
+class IntentTemplate:
+    """A pre-encoded intent whose only free fields are a few raw integers.
+
+    Everything invariant between quotes for a (trader, pair, side) is done
+    once: checksumming, scaling, the domain separator, type hashes, the
+    32-byte words of every static field (which double as the ABI encoding,
+    all fields being static) and the struct hash of nested structs without
+    free fields. :meth:`build` then writes the free words, hashes and wraps
+    the result in an ``IntentPayload`` without re-validating it.
+
+    ``variables`` maps keyword names to message paths, e.g.
+    ``{"price": ("_t", "openPrice")}``; nonce and deadline are always free
+    and default like the builder's helpers. Values are raw on-chain integers
+    (1e10 prices, 1e6 USDC), not human units.
+    """
+
+    def __init__(
+        self,
+        builder: LocalIntentBuilder,
+        kind: str,
+        message: dict[str, Any],
+        variables: dict[str, tuple[str, ...]],
+    ) -> None:
+        types = INTENT_TYPES[kind]
+        fields = types[kind]
+        if kind in _ABI_ORDERS:
+            raise ValueError(f"{kind} has no static template layout")
+        self.kind = kind
+        self._builder = builder
+        names = {f["name"] for f in fields}
+        nonce_path = ("_nonce",) if "_nonce" in names else ("nonce",)
+        deadline_path = ("_deadline",) if "_deadline" in names else ("deadline",)
+        if deadline_path[0] not in names:
+            raise ValueError(f"{kind} has no deadline field")
+        variables = {
+            **variables,
+            "nonce": nonce_path,
+            "deadline_ms": deadline_path,
+        }
+        placeholder = dict(message)
+        for path in variables.values():
+            parent = placeholder
+            if len(path) == 2:
+                parent = placeholder[path[0]] = dict(placeholder[path[0]])
+            parent[path[-1]] = 0
+        int_message = to_int_message(types, kind, placeholder)
+
+        # flat leaf words in struct order (== abi.encode of the all-static struct)
+        slots: dict[tuple[str, ...], int] = {}
+        words: list[bytes] = []
+        # top-level entries: leaf slot, or (start, end, typehash) of a nested struct
+        self._layout: list[int | tuple[int, int, bytes]] = []
+        for f in fields:
+            if f["type"] in types:
+                start = len(words)
+                for inner in types[f["type"]]:
+                    slots[(f["name"], inner["name"])] = len(words)
+                    words.append(_word(inner["type"], int_message[f["name"]][inner["name"]]))
+                type_hash = keccak(_encode_type(types, f["type"]).encode())
+                self._layout.append((start, len(words), type_hash))
+            else:
+                slots[(f["name"],)] = len(words)
+                self._layout.append(len(words))
+                words.append(_word(f["type"], int_message[f["name"]]))
+        self._words = b"".join(words)
+        self._slots = {name: slots[path] for name, path in variables.items()}
+        self._paths = variables
+        dirty = {slots[path] for path in variables.values()}
+        self._cached: dict[int, bytes] = {
+            i: keccak(entry[2] + self._words[entry[0] * 32 : entry[1] * 32])
+            for i, entry in enumerate(self._layout)
+            if isinstance(entry, tuple) and not dirty & set(range(entry[0], entry[1]))
+        }
+        self._type_hash = keccak(_encode_type(types, kind).encode())
+        self._domain = (
+            referral_domain(builder.chain_id, builder.referral or "")
+            if kind in REFERRAL_INTENTS
+            else trading_domain(builder.chain_id, builder.trading_router)
+        )
+        self._prefix = b"\x19\x01" + _domain_separator(self._domain)
+        self._message = _stringify(int_message)
+
+    @property
+    def variables(self) -> tuple[str, ...]:
+        return tuple(self._paths)
+
+    def build(
+        self, *, nonce: int | None = None, deadline_ms: int | None = None, **values: int
+    ) -> IntentPayload:
+        """The payload for these free-field values; same digest, encoding and
+        message as ``builder.build`` on the equivalent full message."""
+        values["deadline_ms"] = deadline = self._builder._deadline(deadline_ms)
+        values["nonce"] = self._builder._nonce(nonce, deadline)
+        if len(values) != len(self._slots):
+            missing = set(self._slots) - set(values)
+            raise TypeError(f"missing template values: {sorted(missing)}")
+        words = bytearray(self._words)
+        message = dict(self._message)
+        for name, value in values.items():
+            slot = self._slots[name]  # KeyError: not a free field of this template
+            words[slot * 32 : slot * 32 + 32] = value.to_bytes(32, "big")
+            path = self._paths[name]
+            if len(path) == 2:
+                inner = message[path[0]]
+                if inner is self._message[path[0]]:
+                    inner = message[path[0]] = dict(inner)
+                inner[path[1]] = str(value)
+            else:
+                message[path[0]] = str(value)
+        parts: list[bytes | bytearray] = [self._type_hash]
+        for i, entry in enumerate(self._layout):
+            if isinstance(entry, int):
+                parts.append(words[entry * 32 : entry * 32 + 32])
+            else:
+                cached = self._cached.get(i)
+                parts.append(
+                    cached
+                    if cached is not None
+                    else keccak(entry[2] + words[entry[0] * 32 : entry[1] * 32])
+                )
+        digest = keccak(self._prefix + keccak(b"".join(parts)))
+        return IntentPayload.model_construct(
+            intent=self.kind,
+            signer_rule="trader-or-delegate",
+            domain=self._domain,
+            primary_type=self.kind,
+            types=INTENT_TYPES[self.kind],
+            message=message,
+            digest="0x" + digest.hex(),
+            encoded_intent="0x" + words.hex(),
+        )
+
+
 class LocalIntentBuilder:
     def __init__(
         self,
@@ -149,7 +368,7 @@ class LocalIntentBuilder:
         self.trading_router = to_checksum_address(trading_router)
         self.referral = to_checksum_address(referral) if referral else None
         self.default_deadline_ms = default_deadline_ms
-        self.nonces = NoncePool()
+        self.nonces = NoncePool(ttl_ms=default_deadline_ms)
 
     @classmethod
     def from_meta(cls, meta: dict[str, Any]) -> LocalIntentBuilder:
@@ -183,15 +402,6 @@ class LocalIntentBuilder:
         abi_type, _ = _abi_schema(kind)
         encoded = abi_encode([abi_type], [_abi_values(kind, int_message)])
 
-        def _stringify(value: Any) -> Any:
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, int):
-                return str(value)
-            if isinstance(value, dict):
-                return {k: _stringify(v) for k, v in value.items()}
-            return value
-
         return IntentPayload.model_validate(
             {
                 "intent": kind,
@@ -210,8 +420,8 @@ class LocalIntentBuilder:
     def _deadline(self, deadline_ms: int | None) -> int:
         return deadline_ms if deadline_ms is not None else int(time.time() * 1000) + self.default_deadline_ms
 
-    def _nonce(self, nonce: int | None) -> int:
-        return nonce if nonce is not None else self.nonces.next()
+    def _nonce(self, nonce: int | None, deadline_ms: int | None = None) -> int:
+        return nonce if nonce is not None else self.nonces.next(deadline_ms)
 
     @staticmethod
     def _trade_struct(
@@ -230,12 +440,12 @@ class LocalIntentBuilder:
             "pairIndex": pair_index,
             "index": 0,
             "initialPosToken": 0,
-            "positionSizeUSDC": _usdc(collateral_usdc),
-            "openPrice": _p10(open_price),
+            "positionSizeUSDC": to_usdc(collateral_usdc),
+            "openPrice": to_1e10(open_price),
             "buy": is_long,
-            "leverage": _p10(leverage),
-            "tp": _p10(tp),
-            "sl": _p10(sl),
+            "leverage": to_1e10(leverage),
+            "tp": to_1e10(tp),
+            "sl": to_1e10(sl),
             "timestamp": 0,
         }
 
@@ -255,6 +465,7 @@ class LocalIntentBuilder:
         nonce: int | None = None,
         deadline_ms: int | None = None,
     ) -> IntentPayload:
+        deadline = self._deadline(deadline_ms)
         message = {
             "_t": self._trade_struct(
                 trader=trader,
@@ -267,12 +478,53 @@ class LocalIntentBuilder:
                 sl=sl,
             ),
             "_type": order_type,
-            "_slippageP": _p10(slippage_percent),
-            "_deadline": self._deadline(deadline_ms),
-            "_nonce": self._nonce(nonce),
+            "_slippageP": to_1e10(slippage_percent),
+            "_deadline": deadline,
+            "_nonce": self._nonce(nonce, deadline),
         }
         return self.build("OpenTradeReq", message)
 
+    def template(
+        self, kind: str, message: dict[str, Any], variables: dict[str, tuple[str, ...]]
+    ) -> IntentTemplate:
+        """An :class:`IntentTemplate` over a raw-scale ``message`` (values at
+        the ``variables`` paths, nonce and deadline are ignored)."""
+        return IntentTemplate(self, kind, message, variables)
+
+    def open_trade_template(
+        self,
+        *,
+        trader: str,
+        pair_index: int,
+        is_long: bool,
+        leverage: float,
+        order_type: int = 0,
+        tp: float = 0,
+        sl: float = 0,
+        slippage_percent: float = 1,
+    ) -> IntentTemplate:
+        """:meth:`open_trade` with the static fields bound; ``build(price=,
+        size=)`` takes the raw open price (1e10) and collateral (1e6 USDC)."""
+        message = {
+            "_t": self._trade_struct(
+                trader=trader,
+                pair_index=pair_index,
+                is_long=is_long,
+                collateral_usdc=0,
+                leverage=leverage,
+                open_price=0,
+                tp=tp,
+                sl=sl,
+            ),
+            "_type": order_type,
+            "_slippageP": to_1e10(slippage_percent),
+        }
+        return self.template(
+            "OpenTradeReq",
+            message,
+            {"price": ("_t", "openPrice"), "size": ("_t", "positionSizeUSDC")},
+        )
+
     def open_trade_coin(
         self,
         *,
@@ -294,6 +546,7 @@ class LocalIntentBuilder:
     ) -> IntentPayload:
         """Open targeting a fixed base-asset exposure (fill leverage floats
         within [min_leverage, max_leverage]; ``leverage`` is the reference)."""
+        deadline = self._deadline(deadline_ms)
         message = {
             "_t": self._trade_struct(
                 trader=trader,
@@ -306,12 +559,12 @@ class LocalIntentBuilder:
                 sl=sl,
             ),
             "_type": order_type,
-            "_coinExposure": _p10(coin_exposure),
-            "_minLeverage": _p10(min_leverage),
-            "_maxLeverage": _p10(max_leverage),
-            "_slippageP": _p10(slippage_percent),
-            "_deadline": self._deadline(deadline_ms),
-            "_nonce": self._nonce(nonce),
+            "_coinExposure": to_1e10(coin_exposure),
+            "_minLeverage": to_1e10(min_leverage),
+            "_maxLeverage": to_1e10(max_leverage),
+            "_slippageP": to_1e10(slippage_percent),
+            "_deadline": deadline,
+            "_nonce": self._nonce(nonce, deadline),
         }
         return self.build("OpenTradeCoinExposureReq", message)
 
@@ -322,23 +575,39 @@ class LocalIntentBuilder:
         pair_index: int,
         index: int,
         open_timestamp: int,
-        amount_usdc: float,
-        wanted_price: float,
+        amount_usdc: Num,
+        wanted_price: Num,
         nonce: int | None = None,
         deadline_ms: int | None = None,
     ) -> IntentPayload:
+        deadline = self._deadline(deadline_ms)
         message = {
             "_trader": to_checksum_address(trader),
             "_pairIndex": pair_index,
             "_index": index,
             "_openTimestamp": open_timestamp,
-            "_amount": _usdc(amount_usdc),
-            "_wantedPrice": _p10(wanted_price),
-            "_deadline": self._deadline(deadline_ms),
-            "_nonce": self._nonce(nonce),
+            "_amount": to_usdc(amount_usdc),
+            "_wantedPrice": to_1e10(wanted_price),
+            "_deadline": deadline,
+            "_nonce": self._nonce(nonce, deadline),
         }
         return self.build("CloseTradeReq", message)
 
+    def close_trade_template(
+        self, *, trader: str, pair_index: int, index: int, open_timestamp: int
+    ) -> IntentTemplate:
+        """:meth:`close_trade` with the position bound; ``build(price=,
+        size=)`` takes the raw wanted price (1e10) and amount (1e6 USDC)."""
+        message = {
+            "_trader": to_checksum_address(trader),
+            "_pairIndex": pair_index,
+            "_index": index,
+            "_openTimestamp": open_timestamp,
+        }
+        return self.template(
+            "CloseTradeReq", message, {"price": ("_wantedPrice",), "size": ("_amount",)}
+        )
+
     def close_trade_coin(
         self,
         *,
@@ -352,15 +621,16 @@ class LocalIntentBuilder:
         deadline_ms: int | None = None,
     ) -> IntentPayload:
         """Close a fixed base-asset exposure instead of a USDC amount."""
+        deadline = self._deadline(deadline_ms)
         message = {
             "_trader": to_checksum_address(trader),
             "_pairIndex": pair_index,
             "_index": index,
             "_openTimestamp": open_timestamp,
-            "_coinExposure": _p10(coin_exposure),
-            "_wantedPrice": _p10(wanted_price),
-            "_deadline": self._deadline(deadline_ms),
-            "_nonce": self._nonce(nonce),
+            "_coinExposure": to_1e10(coin_exposure),
+            "_wantedPrice": to_1e10(wanted_price),
+            "_deadline": deadline,
+            "_nonce": self._nonce(nonce, deadline),
         }
         return self.build("CloseTradeCoinExposureReq", message)
 
@@ -378,9 +648,9 @@ class LocalIntentBuilder:
             "trader": to_checksum_address(trader),
             "pairIndex": pair_index,
             "index": index,
-            "openPrice": _p10(open_price),
-            "initialPosToken": _usdc(additional_collateral_usdc),
-            "leverage": _p10(leverage),
+            "openPrice": to_1e10(open_price),
+            "initialPosToken": to_usdc(additional_collateral_usdc),
+            "leverage": to_1e10(leverage),
         }
 
     def increase_position(
@@ -398,6 +668,7 @@ class LocalIntentBuilder:
     ) -> IntentPayload:
         """Increase position size (``open_price`` is the reference price for
         the added size; no feed locally, so the caller must supply it)."""
+        deadline = self._deadline(deadline_ms)
         message = {
             "_updateInfo": self._update_position_size_struct(
                 trader=trader,
@@ -407,9 +678,9 @@ class LocalIntentBuilder:
                 additional_collateral_usdc=additional_collateral_usdc,
                 leverage=leverage,
             ),
-            "_slippageP": _p10(slippage_percent),
-            "_deadline": self._deadline(deadline_ms),
-            "_nonce": self._nonce(nonce),
+            "_slippageP": to_1e10(slippage_percent),
+            "_deadline": deadline,
+            "_nonce": self._nonce(nonce, deadline),
         }
         return self.build("IncreasePositionSizeReq", message)
 
@@ -431,6 +702,7 @@ class LocalIntentBuilder:
     ) -> IntentPayload:
         """Increase targeting a fixed base-asset exposure (fill leverage floats
         within [min_leverage, max_leverage])."""
+        deadline = self._deadline(deadline_ms)
         message = {
             "_updateInfo": self._update_position_size_struct(
                 trader=trader,
@@ -440,12 +712,12 @@ class LocalIntentBuilder:
                 additional_collateral_usdc=additional_collateral_usdc,
                 leverage=leverage,
             ),
-            "_coinExposure": _p10(coin_exposure),
-            "_minLeverage": _p10(min_leverage),
-            "_maxLeverage": _p10(max_leverage),
-            "_slippageP": _p10(slippage_percent),
-            "_deadline": self._deadline(deadline_ms),
-            "_nonce": self._nonce(nonce),
+            "_coinExposure": to_1e10(coin_exposure),
+            "_minLeverage": to_1e10(min_leverage),
+            "_maxLeverage": to_1e10(max_leverage),
+            "_slippageP": to_1e10(slippage_percent),
+            "_deadline": deadline,
+            "_nonce": self._nonce(nonce, deadline),
         }
         return self.build("IncreasePositionSizeWithCoinExposureReq", message)
 
@@ -460,14 +732,15 @@ class LocalIntentBuilder:
         nonce: int | None = None,
         deadline_ms: int | None = None,
     ) -> IntentPayload:
+        deadline = self._deadline(deadline_ms)
         message = {
             "trader": to_checksum_address(trader),
             "_pairIndex": pair_index,
             "_index": index,
-            "_newTp": _p10(tp),
-            "_newSl": _p10(sl),
-            "_deadline": self._deadline(deadline_ms),
-            "_nonce": self._nonce(nonce),
+            "_newTp": to_1e10(tp),
+            "_newSl": to_1e10(sl),
+            "_deadline": deadline,
+            "_nonce": self._nonce(nonce, deadline),
         }
         return self.build("UpdateTpSlReq", message)
 
@@ -479,11 +752,11 @@ class LocalIntentBuilder:
         index: int,
         kind: str,  # "tp"/"take_profit" | "sl"/"stop_loss"
         is_long: bool,  # side of the POSITION being trimmed
-        coin_exposure: float,
+        coin_exposure: Num,
         open_timestamp: int,  # the position's Trade.timestamp
         trigger: str = "fixed",  # "fixed" | "percentage"
-        price: float | None = None,  # required with trigger="fixed"
-        percentage: float | None = None,  # signed, 1 = 1%; required with "percentage"
+        price: Num | None = None,  # required with trigger="fixed"
+        percentage: Num | None = None,  # signed, 1 = 1%; required with "percentage"
         sign_timestamp_ms: int | None = None,
         nonce: int | None = None,
     ) -> IntentPayload:
@@ -506,10 +779,10 @@ class LocalIntentBuilder:
             "pairIndex": pair_index,
             "index": index,
             "triggerType": _TRIGGER_TYPE_CODES[trigger],
-            "coinSize": _p10(coin_exposure),
+            "coinSize": to_1e10(coin_exposure),
             "buy": is_long,
-            "price": _p10(price) if price is not None else 0,
-            "percentage": _p10(percentage) if percentage is not None else 0,
+            "price": to_1e10(price) if price is not None else 0,
+            "percentage": to_1e10(percentage) if percentage is not None else 0,
             "timestamp": open_timestamp,
             "signTimestamp": (
                 sign_timestamp_ms if sign_timestamp_ms is not None else int(time.time() * 1000)
@@ -535,18 +808,19 @@ class LocalIntentBuilder:
     ) -> IntentPayload:
         """TWAP open (collateral spread over run_time_seconds slices);
         ``coin_exposure`` switches to fixed base-asset exposure targeting."""
+        deadline = self._deadline(deadline_ms)
         message = {
             "trader": to_checksum_address(trader),
             "pairIndex": pair_index,
-            "collateral": _usdc(collateral_usdc),
+            "collateral": to_usdc(collateral_usdc),
             "buy": is_long,
             "isCoin": coin_exposure is not None,
-            "coinSize": _p10(coin_exposure) if coin_exposure is not None else 0,
-            "defaultLeverage": _p10(leverage),
-            "maxLeverage": _p10(max_leverage),
+            "coinSize": to_1e10(coin_exposure) if coin_exposure is not None else 0,
+            "defaultLeverage": to_1e10(leverage),
+            "maxLeverage": to_1e10(max_leverage),
             "runTime": run_time_seconds,
-            "nonce": self._nonce(nonce),
-            "deadline": self._deadline(deadline_ms),
+            "nonce": self._nonce(nonce, deadline),
+            "deadline": deadline,
             "__reserved1": 0,
         }
         return self.build("TwapOpenOrder", message)
@@ -562,14 +836,15 @@ class LocalIntentBuilder:
         nonce: int | None = None,
         deadline_ms: int | None = None,
     ) -> IntentPayload:
+        deadline = self._deadline(deadline_ms)
         message = {
             "trader": to_checksum_address(trader),
             "pairIndex": pair_index,
             "index": index,
-            "coinSizeToClose": _p10(coin_exposure_to_close),
+            "coinSizeToClose": to_1e10(coin_exposure_to_close),
             "runTime": run_time_seconds,
-            "nonce": self._nonce(nonce),
-            "deadline": self._deadline(deadline_ms),
+            "nonce": self._nonce(nonce, deadline),
+            "deadline": deadline,
             "__reserved1": 0,
         }
         return self.build("TwapCloseOrder", message)
@@ -583,11 +858,12 @@ class LocalIntentBuilder:
         deadline_ms: int | None = None,
     ) -> IntentPayload:
         """Cancel a TWAP by its on-chain ``twapId`` (no __reserved1 field)."""
+        deadline = self._deadline(deadline_ms)
         message = {
             "trader": to_checksum_address(trader),
             "twapId": twap_id,
-            "nonce": self._nonce(nonce),
-            "deadline": self._deadline(deadline_ms),
+            "nonce": self._nonce(nonce, deadline),
+            "deadline": deadline,
         }
         return self.build("TwapCancelReq", message)
 
@@ -606,13 +882,14 @@ class LocalIntentBuilder:
         nonce: int | None = None,
         deadline_ms: int | None = None,
     ) -> IntentPayload:
+        deadline = self._deadline(deadline_ms)
         message = {
             "trader": to_checksum_address(trader),
             "delegate": to_checksum_address(delegate),
             "expiry": expiry_seconds,
-            "deadline": self._deadline(deadline_ms),
+            "deadline": deadline,
             "tnc": TNC_STRING,
-            "nonce": self._nonce(nonce),
+            "nonce": self._nonce(nonce, deadline),
         }
         return self.build("DelegateReq", message)
 
@@ -636,11 +913,12 @@ class LocalIntentBuilder:
         deadline_ms: int | None = None,
     ) -> IntentPayload:
         self._require_referral()
+        deadline = self._deadline(deadline_ms)
         message = {
             "_code": _code_bytes32(code),
             "_referrer": to_checksum_address(referrer),
-            "_deadline": self._deadline(deadline_ms),
-            "_nonce": self._nonce(nonce),
+            "_deadline": deadline,
+            "_nonce": self._nonce(nonce, deadline),
         }
         return self.build("RegisterCodeReq", message)
 
@@ -653,10 +931,11 @@ class LocalIntentBuilder:
         deadline_ms: int | None = None,
     ) -> IntentPayload:
         self._require_referral()
+        deadline = self._deadline(deadline_ms)
         message = {
             "_code": _code_bytes32(code),
             "_referee": to_checksum_address(referee),
-            "_deadline": self._deadline(deadline_ms),
-            "_nonce": self._nonce(nonce),
+            "_deadline": deadline,
+            "_nonce": self._nonce(nonce, deadline),
         }
         return self.build("SetTraderReferralCodeByUserReq", message)
@@ -0,0 +1,313 @@
+"""Pre-signed order grid: the batched-market POST is all that is left at tick time.
+
+For stop-style reactions (enter when price crosses a level) the intent for
+every (reference price, size) a bot may want is built and signed ahead of
+time from an :class:`~.local_intents.IntentTemplate`. A tick then picks the
+nearest armed level and submits its stored signature through
+``ExecutionEngine.submit_intent_batch``: one bisect, one dict lookup, one
+HTTP write. Levels are re-signed (fresh nonce, fresh deadline) before their
+``deadline`` runs out; the nonce of an intent that was replaced without
+being submitted goes back to the builder's ``NoncePool``. Levels are
+one-shot: a level whose order batched-market accepted stays disarmed until
+:meth:`OrderGrid.arm` (or ``rearm=True``, which re-signs it at once), even
+if the lifecycle stream fails afterwards; only a POST that was never
+accepted re-arms it with a fresh nonce.
+
+A tick farther than ``max_distance_p`` (default: the ladder's
+``slippage_percent``) from the nearest level fires nothing: that order's
+fill check would fail anyway.
+
+The reference price is what the contract checks the fill against
+(± ``slippage_percent``), so the grid spacing bounds the slippage budget a
+fired order needs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextlib
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from ..errors import ConfigError
+from ..signing import BaseSigner, sign_intent
+from ..types import (
+    AggregatorOrderType,
+    ExecutionReceipt,
+    IntentPayload,
+    to_1e10,
+    to_usdc,
+)
+from .batched_market import ACCEPTED, BatchedMarketEvent, BatchedMarketEventHook
+from .engine import ExecutionEngine
+from .local_intents import IntentTemplate, LocalIntentBuilder
+
+_MARKET_PNL = 3  # OpenTradeReq._type of Upside (PnL) market opens
+
+
+@dataclass
+class GridOrder:
+    pair_index: int
+    is_long: bool
+    price: float  # reference open price
+    collateral: float  # USDC
+    payload: IntentPayload
+    signature: str
+    nonce: int
+    deadline_ms: int
+
+
+@dataclass
+class _Ladder:
+    template: IntentTemplate
+    order_type: AggregatorOrderType
+    prices: list[float]  # ascending
+    orders: list[GridOrder | None]  # None: fired
+    max_distance_p: float
+
+
+class OrderGrid:
+    """Pre-signed market opens on a (pair, side, collateral) x price grid.
+
+    >>> grid = OrderGrid(builder, client.engine, trader=client.trade.trader)
+    >>> grid.add(eth.index, is_long=True, prices=levels, sizes=[100, 500],
+    ...          leverage=10, slippage_percent=0.3)
+    >>> grid.start()                        # keep every level signed and fresh
+    >>> await grid.fire(eth.index, price, is_long=True, size=100)
+    """
+
+    def __init__(
+        self,
+        builder: LocalIntentBuilder,
+        engine: ExecutionEngine,
+        *,
+        trader: str,
+        deadline_ms: int = 120_000,
+        refresh_margin_ms: int = 20_000,
+        refresh_s: float = 5.0,
+        rearm: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if refresh_margin_ms >= deadline_ms:
+            raise ConfigError("refresh_margin_ms must be shorter than deadline_ms")
+        if engine.signer is None:
+            raise ConfigError("OrderGrid signs its levels ahead of time: it needs a signing key.")
+        self._builder = builder
+        self._engine = engine
+        self._signer: BaseSigner = engine.signer
+        self.trader = trader
+        self.deadline_ms = deadline_ms
+        self.refresh_margin_ms = refresh_margin_ms
+        self.refresh_s = refresh_s
+        self.rearm = rearm
+        self._clock = clock
+        self._ladders: dict[tuple[int, bool, int], _Ladder] = {}
+        self._task: asyncio.Task[None] | None = None
+        self.last_error: Exception | None = None
+
+    def __len__(self) -> int:
+        return sum(len(ladder.prices) for ladder in self._ladders.values())
+
+    def _now_ms(self) -> int:
+        return int(self._clock() * 1000)
+
+    # ------------------------------------------------------------------ arming
+
+    def add(
+        self,
+        pair_index: int,
+        *,
+        is_long: bool,
+        prices: Sequence[float],
+        sizes: Sequence[float],
+        leverage: float,
+        order_type: int = 0,  # 0 market, 3 market_pnl (Upside pairs)
+        tp: float = 0,
+        sl: float = 0,
+        slippage_percent: float = 1,
+        max_distance_p: float | None = None,
+    ) -> None:
+        """Build and sign one open per (size, price) level (replaces any
+        existing levels for the same pair, side and size). A tick fires a
+        level only within ``max_distance_p`` % of it (default
+        ``slippage_percent``)."""
+        if not prices or not sizes:
+            raise ConfigError("an order grid needs at least one price and one size")
+        distance_p = slippage_percent if max_distance_p is None else max_distance_p
+        agg = (
+            AggregatorOrderType.MARKET_OPEN_PNL
+            if order_type == _MARKET_PNL
+            else AggregatorOrderType.MARKET_OPEN
+        )
+        template = self._builder.open_trade_template(
+            trader=self.trader,
+            pair_index=pair_index,
+            is_long=is_long,
+            leverage=leverage,
+            order_type=order_type,
+            tp=tp,
+            sl=sl,
+            slippage_percent=slippage_percent,
+        )
+        for size in sizes:
+            key = (pair_index, is_long, to_usdc(size))
+            self._discard(self._ladders.pop(key, None))
+            ladder = _Ladder(template, agg, sorted(prices), [], distance_p)
+            ladder.orders = [self._sign(ladder, key, price) for price in ladder.prices]
+            self._ladders[key] = ladder
+
+    def remove(self, pair_index: int, *, is_long: bool, size: float) -> None:
+        self._discard(self._ladders.pop((pair_index, is_long, to_usdc(size)), None))
+
+    def _sign(self, ladder: _Ladder, key: tuple[int, bool, int], price: float) -> GridOrder:
+        deadline = self._now_ms() + self.deadline_ms
+        payload = ladder.template.build(
+            price=to_1e10(price), size=key[2], deadline_ms=deadline
+        )
+        signature = sign_intent(payload, self._signer).signature
+        return GridOrder(
+            pair_index=key[0],
+            is_long=key[1],
+            price=price,
+            collateral=key[2] / 10**6,
+            payload=payload,
+            signature=signature,
+            nonce=int(payload.message["_nonce"]),
+            deadline_ms=deadline,
+        )
+
+    def _discard(self, ladder: _Ladder | None) -> None:
+        if ladder is not None:
+            for order in ladder.orders:
+                if order is not None:
+                    self._builder.nonces.release(order.nonce)
+
+    def refresh(self) -> int:
+        """Re-sign armed levels expiring within ``refresh_margin_ms`` (fired
+        ones too with ``rearm``); returns how many were signed."""
+        horizon = self._now_ms() + self.refresh_margin_ms
+        signed = 0
+        for key, ladder in self._ladders.items():
+            for i, order in enumerate(ladder.orders):
+                if order is None:
+                    if not self.rearm:
+                        continue
+                elif order.deadline_ms > horizon:
+                    continue
+                else:
+                    self._builder.nonces.release(order.nonce)  # never submitted
+                ladder.orders[i] = self._sign(ladder, key, ladder.prices[i])
+                signed += 1
+        return signed
+
+    def arm(self, pair_index: int, *, is_long: bool, size: float) -> int:
+        """Re-sign the fired levels of one ladder; returns how many."""
+        key = (pair_index, is_long, to_usdc(size))
+        ladder = self._ladders.get(key)
+        if ladder is None:
+            raise ConfigError(
+                f"no grid for pair {pair_index} {'long' if is_long else 'short'} size {size}"
+            )
+        fired = [i for i, order in enumerate(ladder.orders) if order is None]
+        for i in fired:
+            ladder.orders[i] = self._sign(ladder, key, ladder.prices[i])
+        return len(fired)
+
+    def start(self) -> None:
+        """Run :meth:`refresh` every ``refresh_s`` in a background task
+        (errors are kept in :attr:`last_error`)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                self.refresh()
+                self.last_error = None
+            except Exception as exc:  # keep the armed levels
+                self.last_error = exc
+            await asyncio.sleep(self.refresh_s)
+
+    # ------------------------------------------------------------------ firing
+
+    def _nearest(
+        self, pair_index: int, price: float, is_long: bool, size: float
+    ) -> tuple[_Ladder, int, GridOrder] | None:
+        ladder = self._ladders.get((pair_index, is_long, to_usdc(size)))
+        if ladder is None:
+            raise ConfigError(
+                f"no grid for pair {pair_index} {'long' if is_long else 'short'} size {size}"
+            )
+        prices = ladder.prices
+        i = bisect.bisect_left(prices, price)
+        if i == len(prices) or (i > 0 and price - prices[i - 1] <= prices[i] - price):
+            i -= 1
+        if abs(price - prices[i]) > prices[i] * ladder.max_distance_p / 100:
+            return None  # outside the grid
+        order = ladder.orders[i]
+        if order is None or order.deadline_ms <= self._now_ms():
+            return None
+        return ladder, i, order
+
+    def select(
+        self, pair_index: int, price: float, *, is_long: bool, size: float
+    ) -> GridOrder | None:
+        """The armed level nearest ``price`` (None when it is fired, expired
+        or farther than the ladder's ``max_distance_p``); raises
+        :class:`ConfigError` for an unknown grid."""
+        hit = self._nearest(pair_index, price, is_long, size)
+        return None if hit is None else hit[2]
+
+    async def fire(
+        self,
+        pair_index: int,
+        price: float,
+        *,
+        is_long: bool,
+        size: float,
+        wait: bool = False,
+        on_event: BatchedMarketEventHook | None = None,
+    ) -> ExecutionReceipt | None:
+        """Submit the nearest armed level's pre-signed intent (None when that
+        level is not armed or too far). Once batched-market accepts the order
+        the level stays disarmed unless the grid was built with ``rearm``,
+        also when ``wait=True`` then fails on the stream; a POST that was
+        never accepted re-signs it (its nonce is spent either way)."""
+        hit = self._nearest(pair_index, price, is_long, size)
+        if hit is None:
+            return None
+        ladder, i, order = hit
+        ladder.orders[i] = None  # consumed: never submitted twice
+        accepted = False
+
+        def track(ev: BatchedMarketEvent) -> object:
+            nonlocal accepted
+            if ev.type == ACCEPTED:
+                accepted = True
+            return None if on_event is None else on_event(ev)
+
+        try:
+            return await self._engine.submit_intent_batch(
+                order.payload,
+                ladder.order_type,
+                wait=wait,
+                on_event=track,
+                signature=order.signature,
+            )
+        finally:
+            key = (pair_index, is_long, to_usdc(size))
+            if (
+                (self.rearm or not accepted)
+                and self._ladders.get(key) is ladder
+                and ladder.orders[i] is None
+            ):
+                ladder.orders[i] = self._sign(ladder, key, ladder.prices[i])
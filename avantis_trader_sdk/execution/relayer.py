@@ -17,7 +17,7 @@ from __future__ import annotations
 import asyncio
 from typing import Any
 
-from ..errors import ApiError, RelayError, RelayTimeoutError
+from ..errors import ApiError, CircuitOpenError, RelayError, RelayTimeoutError
 from ..transport import HttpTransport
 from ..types import RelayStatus
 
@@ -50,11 +50,15 @@ class RelayerClient:
         for attempt in range(4):
             # retries=0 in the transport: a blind re-POST after an ambiguous
             # network failure could double-broadcast.
+            # The busy 503 is the relayer answering, not failing: it does not
+            # count against the breaker.
             resp = await self._t.request(
-                "POST", f"{self._base}/relays", json=body, retries=0
+                "POST", f"{self._base}/relays", json=body, retries=0, busy_statuses=(503,)
             )
             if resp.status_code == 503:  # all wallets busy
                 last_error = resp.text[:200]
+                if self._t.breakers is not None:  # tripped by other calls: fail fast
+                    self._t.breakers.check(f"{self._base}/relays")
                 await asyncio.sleep(1.0 * (attempt + 1))
                 continue
             if resp.status_code >= 400:
@@ -120,10 +124,18 @@ class RelayerClient:
         return RelayStatus(settled=False)
 
     async def wait(self, request_id: str, timeout_s: float | None = None) -> RelayStatus:
+        """Poll until the relay settles. An open relayer breaker pauses the
+        polling rather than ending it: the relay is already submitted."""
         timeout = timeout_s if timeout_s is not None else self.poll_timeout_s
-        deadline = asyncio.get_event_loop().time() + timeout
-        while asyncio.get_event_loop().time() < deadline:
-            st = await self.status(request_id)
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            try:
+                st = await self.status(request_id)
+            except CircuitOpenError as exc:
+                pause = max(self.poll_interval_s, exc.retry_in_s)
+                await asyncio.sleep(min(pause, max(0.0, deadline - loop.time())))
+                continue
             if st.settled:
                 if not st.success:
                     raise RelayError(
@@ -2,36 +2,120 @@
 
 Used for: EOA nonces + code checks (EIP-7702 authorizations), gas estimation,
 direct-route broadcasting, and receipt polling.
+
+Given several endpoint URLs the client routes each read to the endpoint with
+the lowest recent latency (an EWMA of successful calls) and fails over to the
+next one on transport errors, 429 and 5xx. An endpoint that fails
+``eject_after`` times in a row is ejected for ``eject_s``; afterwards it is
+tried again and a success restores it. ``send_raw_transaction`` broadcasts
+to every healthy endpoint at once and returns the first accepted hash.
+Per-endpoint latency and error counts are in :attr:`JsonRpcClient.endpoints`.
 """
 
 from __future__ import annotations
 
 import asyncio
 import itertools
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
+from eth_utils import keccak
 
 from ..errors import RpcError, TransactionRevertedError
 
 _ids = itertools.count(1)
 
 
+@dataclass
+class RpcEndpoint:
+    url: str
+    latency_ms: float | None = None  # EWMA over successful calls
+    requests: int = 0
+    errors: int = 0
+    consecutive_errors: int = 0
+    ejected_until: float = 0.0
+
+    def healthy(self, now: float) -> bool:
+        return self.ejected_until <= now
+
+
+class _EndpointDown(RpcError):
+    """The endpoint itself failed (transport, 429/5xx, garbage body)."""
+
+
 class JsonRpcClient:
-    def __init__(self, url: str, timeout_s: float = 30.0) -> None:
-        self.url = url
+    def __init__(
+        self,
+        url: str | Sequence[str],
+        timeout_s: float = 30.0,
+        *,
+        ewma_alpha: float = 0.2,
+        eject_after: int = 3,
+        eject_s: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        urls = [url] if isinstance(url, str) else list(dict.fromkeys(url))
+        if not urls:
+            raise ValueError("JsonRpcClient needs at least one URL")
+        self.url = urls[0]
+        self.endpoints = [RpcEndpoint(u) for u in urls]
+        self.ewma_alpha = ewma_alpha
+        self.eject_after = eject_after
+        self.eject_s = eject_s
+        self._clock = clock
         self._client = httpx.AsyncClient(timeout=timeout_s)
 
     async def aclose(self) -> None:
         await self._client.aclose()
 
-    async def call(self, method: str, params: list[Any] | None = None) -> Any:
-        payload = {"jsonrpc": "2.0", "id": next(_ids), "method": method, "params": params or []}
+    # -- routing -----------------------------------------------------------------
+
+    def _ranked(self) -> list[RpcEndpoint]:
+        """Healthy endpoints fastest first (unmeasured ones before any
+        measured), then ejected ones by how soon they return."""
+        now = self._clock()
+        healthy = [e for e in self.endpoints if e.healthy(now)]
+        ejected = [e for e in self.endpoints if not e.healthy(now)]
+        healthy.sort(key=lambda e: e.latency_ms or 0.0)
+        ejected.sort(key=lambda e: e.ejected_until)
+        return healthy + ejected
+
+    def _record(self, endpoint: RpcEndpoint, started: float, *, ok: bool) -> None:
+        endpoint.requests += 1
+        if ok:
+            ms = (self._clock() - started) * 1000
+            endpoint.latency_ms = (
+                ms
+                if endpoint.latency_ms is None
+                else self.ewma_alpha * ms + (1 - self.ewma_alpha) * endpoint.latency_ms
+            )
+            endpoint.consecutive_errors = 0
+            return
+        endpoint.errors += 1
+        endpoint.consecutive_errors += 1
+        if endpoint.consecutive_errors >= self.eject_after:
+            endpoint.ejected_until = self._clock() + self.eject_s
+
+    async def _post(self, endpoint: RpcEndpoint, method: str, params: list[Any]) -> Any:
+        payload = {"jsonrpc": "2.0", "id": next(_ids), "method": method, "params": params}
+        started = self._clock()
         try:
-            resp = await self._client.post(self.url, json=payload)
+            resp = await self._client.post(endpoint.url, json=payload)
         except httpx.TransportError as exc:
-            raise RpcError(f"RPC transport error ({method}): {exc}") from exc
-        body = resp.json()
+            self._record(endpoint, started, ok=False)
+            raise _EndpointDown(f"RPC transport error ({method}): {exc}") from exc
+        if resp.status_code == 429 or resp.status_code >= 500:
+            self._record(endpoint, started, ok=False)
+            raise _EndpointDown(f"RPC HTTP {resp.status_code} ({method}) from {endpoint.url}")
+        try:
+            body = resp.json()
+        except ValueError as exc:
+            self._record(endpoint, started, ok=False)
+            raise _EndpointDown(f"non-JSON RPC response ({method}) from {endpoint.url}") from exc
+        self._record(endpoint, started, ok=True)
         if "error" in body and body["error"]:
             err = body["error"]
             raise RpcError(
@@ -41,6 +125,17 @@ class JsonRpcClient:
             )
         return body.get("result")
 
+    async def call(self, method: str, params: list[Any] | None = None) -> Any:
+        """Send to the fastest healthy endpoint, failing over down the ranking."""
+        failure: RpcError | None = None
+        for endpoint in self._ranked():
+            try:
+                return await self._post(endpoint, method, params or [])
+            except _EndpointDown as exc:
+                failure = exc
+        assert failure is not None
+        raise failure
+
     # -- typed helpers ---------------------------------------------------------
 
     async def chain_id(self) -> int:
@@ -69,8 +164,34 @@ class JsonRpcClient:
         return base_fee * 2 + priority, priority
 
     async def send_raw_transaction(self, raw: bytes | str) -> str:
+        """Broadcast to every healthy endpoint concurrently; the first accepted
+        hash wins (an "already known" reply counts as accepted)."""
         raw_hex = raw if isinstance(raw, str) else "0x" + raw.hex()
-        return await self.call("eth_sendRawTransaction", [raw_hex])
+        now = self._clock()
+        ranked = self._ranked()
+        targets = [e for e in ranked if e.healthy(now)] or ranked[:1]
+        tasks = [
+            asyncio.create_task(self._post(e, "eth_sendRawTransaction", [raw_hex]))
+            for e in targets
+        ]
+        errors: list[RpcError] = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    return await next_done
+                except RpcError as exc:
+                    if "already known" in str(exc).lower():
+                        return "0x" + keccak(hexstr=raw_hex).hex()
+                    errors.append(exc)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        # A node's verdict on the tx (nonce, funds) beats "endpoint down".
+        raise next((e for e in errors if not isinstance(e, _EndpointDown)), errors[0])
+
+    async def get_transaction(self, tx_hash: str) -> dict[str, Any] | None:
+        return await self.call("eth_getTransactionByHash", [tx_hash])
 
     async def get_receipt(self, tx_hash: str) -> dict[str, Any] | None:
         return await self.call("eth_getTransactionReceipt", [tx_hash])
@@ -1,5 +1,6 @@
 from .api import InfoApi
+from .history import HistoryStore
 from .lp import LpApi
 from .referral import ReferralApi
 
-__all__ = ["InfoApi", "LpApi", "ReferralApi"]
+__all__ = ["InfoApi", "HistoryStore", "LpApi", "ReferralApi"]
@@ -7,9 +7,12 @@ Human units throughout (per the v2 history swagger).
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Any
 
+from .._aio import iter_pages
 from ..config import AvantisConfig
+from ..ratelimit import Priority
 from ..transport import HttpTransport
 
 
@@ -26,15 +29,48 @@ class InfoApi:
 
     # ------------------------------------------------------------------ history
 
-    async def trade_history(self, trader: str, page: int = 0, limit: int = 20) -> Any:
+    async def trade_history(
+        self, trader: str, page: int = 0, limit: int = 20, *, priority: Priority | None = None
+    ) -> Any:
         """Fill history with full fee breakdown (gross/net PnL, fees, funding)."""
         return await self._t.json(
-            "GET", self._v2(f"/history/trade-history/{trader}/{page}/{limit}")
+            "GET",
+            self._v2(f"/history/trade-history/{trader}/{page}/{limit}"),
+            priority=priority,
         )
 
-    async def order_history(self, trader: str, page: int = 0, limit: int = 20) -> Any:
+    async def order_history(
+        self, trader: str, page: int = 0, limit: int = 20, *, priority: Priority | None = None
+    ) -> Any:
         return await self._t.json(
-            "GET", self._v2(f"/history/order-history/{trader}/{page}/{limit}")
+            "GET",
+            self._v2(f"/history/order-history/{trader}/{page}/{limit}"),
+            priority=priority,
+        )
+
+    def iter_trade_history(
+        self, trader: str, *, page_size: int = 100, prefetch: int = 4
+    ) -> AsyncIterator[Any]:
+        """Every fill, newest first, ``prefetch`` pages requested ahead at
+        ``Priority.BACKGROUND`` (behind orders and reads when rate limited).
+
+        >>> async for trade in client.info.iter_trade_history(trader):
+        ...     ...
+        """
+        return iter_pages(
+            lambda page: self.trade_history(trader, page, page_size, priority=Priority.BACKGROUND),
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_order_history(
+        self, trader: str, *, page_size: int = 100, prefetch: int = 4
+    ) -> AsyncIterator[Any]:
+        """Every order-history record, paged like :meth:`iter_trade_history`."""
+        return iter_pages(
+            lambda page: self.order_history(trader, page, page_size, priority=Priority.BACKGROUND),
+            page_size=page_size,
+            prefetch=prefetch,
         )
 
     async def recent_trades(self, pair_index: int) -> Any:
@@ -1,9 +1,23 @@
 from .api import MarketsApi
+from .candles import CandleSeries, CandleStore
+from .fills import ProvisionalFill, apply_fills, parse_fill
 from .models import UPSIDE_SUFFIX, PairInfo, TradingSnapshot, strip_upside_suffix
+from .orderbook import BookDepth, OrderbookModel
+from .quote import PreTradeQuote, QuoteRequest, build_quote
 
 __all__ = [
     "MarketsApi",
+    "CandleSeries",
+    "CandleStore",
+    "BookDepth",
+    "ProvisionalFill",
+    "apply_fills",
+    "parse_fill",
+    "OrderbookModel",
     "PairInfo",
+    "PreTradeQuote",
+    "QuoteRequest",
+    "build_quote",
     "TradingSnapshot",
     "UPSIDE_SUFFIX",
     "strip_upside_suffix",
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from decimal import Decimal
 from typing import Any
 
 from ..config import AvantisConfig
 from ..errors import ApiError, ConfigError
+from ..ratelimit import Priority
+from ..refresh import Refreshing
 from ..transport import HttpTransport
-from ..types import PRECISION_10, Num, to_api_num
+from ..types import PRECISION_10, BulkResult, Num, to_api_num
+from .candles import CandleStore
+from .fills import ProvisionalFill, apply_fills, parse_fill
 from .models import PairInfo, TradingSnapshot
+from .orderbook import OrderbookModel, aged
+from .quote import PreTradeQuote, QuoteRequest, build_quote
 
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 
@@ -32,6 +39,13 @@ def _to_raw10(value: Num) -> str:
     return str(int(Decimal(to_api_num(value)) * PRECISION_10))
 
 
+def _replay_error(exc: ApiError) -> ApiError:
+    """A fresh copy of a cached spread error (same type and attributes)."""
+    return type(exc)(
+        exc.args[0], code=exc.code, status=exc.status, details=exc.details, url=exc.url
+    )
+
+
 def _from_raw10(value: Any) -> float | None:
     try:
         return float(Decimal(str(value)) / PRECISION_10)
@@ -43,21 +57,142 @@ class MarketsApi:
     def __init__(self, config: AvantisConfig, transport: HttpTransport) -> None:
         self._cfg = config
         self._t = transport
-        self._snapshot: TradingSnapshot | None = None
-        self._snapshot_at: float = 0.0
-        self.snapshot_ttl_s: float = 5.0
+        # Stale-while-revalidate: past its TTL a value is still served while
+        # one background fetch replaces it; callers only wait when the cache
+        # is empty or older than max_stale_s. start_refresh() keeps them warm.
+        self._snapshots: Refreshing[TradingSnapshot] = Refreshing(
+            self._fetch_snapshot, ttl_s=5.0, max_stale_s=30.0
+        )
+        self._open_interests: Refreshing[dict[str, Any]] = Refreshing(
+            lambda: self._t.json("GET", f"{self._cfg.core_api_url}/v2/open-interests"),
+            ttl_s=1.0,
+            max_stale_s=5.0,
+        )
+        self._orderbooks: Refreshing[Any] = Refreshing(
+            self._fetch_orderbooks, ttl_s=1.0, max_stale_s=5.0
+        )
+        self._orderbooks_at = 0.0  # monotonic time the cached books arrived
+        # Our own fills layered over the snapshot until a newer one (fetched
+        # after the fill, different dataVersion) includes them; fill_ttl_s
+        # caps how long one can linger if the data API lags.
+        self.fill_ttl_s: float = 30.0
+        self._fills: list[ProvisionalFill] = []
+        self._adjusted: TradingSnapshot | None = None
+        # Spread quotes (incl. 403 blocked / 404 no-spread outcomes) are
+        # reused for spread_ttl_s, keyed by coin size rounded to
+        # spread_size_digits significant digits; 0 disables the cache.
+        self.spread_ttl_s: float = 1.0
+        self.spread_size_digits: int = 3
+        self.spread_max_in_flight: int = 8
+        self._spread_cache: dict[tuple, tuple[float, dict[str, Any] | ApiError]] = {}
+        self._spread_gate: asyncio.Semaphore | None = None
+        # The last last_prices() read, so quote_many can size a market spread
+        # quote without waiting for its own price read (see _recent_price).
+        self._last_prices: tuple[float, dict[int, float]] | None = None
 
     # ------------------------------------------------------------------ snapshot
 
+    @property
+    def snapshot_ttl_s(self) -> float:
+        return self._snapshots.ttl_s
+
+    @snapshot_ttl_s.setter
+    def snapshot_ttl_s(self, value: float) -> None:
+        self._snapshots.ttl_s = value
+        if self._snapshots.max_stale_s is not None:
+            self._snapshots.max_stale_s = max(self._snapshots.max_stale_s, value)
+
+    @property
+    def refreshers(self) -> dict[str, Refreshing[Any]]:
+        """The stale-while-revalidate caches behind :meth:`snapshot`,
+        :meth:`open_interests` and :meth:`orderbook_snapshots` (TTLs,
+        ``age_s``, ``last_error``)."""
+        return {
+            "snapshot": self._snapshots,
+            "open_interests": self._open_interests,
+            "orderbook_snapshots": self._orderbooks,
+        }
+
+    def start_refresh(self) -> None:
+        """Refresh the snapshot, open interests and orderbooks in the
+        background, ahead of expiry, so reads never wait on the network."""
+        for cache in self.refreshers.values():
+            cache.start()
+
+    async def stop_refresh(self) -> None:
+        for cache in self.refreshers.values():
+            await cache.stop()
+
     async def snapshot(self, *, force: bool = False) -> TradingSnapshot:
-        """Full /v2/trading snapshot (cached for snapshot_ttl_s)."""
+        """Full /v2/trading snapshot (fresh for snapshot_ttl_s, then served
+        stale while it is refetched in the background)."""
+        snapshot = await self._snapshots.get(force=force)
+        if self._fills:
+            self._reconcile_fills()
+        if not self._fills:
+            return snapshot
+        if self._adjusted is None:
+            self._adjusted = apply_fills(snapshot, self._fills)
+        return self._adjusted
+
+    async def _fetch_snapshot(self) -> TradingSnapshot:
+        started = time.monotonic()
+        data = await self._t.json("GET", f"{self._cfg.data_api_url}/v2/trading", hedge="trading")
+        payload = data.get("data", data) if isinstance(data, dict) else data
+        snapshot = TradingSnapshot.model_validate(payload)
+        self._reconcile_fills(fetched_at=started, version=snapshot.data_version)
+        return snapshot
+
+    def apply_fill(
+        self, event: Any, *, closing: bool | None = None
+    ) -> ProvisionalFill | None:
+        """Count one of our fills in the snapshot's OI before the data API does.
+
+        ``event`` is a batched-market terminal (``BatchedMarketEvent``, or its
+        type and payload as ``(type, data)``); anything but a
+        ``MarketOrderExecuted`` / ``PositionSizeIncreased`` with a trade tuple
+        is ignored, so the method can be passed straight as ``on_event=``.
+        ``closing`` overrides the open/close inference of :func:`parse_fill`.
+        The fill stays applied to :meth:`snapshot` (and so to headroom, skew
+        fees and quotes) until an authoritative snapshot fetched after it
+        carries a new ``dataVersion``, or for at most ``fill_ttl_s``.
+        """
+        event_type, data = event if isinstance(event, tuple) else (event.type, event.data)
+        fill = parse_fill(event_type, data, closing=closing)
+        if fill is None:
+            return None
+        fill.applied_at = time.monotonic()
+        current = self._snapshots.peek()
+        fill.data_version = current.data_version if current else None
+        self._fills.append(fill)
+        self._adjusted = None
+        return fill
+
+    @property
+    def provisional_fills(self) -> list[ProvisionalFill]:
+        """Fills currently layered over the snapshot, oldest first."""
+        return list(self._fills)
+
+    def _reconcile_fills(
+        self, *, fetched_at: float | None = None, version: int | None = None
+    ) -> None:
         now = time.monotonic()
-        if force or self._snapshot is None or now - self._snapshot_at > self.snapshot_ttl_s:
-            data = await self._t.json("GET", f"{self._cfg.data_api_url}/v2/trading")
-            payload = data.get("data", data) if isinstance(data, dict) else data
-            self._snapshot = TradingSnapshot.model_validate(payload)
-            self._snapshot_at = now
-        return self._snapshot
+        if fetched_at is None:
+            current = self._snapshots.peek()
+            version = current.data_version if current else None
+        kept = [
+            fill
+            for fill in self._fills
+            if now - fill.applied_at <= self.fill_ttl_s
+            and not (
+                fetched_at is not None
+                and fetched_at > fill.applied_at
+                and (version is None or version != fill.data_version)
+            )
+        ]
+        if fetched_at is not None or len(kept) != len(self._fills):
+            self._adjusted = None
+        self._fills = kept
 
     async def pairs(self) -> dict[int, PairInfo]:
         return (await self.snapshot()).pairs
@@ -110,14 +245,34 @@ class MarketsApi:
     async def price(self, pair: str | int) -> float:
         """Latest price for a pair via feed-v3 last-price."""
         info = await self.pair(pair)
+        prices = await self.last_prices()
+        if info.index not in prices:
+            raise ApiError(f"no last price for pair {info.symbol}")
+        return prices[info.index]
+
+    async def last_prices(self) -> dict[int, float]:
+        """Latest price of every pair (one feed-v3 last-price read)."""
         data = await self._t.json(
-            "GET", f"{self._cfg.feed_url}/v1/price-feeds/last-price"
+            "GET", f"{self._cfg.feed_url}/v1/price-feeds/last-price", hedge="last-price"
         )
         rows = data if isinstance(data, list) else data.get("data", [])
-        for row in rows:
-            if row.get("pairIndex") == info.index:
-                return float(row["c"])
-        raise ApiError(f"no last price for pair {info.symbol}")
+        prices = {
+            int(row["pairIndex"]): float(row["c"])
+            for row in rows
+            if row.get("pairIndex") is not None and row.get("c") is not None
+        }
+        self._last_prices = (time.monotonic(), prices)
+        return prices
+
+    def _recent_price(self, pair_index: int) -> float | None:
+        """The pair's price from a :meth:`last_prices` read no older than
+        ``spread_ttl_s`` (the staleness a cached spread quote already has)."""
+        if self._last_prices is None:
+            return None
+        read_at, prices = self._last_prices
+        if time.monotonic() - read_at > self.spread_ttl_s:
+            return None
+        return prices.get(pair_index)
 
     async def price_update_data(self, pair: str | int) -> dict[str, Any]:
         """Pyth price update bytes (core + pro) for on-chain calls."""
@@ -138,6 +293,8 @@ class MarketsApi:
         order_type: int | str = "market",
         wanted_price: Num | None = None,
         trader: str | None = None,
+        reference_price: Num | None = None,
+        fresh: bool = False,
     ) -> dict[str, Any]:
         """Quoted spread from the risk-engine v2 spread API (``POST /spread``).
 
@@ -164,6 +321,15 @@ class MarketsApi:
         404 = mechanism matched but no spread computable; treat as
         "do not execute", never as zero spread.
 
+        Quotes are cached for ``spread_ttl_s`` (default 1s) per pair, side,
+        open/close, order type, wanted price, trader and coin size rounded
+        to ``spread_size_digits`` significant digits; 403 and 404 outcomes
+        are cached too and re-raised, so a tight retry loop does not hammer
+        the engine. ``fresh=True`` bypasses the cache. At most
+        ``spread_max_in_flight`` quotes are in flight per client.
+        ``reference_price`` replaces the feed-price lookup when deriving the
+        coin size from collateral + leverage (see :meth:`spread_ladder`).
+
         Deployment note: routed at ``{api_base_url}/risk/v2``; live on
         testnet. The mainnet route exists but the engine is not serving yet
         (5xx until the v2 cutover); use :meth:`dynamic_spread` there in the
@@ -174,11 +340,12 @@ class MarketsApi:
         if coin_size is None:
             if collateral is None or leverage is None:
                 raise ApiError("spread() needs coin_size or collateral+leverage")
-            ref_price = (
-                Decimal(to_api_num(wanted_price))
-                if wanted_price is not None
-                else Decimal(repr(await self.price(info.index)))
-            )
+            if wanted_price is not None:
+                ref_price = Decimal(to_api_num(wanted_price))
+            elif reference_price is not None:
+                ref_price = Decimal(to_api_num(reference_price))
+            else:
+                ref_price = Decimal(repr(await self.price(info.index)))
             if ref_price <= 0:
                 raise ApiError(f"no reference price for pair {info.symbol}")
             coin_size = (
@@ -209,9 +376,37 @@ class MarketsApi:
         if wanted_price is not None:
             body["wantedPrice10"] = _to_raw10(wanted_price)
 
-        data = await self._t.json(
-            "POST", f"{self._cfg.risk_v2_api_url}/spread", json=body
+        key = (
+            info.index,
+            is_long,
+            is_open,
+            order_type_int,
+            float(f"{Decimal(to_api_num(coin_size)):.{self.spread_size_digits}g}"),
+            body.get("wantedPrice10"),
+            body["trader"].lower(),
         )
+        if self.spread_ttl_s > 0 and not fresh:
+            hit = self._spread_cache.get(key)
+            if hit is not None and hit[0] > time.monotonic():
+                if isinstance(hit[1], ApiError):
+                    raise _replay_error(hit[1])
+                return dict(hit[1])
+
+        if self._spread_gate is None:
+            self._spread_gate = asyncio.Semaphore(self.spread_max_in_flight)
+        try:
+            async with self._spread_gate:
+                # A read despite the POST: queue it with reads, not orders.
+                data = await self._t.json(
+                    "POST",
+                    f"{self._cfg.risk_v2_api_url}/spread",
+                    json=body,
+                    priority=Priority.READ,
+                )
+        except ApiError as exc:
+            if exc.status in (403, 404):
+                self._cache_spread(key, exc)
+            raise
 
         out = dict(data)
         without_flow = _from_raw10(out.get("spreadPctWithoutFlow10"))
@@ -220,22 +415,102 @@ class MarketsApi:
         out["estimatedSpreadPctWithFlow"] = with_flow
         quoted = with_flow if with_flow is not None else without_flow
         out["spreadPct"] = quoted if quoted is not None else 0.0
-        return out
+        self._cache_spread(key, out)
+        return dict(out)
 
-    async def open_interests(self) -> dict[str, Any]:
-        """Live per-pair long/short OI incl. pending amounts and the
-        market-maker breakdown (core ``GET /v2/open-interests``)."""
-        return await self._t.json(
-            "GET", f"{self._cfg.core_api_url}/v2/open-interests"
+    def _cache_spread(self, key: tuple, outcome: dict[str, Any] | ApiError) -> None:
+        if self.spread_ttl_s <= 0:
+            return
+        now = time.monotonic()
+        if len(self._spread_cache) >= 4096:
+            self._spread_cache = {
+                k: v for k, v in self._spread_cache.items() if v[0] > now
+            }
+        self._spread_cache[key] = (now + self.spread_ttl_s, outcome)
+
+    async def spread_ladder(
+        self,
+        pair: str | int,
+        sizes: list[Num],
+        *,
+        is_long: bool,
+        notional_usd: bool = False,
+        reference_price: Num | None = None,
+        is_open: bool = True,
+        order_type: int | str = "market",
+        trader: str | None = None,
+        fresh: bool = False,
+    ) -> list[BulkResult[dict[str, Any]]]:
+        """Spread quotes for many sizes of one pair, fired concurrently.
+
+        ``sizes`` are coin sizes, or USD notionals with ``notional_usd=True``
+        (converted with ONE shared reference price: ``reference_price`` or a
+        single feed read). Quotes share the client-wide
+        ``spread_max_in_flight`` cap and the quote cache; results keep input
+        order, a 403/404 (or any error) lands in its slot's ``error``.
+        """
+        info = await self.pair(pair)
+        coin_sizes: list[Num] = list(sizes)
+        if notional_usd:
+            ref = Decimal(
+                to_api_num(reference_price)
+                if reference_price is not None
+                else repr(await self.price(info.index))
+            )
+            if ref <= 0:
+                raise ApiError(f"no reference price for pair {info.symbol}")
+            coin_sizes = [Decimal(to_api_num(size)) / ref for size in sizes]
+        outcomes = await asyncio.gather(
+            *(
+                self.spread(
+                    info.index,
+                    is_long=is_long,
+                    coin_size=coin,
+                    is_open=is_open,
+                    order_type=order_type,
+                    trader=trader,
+                    fresh=fresh,
+                )
+                for coin in coin_sizes
+            ),
+            return_exceptions=True,
         )
+        return [
+            BulkResult.of(size, outcome)
+            for size, outcome in zip(sizes, outcomes, strict=True)
+        ]
 
-    async def orderbook_snapshots(self) -> Any:
+    async def open_interests(self, *, force: bool = False) -> dict[str, Any]:
+        """Live per-pair long/short OI incl. pending amounts and the
+        market-maker breakdown (core ``GET /v2/open-interests``; cached
+        like :meth:`snapshot`, 1 s TTL)."""
+        return await self._open_interests.get(force=force)
+
+    async def orderbook_snapshots(self, *, force: bool = False) -> Any:
         """Cumulative bid/ask coin liquidity per pair and orderbook source
-        (risk-engine v2 ``GET /orderbook/snapshots``); ``ageMs`` flags
-        staleness."""
-        return await self._t.json(
-            "GET", f"{self._cfg.risk_v2_api_url}/orderbook/snapshots"
-        )
+        (risk-engine v2 ``GET /orderbook/snapshots``; cached like
+        :meth:`snapshot`, 1 s TTL); ``ageMs`` flags staleness and includes
+        the time the payload has spent in the cache."""
+        books = await self._orderbooks.get(force=force)
+        return aged(books, int((time.monotonic() - self._orderbooks_at) * 1000))
+
+    def orderbook_model(self, **kwargs: Any) -> OrderbookModel:
+        """An :class:`OrderbookModel` over :meth:`orderbook_snapshots` (local
+        size pre-screening before :meth:`spread`). The model polls on its
+        own ``refresh_s`` and its fetches also refresh the shared cache."""
+
+        async def fetch() -> Any:
+            started = time.monotonic()
+            books = await self._fetch_orderbooks()
+            self._orderbooks.put(books, fetched_at=started)
+            return books
+
+        return OrderbookModel(fetch, **kwargs)
+
+    async def _fetch_orderbooks(self) -> Any:
+        books = await self._t.json("GET", f"{self._cfg.risk_v2_api_url}/orderbook/snapshots")
+        self._orderbooks_at = time.monotonic()
+        return books
 
     async def dynamic_spread(
         self,
@@ -300,3 +575,157 @@ class MarketsApi:
             f"{self._cfg.feed_url}/v1/shims/tradingview/history",
             params={"symbol": symbol, "resolution": resolution, "from": start, "to": end},
         )
+
+    def candle_store(self, path: str = ":memory:", **kwargs: Any) -> CandleStore:
+        """A :class:`CandleStore` over :meth:`candles`, persisted at ``path``
+        (fetches only the ranges not already on disk)."""
+        return CandleStore(self.candles, path, **kwargs)
+
+    # ------------------------------------------------------------------ pre-trade
+
+    async def quote(
+        self,
+        pair: str | int,
+        *,
+        is_long: bool,
+        collateral: float,
+        leverage: float,
+        limit_price: float | None = None,
+        take_profit_percent: float | None = None,
+        stop_loss_percent: float | None = None,
+        wallet_oi: float = 0.0,
+        open_trades_on_pair: int = 0,
+        trader: str | None = None,
+    ) -> PreTradeQuote:
+        """Price, spread, open fee, OI headroom, liquidation estimate and
+        ``validate_order`` for one prospective open, in one call.
+
+        The snapshot and last-price reads run concurrently. The spread quote
+        does not wait for the price read: a limit quote is sized at
+        ``limit_price``, a market quote at a last price read within
+        ``spread_ttl_s``, and only a market quote with no such price waits
+        for the read. A limit quote is validated against the last price (a
+        long limit must sit below it, a short limit above). ``timings_ms``
+        reports each leg plus ``compute`` and ``total``. A 403/404 spread
+        outcome lands in ``spread_error`` (and in ``validation.errors``)
+        instead of raising.
+        """
+        [outcome] = await self.quote_many(
+            [
+                QuoteRequest(
+                    pair=pair,
+                    is_long=is_long,
+                    collateral=collateral,
+                    leverage=leverage,
+                    limit_price=limit_price,
+                    take_profit_percent=take_profit_percent,
+                    stop_loss_percent=stop_loss_percent,
+                    wallet_oi=wallet_oi,
+                    open_trades_on_pair=open_trades_on_pair,
+                )
+            ],
+            trader=trader,
+        )
+        if outcome.error is not None:
+            raise outcome.error
+        assert outcome.result is not None
+        return outcome.result
+
+    async def quote_many(
+        self, requests: list[QuoteRequest], *, trader: str | None = None
+    ) -> list[BulkResult[PreTradeQuote]]:
+        """:meth:`quote` for many candidate orders: one snapshot, one
+        last-price read for all pairs, every spread quote in parallel (under
+        ``spread_max_in_flight``) and, where :meth:`quote` allows, alongside
+        the price read. Results keep input order; a request that
+        cannot be quoted at all (unknown pair, no price) gets ``error``."""
+        started = time.perf_counter()
+        timings: dict[str, float] = {}
+
+        async def _timed(name: str, aw: Any) -> Any:
+            t0 = time.perf_counter()
+            try:
+                return await aw
+            finally:
+                timings[name] = (time.perf_counter() - t0) * 1000
+
+        async def _prices() -> dict[int, float]:
+            try:
+                return await self.last_prices()
+            except ApiError:
+                if any(r.limit_price is None for r in requests):
+                    raise
+                return {}  # limit-only batch: quoted without the direction check
+
+        snapshot_leg = asyncio.ensure_future(_timed("snapshot", self.snapshot()))
+        price_leg = asyncio.ensure_future(_timed("price", _prices()))
+
+        async def _spread(
+            info: PairInfo, request: QuoteRequest, reference: float
+        ) -> tuple[dict[str, Any] | ApiError, float]:
+            t0 = time.perf_counter()
+            try:
+                spread: dict[str, Any] | ApiError = await self.spread(
+                    info.index,
+                    is_long=request.is_long,
+                    collateral=request.collateral,
+                    leverage=request.leverage,
+                    order_type="market" if request.limit_price is None else "limit",
+                    wanted_price=request.limit_price,
+                    reference_price=reference,
+                    trader=trader,
+                )
+            except ApiError as exc:
+                if exc.status not in (403, 404):
+                    raise
+                spread = exc
+            return spread, (time.perf_counter() - t0) * 1000
+
+        async def _one(request: QuoteRequest) -> PreTradeQuote:
+            snapshot = await snapshot_leg
+            info = (
+                snapshot.pairs.get(request.pair)
+                if isinstance(request.pair, int)
+                else snapshot.pair_by_symbol(request.pair)
+            )
+            if info is None:
+                raise ApiError(f"unknown pair {request.pair!r}")
+            reference = request.limit_price
+            if reference is None:
+                reference = self._recent_price(info.index)
+            if reference is None:
+                reference = (await price_leg).get(info.index)
+                if reference is None:
+                    raise ApiError(f"no last price for pair {info.symbol}")
+            spread_leg = asyncio.ensure_future(_spread(info, request, reference))
+            try:
+                prices = await price_leg
+            except BaseException:
+                spread_leg.cancel()
+                raise
+            spread, spread_ms = await spread_leg
+            t0 = time.perf_counter()
+            out = build_quote(
+                info, snapshot, request, price=prices.get(info.index), spread=spread
+            )
+            out.timings_ms = {
+                **timings,
+                "spread": spread_ms,
+                "compute": (time.perf_counter() - t0) * 1000,
+                "total": (time.perf_counter() - started) * 1000,
+            }
+            return out
+
+        try:
+            outcomes = await asyncio.gather(
+                *(_one(r) for r in requests), return_exceptions=True
+            )
+            # a failed snapshot or price read fails the whole batch
+            await asyncio.gather(snapshot_leg, price_leg)
+        finally:
+            snapshot_leg.cancel()
+            price_leg.cancel()
+        return [
+            BulkResult.of(request, outcome)
+            for request, outcome in zip(requests, outcomes, strict=True)
+        ]
@@ -0,0 +1,229 @@
+"""Persistent local candle store with incremental gap-filling.
+
+``MarketsApi.candles`` asks the feed-v3 TradingView shim for the whole
+window on every call. :class:`CandleStore` keeps the bars in SQLite keyed by
+(symbol, resolution) together with the time ranges already fetched, so a
+request downloads only the ranges it has never seen and serves the rest
+from disk. Bots restarting every few minutes re-fetch just the tail.
+
+The bar still forming at fetch time is stored but never marked as covered,
+so the next request refreshes it. Range queries return a
+:class:`CandleSeries` of typed ``array`` columns (contiguous doubles/int64),
+which wrap zero-copy into NumPy/pandas where those are installed, e.g.
+``numpy.frombuffer(series.close)``.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from array import array
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from .._aio import gather_bounded
+from ..errors import ApiError, ConfigError
+
+FetchCandles = Callable[[str, str, int, int], Awaitable[Any]]
+
+# TradingView resolution strings -> bar length in seconds.
+RESOLUTION_SECONDS = {
+    "1": 60,
+    "3": 180,
+    "5": 300,
+    "15": 900,
+    "30": 1800,
+    "60": 3600,
+    "120": 7200,
+    "240": 14400,
+    "360": 21600,
+    "720": 43200,
+    "D": 86400,
+    "1D": 86400,
+    "W": 604800,
+    "1W": 604800,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+    symbol TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    t INTEGER NOT NULL,
+    o REAL NOT NULL,
+    h REAL NOT NULL,
+    l REAL NOT NULL,
+    c REAL NOT NULL,
+    v REAL NOT NULL,
+    PRIMARY KEY (symbol, resolution, t)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    symbol TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    PRIMARY KEY (symbol, resolution, start)
+) WITHOUT ROWID;
+"""
+
+
+def resolution_seconds(resolution: str) -> int:
+    try:
+        return RESOLUTION_SECONDS[str(resolution).upper()]
+    except KeyError:
+        raise ConfigError(
+            f"unsupported candle resolution {resolution!r}; "
+            f"use one of {sorted(RESOLUTION_SECONDS)}"
+        ) from None
+
+
+@dataclass
+class CandleSeries:
+    """Columnar OHLCV bars (``time`` in unix seconds, ascending)."""
+
+    time: array = field(default_factory=lambda: array("q"))
+    open: array = field(default_factory=lambda: array("d"))
+    high: array = field(default_factory=lambda: array("d"))
+    low: array = field(default_factory=lambda: array("d"))
+    close: array = field(default_factory=lambda: array("d"))
+    volume: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def rows(self) -> Iterator[tuple[int, float, float, float, float, float]]:
+        return zip(
+            self.time, self.open, self.high, self.low, self.close, self.volume, strict=True
+        )
+
+
+class CandleStore:
+    """SQLite-backed cache in front of ``MarketsApi.candles``.
+
+    >>> store = client.markets.candle_store("candles.db")
+    >>> bars = await store.get("ETH/USD", "60", start, end)
+
+    Gaps are fetched in chunks of at most ``max_bars`` bars, at most
+    ``max_in_flight`` at a time.
+    """
+
+    def __init__(
+        self,
+        fetch: FetchCandles,
+        path: str = ":memory:",
+        *,
+        max_bars: int = 5000,
+        max_in_flight: int = 4,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._fetch = fetch
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+        self.max_bars = max_bars
+        self.max_in_flight = max_in_flight
+        self._clock = clock
+
+    def close(self) -> None:
+        self._db.close()
+
+    # ------------------------------------------------------------------ queries
+
+    async def get(self, symbol: str, resolution: str, start: int, end: int) -> CandleSeries:
+        """Bars with ``start <= time < end``: fetch the missing ranges, then
+        serve the whole window from disk."""
+        step = resolution_seconds(resolution)
+        start, end = start - start % step, -(-end // step) * step
+        chunk = self.max_bars * step
+        gaps = [
+            (lo, min(lo + chunk, hi))
+            for gap_lo, hi in self.missing(symbol, resolution, start, end)
+            for lo in range(gap_lo, hi, chunk)
+        ]
+        if gaps:
+            await gather_bounded(
+                (self._fill(symbol, resolution, lo, hi, step) for lo, hi in gaps),
+                self.max_in_flight,
+            )
+        return self.read(symbol, resolution, start, end)
+
+    def read(self, symbol: str, resolution: str, start: int, end: int) -> CandleSeries:
+        """Bars already on disk (no network)."""
+        series = CandleSeries()
+        rows = self._db.execute(
+            "SELECT t, o, h, l, c, v FROM candles WHERE symbol = ? AND resolution = ? "
+            "AND t >= ? AND t < ? ORDER BY t",
+            (symbol, resolution, start, end),
+        )
+        for t, o, h, low, c, v in rows:
+            series.time.append(t)
+            series.open.append(o)
+            series.high.append(h)
+            series.low.append(low)
+            series.close.append(c)
+            series.volume.append(v)
+        return series
+
+    def missing(self, symbol: str, resolution: str, start: int, end: int) -> list[tuple[int, int]]:
+        """Sub-ranges of [start, end) never fetched (or still open)."""
+        covered = self._db.execute(
+            "SELECT start, end FROM coverage WHERE symbol = ? AND resolution = ? "
+            "AND end > ? AND start < ? ORDER BY start",
+            (symbol, resolution, start, end),
+        ).fetchall()
+        gaps, cursor = [], start
+        for lo, hi in covered:
+            if lo > cursor:
+                gaps.append((cursor, lo))
+            cursor = max(cursor, hi)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    # ------------------------------------------------------------------ internal
+
+    async def _fill(self, symbol: str, resolution: str, start: int, end: int, step: int) -> None:
+        data = await self._fetch(symbol, resolution, start, end)
+        if not isinstance(data, dict) or data.get("s") not in ("ok", "no_data"):
+            message = data.get("errmsg") if isinstance(data, dict) else None
+            raise ApiError(f"candles {symbol} {resolution}: {message or 'bad response'}")
+        times = data.get("t") or []
+        volumes = data.get("v") or [0.0] * len(times)
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO candles VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (symbol, resolution, int(t), o, h, low, c, v)
+                    for t, o, h, low, c, v in zip(
+                        times,
+                        data.get("o") or [],
+                        data.get("h") or [],
+                        data.get("l") or [],
+                        data.get("c") or [],
+                        volumes,
+                        strict=True,
+                    )
+                    if start <= int(t) < end
+                ),
+            )
+            # the bar forming right now is not final: leave it uncovered
+            open_bar = int(self._clock()) // step * step
+            self._cover(symbol, resolution, start, min(end, open_bar))
+
+    def _cover(self, symbol: str, resolution: str, start: int, end: int) -> None:
+        if end <= start:
+            return
+        overlapping = self._db.execute(
+            "SELECT start, end FROM coverage WHERE symbol = ? AND resolution = ? "
+            "AND end >= ? AND start <= ?",
+            (symbol, resolution, start, end),
+        ).fetchall()
+        for lo, hi in overlapping:
+            start, end = min(start, lo), max(end, hi)
+        self._db.execute(
+            "DELETE FROM coverage WHERE symbol = ? AND resolution = ? "
+            "AND end >= ? AND start <= ?",
+            (symbol, resolution, start, end),
+        )
+        self._db.execute(
+            "INSERT INTO coverage VALUES (?, ?, ?, ?)", (symbol, resolution, start, end)
+        )
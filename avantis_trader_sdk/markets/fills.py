@@ -0,0 +1,160 @@
+"""Provisional open interest from our own fills.
+
+Between ``/v2/trading`` refreshes the snapshot's ``openInterest`` /
+``coinOI`` lag our own just-filled orders, so ``max_position_size`` and
+``skew_adjusted_open_fee`` over-state headroom and mis-price skew during a
+burst. The batched-market success terminals carry the final fill
+(``MarketOrderExecuted``: ``positionSizeUSDC`` + ``coinExposure``;
+``PositionSizeIncreased``: ``coinExposureAdded``, with the stored trade
+tuple ``t`` giving pair, side and open price). :func:`parse_fill` turns one into a
+:class:`ProvisionalFill` and :func:`apply_fills` layers those onto a copy of
+the snapshot: pair long/short OI (USDC and coin), pair, group and protocol
+OI.
+
+``MarketsApi.apply_fill`` keeps the list and serves the adjusted snapshot
+until the next authoritative one supersedes each fill (see
+``MarketsApi.snapshot``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from ..compute.liquidity import OiDelta
+from ..types import PRECISION_10, USDC_SCALE
+from .models import TradingSnapshot
+
+FILL_EVENTS = frozenset({"MarketOrderExecuted", "PositionSizeIncreased"})
+
+# positional layout of the stored trade tuple ``t`` (intents_schema Trade)
+_T_PAIR_INDEX, _T_OPEN_PRICE, _T_BUY = 1, 5, 6
+
+
+def _raw(value: Any, precision: Decimal) -> float:
+    try:
+        return float(Decimal(str(value)) / precision)
+    except (TypeError, ValueError, ArithmeticError):
+        return 0.0
+
+
+def _trade_field(trade: Any, name: str, position: int) -> Any:
+    if isinstance(trade, dict):
+        return trade.get(name)
+    if isinstance(trade, list | tuple) and len(trade) > position:
+        return trade[position]
+    return None
+
+
+def _as_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1")
+    return bool(value)
+
+
+@dataclass
+class ProvisionalFill:
+    """One of our fills not yet reflected in the snapshot (human units;
+    negative sizes for closes)."""
+
+    pair_index: int
+    is_long: bool
+    size_usdc: float
+    coin_size: float
+    tx_hash: str | None = None
+    applied_at: float = 0.0  # monotonic time it was recorded
+    data_version: int | None = None  # snapshot version it was applied over
+
+    @property
+    def oi_delta(self) -> OiDelta:
+        return OiDelta(self.pair_index, self.is_long, self.size_usdc)
+
+
+def parse_fill(
+    event_type: str, data: dict[str, Any], *, closing: bool | None = None
+) -> ProvisionalFill | None:
+    """The OI change of a fill terminal, or None for any other event, a
+    payload without pair/side, or a ``MarketOrderExecuted`` whose direction
+    is unknown.
+
+    ``closing`` defaults to the payload's ``open`` flag (the trade API's
+    market open/close calls add it to the events they pass to
+    ``on_event``); the payout cannot tell them apart, since a close at a full
+    loss sends nothing. ``PositionSizeIncreased`` carries no USDC size; the
+    added coin is valued at the trade tuple's (blended) ``openPrice``.
+    """
+    if event_type not in FILL_EVENTS:
+        return None
+    trade = data.get("t")
+    pair_index = _trade_field(trade, "pairIndex", _T_PAIR_INDEX)
+    buy = _trade_field(trade, "buy", _T_BUY)
+    if pair_index is None or buy is None:
+        return None
+    if event_type == "PositionSizeIncreased":
+        coin = _raw(data.get("coinExposureAdded"), PRECISION_10)
+        open_price = _trade_field(trade, "openPrice", _T_OPEN_PRICE)
+        usdc = coin * _raw(open_price, PRECISION_10)
+        closing = False
+    else:
+        coin = _raw(data.get("coinExposure"), PRECISION_10)
+        usdc = _raw(data.get("positionSizeUSDC"), USDC_SCALE)
+        if closing is None:
+            if "open" not in data:
+                return None
+            closing = not _as_bool(data["open"])
+    sign = -1.0 if closing else 1.0
+    tx_hash = data.get("transactionHash")
+    return ProvisionalFill(
+        pair_index=int(pair_index),
+        is_long=_as_bool(buy),
+        size_usdc=sign * usdc,
+        coin_size=sign * coin,
+        tx_hash=str(tx_hash) if tx_hash else None,
+    )
+
+
+def apply_fills(
+    snapshot: TradingSnapshot, fills: Iterable[ProvisionalFill]
+) -> TradingSnapshot:
+    """A copy of ``snapshot`` with ``fills`` added to its OI (the input is
+    left untouched; fills on unknown pairs are ignored)."""
+    fills = list(fills)
+    if not fills:
+        return snapshot
+    keys = {info.index: key for key, info in snapshot.pair_infos.items()}
+    pair_infos = dict(snapshot.pair_infos)
+    group_info = dict(snapshot.group_info)
+    total = snapshot.total_oi
+    for fill in fills:
+        key = keys.get(fill.pair_index)
+        if key is None:
+            continue
+        info = pair_infos[key]
+        if info is snapshot.pair_infos[key]:
+            info = pair_infos[key] = info.model_copy(
+                update={
+                    "open_interest": info.open_interest.model_copy(),
+                    "coin_oi": info.coin_oi.model_copy(),
+                }
+            )
+        side = "long" if fill.is_long else "short"
+        oi, coin = info.open_interest, info.coin_oi
+        setattr(oi, side, max(getattr(oi, side) + fill.size_usdc, 0.0))
+        setattr(coin, side, max(getattr(coin, side) + fill.coin_size, 0.0))
+        info.pair_oi = max(info.pair_oi + fill.size_usdc, 0.0)
+        group_key = str(info.group_index)
+        group = group_info.get(group_key)
+        if group is not None:
+            if group is snapshot.group_info[group_key]:
+                group = group_info[group_key] = group.model_copy()
+            group.group_oi = max(group.group_oi + fill.size_usdc, 0.0)
+        total += fill.size_usdc
+    return snapshot.model_copy(
+        update={
+            "pair_infos": pair_infos,
+            "group_info": group_info,
+            "total_oi": max(total, 0.0),
+        }
+    )
@@ -194,10 +194,13 @@ class PairInfo(BaseModel):
         """Market-hours check (forex/commodity groups use the feed schedule)."""
         import time
 
+        return self.market_open_at(time.time())
+
+    def market_open_at(self, now: float) -> bool:
+        """:attr:`is_market_open` at unix time ``now``."""
         attrs = self.feed.attributes
         if self.group_index not in (2, 3, 6):
             return True
-        now = time.time()
         is_open = attrs.is_open or (attrs.next_open > 0 and now > attrs.next_open)
         before_close = attrs.next_close == 0 or now < attrs.next_close
         return is_open and before_close
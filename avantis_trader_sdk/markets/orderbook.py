@@ -0,0 +1,218 @@
+"""Local depth model over the risk engine's orderbook snapshots.
+
+``MarketsApi.orderbook_snapshots`` returns, per pair and orderbook source,
+the cumulative coin liquidity on each side with its ``ageMs``.
+:class:`OrderbookModel` parses that into per-pair depth columns (typed
+``array``s, one slot per pair) and answers "what fraction of the visible
+book does coin size X consume" for many (pair, size, side) triples in one
+call, so sizes can be pre-screened locally and only the survivors sent to
+``markets.spread``.
+
+Sources whose book is older than ``stale_after_ms`` are left out of a
+pair's depth; a pair whose every source is stale keeps the stale depth but
+is flagged. Ages keep growing locally between refreshes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import time
+from array import array
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from .._aio import page_items
+
+
+def _num(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def aged(snapshots: Any, elapsed_ms: int) -> Any:
+    """A copy of an ``orderbook/snapshots`` payload with ``elapsed_ms`` added
+    to every ``ageMs``, for a payload served some time after it arrived."""
+    if elapsed_ms <= 0:
+        return snapshots
+    rows = page_items(snapshots)
+    out = [
+        dict(row, ageMs=_num(row["ageMs"]) + elapsed_ms)
+        if isinstance(row, dict) and row.get("ageMs") is not None
+        else row
+        for row in rows
+    ]
+    if isinstance(snapshots, dict):
+        return {k: out if v is rows else v for k, v in snapshots.items()}
+    return out if isinstance(snapshots, list) else snapshots
+
+
+@dataclass
+class BookDepth:
+    pair_index: int
+    bid: float  # cumulative coin liquidity a short sells into
+    ask: float  # cumulative coin liquidity a long buys from
+    age_ms: float
+    sources: int
+    stale: bool
+
+
+class OrderbookModel:
+    """Per-pair cumulative depth from ``orderbook_snapshots``.
+
+    >>> books = client.markets.orderbook_model()
+    >>> await books.refresh()        # or books.start() to keep it fresh
+    >>> books.impact([eth, eth, btc], [1, 50, 2], is_long=True)
+    array('d', [0.004, 0.2, 0.01])   # share of the ask depth consumed
+    >>> books.screen(eth, sizes, is_long=True, max_impact=0.1)
+
+    ``impact`` is ``size / depth`` on the side the order consumes (asks for
+    a long, bids for a short); ``inf`` where the pair has no book.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[Any]],
+        *,
+        stale_after_ms: float = 5000.0,
+        refresh_s: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetch = fetch
+        self.stale_after_ms = stale_after_ms
+        self.refresh_s = refresh_s
+        self._clock = clock
+        self._slots: dict[int, int] = {}
+        self._bid = array("d")
+        self._ask = array("d")
+        self._age = array("d")  # ageMs at load time
+        self._sources = array("i")
+        self._loaded_at = 0.0
+        self._task: asyncio.Task[None] | None = None
+        self.last_error: Exception | None = None
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    # ------------------------------------------------------------------ loading
+
+    def load(self, snapshots: Any) -> None:
+        """Replace the model with a ``GET /orderbook/snapshots`` payload."""
+        books: dict[int, list[tuple[float, float, float]]] = {}
+        for row in page_items(snapshots):
+            if not isinstance(row, dict) or row.get("pairIndex") is None:
+                continue
+            books.setdefault(int(row["pairIndex"]), []).append(
+                (
+                    _num(row.get("cumulativeCoinLiquidityBid")),
+                    _num(row.get("cumulativeCoinLiquidityAsk")),
+                    _num(row.get("ageMs")),
+                )
+            )
+        slots: dict[int, int] = {}
+        bid, ask, age, sources = array("d"), array("d"), array("d"), array("i")
+        for pair_index, rows in books.items():
+            fresh = [r for r in rows if r[2] <= self.stale_after_ms]
+            used = fresh or rows
+            slots[pair_index] = len(bid)
+            bid.append(sum(r[0] for r in used))
+            ask.append(sum(r[1] for r in used))
+            age.append(max(r[2] for r in used))
+            sources.append(len(used))
+        self._slots, self._bid, self._ask, self._age, self._sources = (
+            slots, bid, ask, age, sources,
+        )
+        self._loaded_at = self._clock()
+
+    async def refresh(self) -> None:
+        self.load(await self._fetch())
+
+    def start(self) -> None:
+        """Refresh every ``refresh_s`` in a background task (errors are kept
+        in :attr:`last_error`; the books just age until the next success)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+                self.last_error = None
+            except Exception as exc:  # keep serving the last books
+                self.last_error = exc
+            await asyncio.sleep(self.refresh_s)
+
+    # ------------------------------------------------------------------ queries
+
+    def _elapsed_ms(self) -> float:
+        return (self._clock() - self._loaded_at) * 1000
+
+    def depth(self, pair_index: int) -> BookDepth | None:
+        slot = self._slots.get(pair_index)
+        if slot is None:
+            return None
+        age = self._age[slot] + self._elapsed_ms()
+        return BookDepth(
+            pair_index,
+            self._bid[slot],
+            self._ask[slot],
+            age,
+            self._sources[slot],
+            age > self.stale_after_ms,
+        )
+
+    def stale(self, pair_indexes: Sequence[int]) -> list[bool]:
+        """Per pair: no book, or its book is older than ``stale_after_ms``."""
+        limit = self.stale_after_ms - self._elapsed_ms()
+        slots, ages = self._slots, self._age
+        return [
+            (slot := slots.get(p)) is None or ages[slot] > limit for p in pair_indexes
+        ]
+
+    def impact(
+        self,
+        pair_indexes: Sequence[int],
+        sizes: Sequence[float],
+        *,
+        is_long: bool | Sequence[bool],
+    ) -> array:
+        """``size / depth`` per (pair, size[, side]) triple, in input order."""
+        sides = [is_long] * len(sizes) if isinstance(is_long, bool) else is_long
+        slots, bid, ask = self._slots, self._bid, self._ask
+        out = array("d", bytes(8 * len(sizes)))
+        for i, (pair_index, size, long) in enumerate(
+            zip(pair_indexes, sizes, sides, strict=True)
+        ):
+            slot = slots.get(pair_index)
+            depth = 0.0 if slot is None else (ask[slot] if long else bid[slot])
+            out[i] = abs(float(size)) / depth if depth > 0 else math.inf
+        return out
+
+    def screen(
+        self,
+        pair_index: int,
+        sizes: Sequence[float],
+        *,
+        is_long: bool,
+        max_impact: float,
+        allow_stale: bool = False,
+    ) -> list[float]:
+        """The ``sizes`` worth quoting: impact within ``max_impact`` on a
+        fresh book (``allow_stale`` skips the age check)."""
+        if not allow_stale and self.stale([pair_index])[0]:
+            return []
+        impacts = self.impact([pair_index] * len(sizes), sizes, is_long=is_long)
+        return [
+            size for size, hit in zip(sizes, impacts, strict=True) if hit <= max_impact
+        ]
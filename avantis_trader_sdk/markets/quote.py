@@ -0,0 +1,141 @@
+"""Pre-trade quote: price, spread, fees, headroom, liquidation and validation
+in one result.
+
+Bots typically call ``markets.price``, ``markets.spread``,
+``compute.skew_adjusted_open_fee``, ``compute.max_position_size``,
+``compute.estimate_liquidation_price`` and ``compute.validate_order`` one
+after another. ``MarketsApi.quote`` / ``quote_many`` run the network legs
+concurrently (one last-price read for every pair in the batch, all spread
+quotes in parallel, the snapshot from its cache) and do the rest locally
+with :func:`build_quote`, reporting per-leg timings.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..compute.fees import skew_adjusted_open_fee
+from ..compute.liquidation import estimate_liquidation_price
+from ..compute.liquidity import max_position_size
+from ..compute.validation import OrderValidation, validate_order
+from ..errors import ApiError
+from .models import PairInfo, TradingSnapshot
+
+
+@dataclass
+class QuoteRequest:
+    """One candidate order for ``MarketsApi.quote_many``."""
+
+    pair: str | int
+    is_long: bool
+    collateral: float
+    leverage: float
+    limit_price: float | None = None
+    take_profit_percent: float | None = None
+    stop_loss_percent: float | None = None
+    wallet_oi: float = 0.0
+    open_trades_on_pair: int = 0
+
+
+@dataclass
+class PreTradeQuote:
+    pair: PairInfo
+    is_long: bool
+    collateral: float
+    leverage: float
+    price: float  # feed last price (the limit price if the feed had none)
+    entry_price: float  # limit price, else the last price
+    spread_p: float | None  # quoted spread %, None when unavailable
+    spread: dict[str, Any] | None
+    spread_error: ApiError | None
+    open_fee_p: float
+    open_fee: float  # USDC
+    max_position_size: float  # USDC headroom on this side
+    liquidation_price: float
+    validation: OrderValidation
+    timings_ms: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def position_size(self) -> float:
+        return self.collateral * self.leverage
+
+    @property
+    def ok(self) -> bool:
+        """Valid order with a spread quote (a 403/404 means do not execute)."""
+        return self.validation.ok and self.spread_error is None
+
+
+def build_quote(
+    info: PairInfo,
+    snapshot: TradingSnapshot,
+    request: QuoteRequest,
+    *,
+    price: float | None,
+    spread: dict[str, Any] | ApiError,
+    fee_discount_p: float = 0.0,
+) -> PreTradeQuote:
+    """The local part of a quote, from already-fetched market data.
+
+    ``price`` is the feed's last price; ``None`` (limit orders only) skips
+    the limit-vs-market direction check.
+    """
+    position_size = request.collateral * request.leverage
+    entry = request.limit_price if request.limit_price is not None else price
+    if entry is None:
+        raise ValueError("a market quote needs the last price")
+    if info.skew_eq_params:
+        fee_p, fee = skew_adjusted_open_fee(
+            position_size=position_size,
+            is_long=request.is_long,
+            oi_long=info.open_interest.long,
+            oi_short=info.open_interest.short,
+            skew_eq_params=info.skew_eq_params,
+            fee_discount_p=fee_discount_p,
+        )
+    else:
+        fee_p = info.open_fee_p * (1 - fee_discount_p / 100)
+        fee = position_size * fee_p / 100
+    spread_error, spread_body = (spread, None) if isinstance(spread, ApiError) else (None, spread)
+    spread_p = None if spread_body is None else spread_body["spreadPct"]
+    validation = validate_order(
+        info,
+        snapshot,
+        collateral=request.collateral,
+        leverage=request.leverage,
+        is_long=request.is_long,
+        limit_price=request.limit_price,
+        market_price=price,
+        take_profit_percent=request.take_profit_percent,
+        stop_loss_percent=request.stop_loss_percent,
+        dynamic_spread_p=spread_p,
+        wallet_oi=request.wallet_oi,
+        open_trades_on_pair=request.open_trades_on_pair,
+    )
+    if spread_error is not None:
+        validation.errors.append(
+            f"no spread quote (HTTP {spread_error.status}): do not execute"
+        )
+    return PreTradeQuote(
+        pair=info,
+        is_long=request.is_long,
+        collateral=request.collateral,
+        leverage=request.leverage,
+        price=price if price is not None else entry,
+        entry_price=entry,
+        spread_p=spread_p,
+        spread=spread_body,
+        spread_error=spread_error,
+        open_fee_p=fee_p,
+        open_fee=fee,
+        max_position_size=max_position_size(
+            info, snapshot, is_long=request.is_long, wallet_oi=request.wallet_oi
+        ),
+        liquidation_price=estimate_liquidation_price(
+            open_price=entry,
+            collateral=request.collateral,
+            leverage=request.leverage,
+            is_long=request.is_long,
+        ),
+        validation=validation,
+    )
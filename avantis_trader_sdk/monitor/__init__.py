@@ -0,0 +1,14 @@
+"""Live risk monitors fed from the price streams (no I/O of their own)."""
+
+from .feeds import FeedRouter
+from .liquidation import LiquidationAlert, LiquidationMonitor
+from .triggers import TriggerCrossing, TriggerHit, TriggerIndex
+
+__all__ = [
+    "FeedRouter",
+    "LiquidationAlert",
+    "LiquidationMonitor",
+    "TriggerCrossing",
+    "TriggerHit",
+    "TriggerIndex",
+]
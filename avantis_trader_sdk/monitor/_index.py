@@ -0,0 +1,39 @@
+"""Sorted price -> key arrays behind the monitors."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class SortedPrices:
+    """Prices ascending with their keys in the same order (parallel lists,
+    so lookups are a plain ``bisect`` on floats)."""
+
+    prices: list[float] = field(default_factory=list)
+    keys: list[Any] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def insert(self, price: float, key: Any) -> None:
+        slot = bisect_right(self.prices, price)
+        self.prices.insert(slot, price)
+        self.keys.insert(slot, key)
+
+    def remove(self, price: float, key: Any) -> None:
+        slot = bisect_left(self.prices, price)
+        while self.keys[slot] != key:  # equal prices: walk the tie run
+            slot += 1
+        del self.prices[slot]
+        del self.keys[slot]
+
+    def between(
+        self, low: float, high: float, *, low_open: bool = False, high_open: bool = False
+    ) -> range:
+        """Slots whose price lies in [low, high] (``*_open`` excludes the end)."""
+        start = (bisect_right if low_open else bisect_left)(self.prices, low)
+        stop = (bisect_left if high_open else bisect_right)(self.prices, high)
+        return range(start, max(start, stop))
@@ -0,0 +1,42 @@
+"""Price-update -> pair routing shared by the monitors.
+
+Price streams key updates by feed id (Lazer: int, Hermes: hex Pyth id);
+positions and triggers key by ``pairIndex``. :class:`FeedRouter` maps one to
+the other from the markets catalog.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from ..markets.models import PairInfo
+
+
+def _feed_key(feed_id: str | int) -> str | int:
+    if isinstance(feed_id, str):
+        key = feed_id.lower().removeprefix("0x")
+        return int(key) if key.isdigit() else key
+    return feed_id
+
+
+class FeedRouter:
+    """feed id -> pairIndex for both the Lazer and the Pyth (Hermes) feed of
+    every pair. Build it once from ``markets.pairs()``."""
+
+    def __init__(self, pairs: Iterable[PairInfo]) -> None:
+        self._pairs: dict[str | int, list[int]] = {}
+        for info in pairs:
+            if info.lazer_feed is not None and info.lazer_feed.feed_id is not None:
+                self._add(info.lazer_feed.feed_id, info.index)
+            if info.feed.feed_id:
+                self._add(info.feed.feed_id, info.index)
+
+    def _add(self, feed_id: str | int, pair_index: int) -> None:
+        # Upside pairs share their base pair's feed: one update, several pairs.
+        self._pairs.setdefault(_feed_key(feed_id), []).append(pair_index)
+
+    def pairs_for(self, feed_id: str | int | None) -> list[int]:
+        if feed_id is None:
+            return []
+        return self._pairs.get(_feed_key(feed_id), [])
+
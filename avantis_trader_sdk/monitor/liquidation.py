@@ -0,0 +1,199 @@
+"""Portfolio liquidation monitor over a price-sorted index.
+
+Scanning every ``Position.liquidation_price`` on every tick is O(n) per
+update. :class:`LiquidationMonitor` instead keeps, per pair and side, the
+liquidation prices in a sorted array: a long is at risk once the price
+falls to its liquidation price (plus ``buffer_p``), a short once it rises
+to it, so the at-risk positions are always a contiguous tail (longs) or
+head (shorts) of the array. Each tick is one ``bisect`` plus the k hits.
+
+Liquidation prices are recomputed locally with
+:func:`~avantis_trader_sdk.compute.estimate_liquidation_price` from the
+position's collateral, leverage and accrued rollover/funding fees; call
+:meth:`LiquidationMonitor.accrue` (or re-``upsert`` from a fresh
+``account.positions()`` read) as fees accrue.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+
+from .._aio import dispatch
+from ..account.models import Position
+from ..compute.liquidation import LIQ_THRESHOLD_P, estimate_liquidation_price
+from ..errors import ConfigError
+from ..streams.prices import PriceUpdate
+from ._index import SortedPrices
+from .feeds import FeedRouter
+
+PositionKey = tuple[str, int, int]  # (trader, pairIndex, index)
+
+
+@dataclass
+class LiquidationAlert:
+    trader: str
+    pair_index: int
+    index: int
+    is_long: bool
+    liquidation_price: float
+    price: float
+
+    @property
+    def distance_p(self) -> float:
+        """Signed distance to liquidation in % of price (<= 0: crossed)."""
+        if self.price <= 0:
+            return 0.0
+        gap = self.price - self.liquidation_price
+        return (gap if self.is_long else -gap) / self.price * 100
+
+
+@dataclass
+class _Tracked:
+    open_price: float
+    collateral: float
+    leverage: float
+    is_long: bool
+    rollover_fee: float = 0.0
+    funding_fee: float = 0.0
+    liquidation_price: float = 0.0
+
+
+class LiquidationMonitor:
+    """Per-pair long/short liquidation index; O(log n + k) per tick.
+
+    ``buffer_p`` widens the trigger: a long alerts once
+    ``price <= liq * (1 + buffer_p/100)``, a short once
+    ``price >= liq * (1 - buffer_p/100)``. ``on_alert`` (sync or async)
+    receives every at-risk :class:`LiquidationAlert` from :meth:`on_price`;
+    pass :meth:`on_price` straight to a price stream's ``run()`` (with a
+    :class:`FeedRouter` to map feed ids to pairs).
+    """
+
+    def __init__(
+        self,
+        *,
+        buffer_p: float = 0.0,
+        router: FeedRouter | None = None,
+        on_alert: Callable[[LiquidationAlert], Awaitable[None] | None] | None = None,
+        liq_threshold_p: float = LIQ_THRESHOLD_P,
+    ) -> None:
+        self.buffer_p = buffer_p
+        self.liq_threshold_p = liq_threshold_p
+        self._router = router
+        self._on_alert = on_alert
+        self._tracked: dict[PositionKey, _Tracked] = {}
+        self._books: dict[tuple[int, bool], SortedPrices] = {}
+
+    def __len__(self) -> int:
+        return len(self._tracked)
+
+    # ------------------------------------------------------------------ index
+
+    def load(self, positions: Iterable[Position]) -> None:
+        """Track (or refresh) every position, e.g. from ``account.positions()``."""
+        for position in positions:
+            self.upsert(position)
+
+    def upsert(self, position: Position) -> float:
+        """Track or refresh one position; returns its local liquidation price."""
+        key = (position.trader.lower(), position.pair_index, position.index)
+        tracked = _Tracked(
+            open_price=float(position.open_price),
+            collateral=float(position.collateral),
+            leverage=float(position.leverage),
+            is_long=position.buy,
+            rollover_fee=float(position.rollover_fee),
+            funding_fee=float(position.unrealised_funding_fee),
+        )
+        self.remove(*key)
+        return self._insert(key, tracked)
+
+    def accrue(
+        self,
+        trader: str,
+        pair_index: int,
+        index: int,
+        *,
+        rollover_fee: float,
+        funding_fee: float,
+    ) -> float:
+        """Re-price a tracked position with its current accrued fees (USDC)."""
+        key = (trader.lower(), pair_index, index)
+        tracked = self._tracked[key]
+        self.remove(*key)
+        tracked.rollover_fee = rollover_fee
+        tracked.funding_fee = funding_fee
+        return self._insert(key, tracked)
+
+    def remove(self, trader: str, pair_index: int, index: int) -> None:
+        key = (trader.lower(), pair_index, index)
+        tracked = self._tracked.pop(key, None)
+        if tracked is not None:
+            self._books[(pair_index, tracked.is_long)].remove(
+                tracked.liquidation_price, key
+            )
+
+    def liquidation_price(self, trader: str, pair_index: int, index: int) -> float | None:
+        tracked = self._tracked.get((trader.lower(), pair_index, index))
+        return tracked.liquidation_price if tracked is not None else None
+
+    def _insert(self, key: PositionKey, tracked: _Tracked) -> float:
+        tracked.liquidation_price = estimate_liquidation_price(
+            open_price=tracked.open_price,
+            collateral=tracked.collateral,
+            leverage=tracked.leverage,
+            is_long=tracked.is_long,
+            rollover_fee=tracked.rollover_fee,
+            funding_fee=tracked.funding_fee,
+            liq_threshold_p=self.liq_threshold_p,
+        )
+        self._tracked[key] = tracked
+        self._books.setdefault((key[1], tracked.is_long), SortedPrices()).insert(
+            tracked.liquidation_price, key
+        )
+        return tracked.liquidation_price
+
+    # ------------------------------------------------------------------ queries
+
+    def at_risk(self, pair_index: int, price: float) -> list[LiquidationAlert]:
+        """Positions on ``pair_index`` whose liquidation (plus buffer) the
+        price has crossed: a bisect per side plus the hits."""
+        alerts: list[LiquidationAlert] = []
+        buffer = self.buffer_p / 100
+        longs = self._books.get((pair_index, True))
+        if longs is not None and longs.prices:
+            start = bisect_left(longs.prices, price / (1 + buffer))
+            alerts.extend(
+                self._alert(key, True, liq, price)
+                for liq, key in zip(longs.prices[start:], longs.keys[start:], strict=True)
+            )
+        shorts = self._books.get((pair_index, False))
+        if shorts is not None and shorts.prices and buffer < 1:
+            stop = bisect_right(shorts.prices, price / (1 - buffer))
+            alerts.extend(
+                self._alert(key, False, liq, price)
+                for liq, key in zip(shorts.prices[:stop], shorts.keys[:stop], strict=True)
+            )
+        return alerts
+
+    @staticmethod
+    def _alert(key: PositionKey, is_long: bool, liq: float, price: float) -> LiquidationAlert:
+        return LiquidationAlert(
+            trader=key[0],
+            pair_index=key[1],
+            index=key[2],
+            is_long=is_long,
+            liquidation_price=liq,
+            price=price,
+        )
+
+    async def on_price(self, update: PriceUpdate) -> None:
+        """Price-stream callback: route the update to its pair(s) and hand
+        every at-risk position to ``on_alert``."""
+        if self._router is None:
+            raise ConfigError("on_price needs a FeedRouter (feed id -> pairIndex)")
+        for pair_index in self._router.pairs_for(update.feed_id):
+            for alert in self.at_risk(pair_index, update.price):
+                await dispatch(self._on_alert, alert)
@@ -0,0 +1,188 @@
+"""Per-pair TP/SL trigger index: proximity queries and crossing events.
+
+``Position.price_triggers`` mixes the global on-chain TP/SL with off-chain
+partial orders; finding the triggers near the market by scanning every
+position is O(n) per tick. :class:`TriggerIndex` keeps each pair's triggers
+in four arrays sorted by ``final_trigger_price`` (long/short x TP/SL), so
+
+- ``near(pair, price, within_p)`` is a bisect per array plus the hits, and
+- each price update reports the triggers the move CROSSED, in their firing
+  direction (long TP / short SL fire on the way up, long SL / short TP on
+  the way down), by bisecting the (last, new] price interval.
+
+Crossing events are what the operator should be executing right now: use
+them to pre-position hedges or to measure operator execution latency
+against the position update that follows.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+
+from .._aio import dispatch
+from ..account.models import Position, PriceTrigger
+from ..errors import ConfigError
+from ..streams.prices import PriceUpdate
+from ._index import SortedPrices
+from .feeds import FeedRouter
+from .liquidation import PositionKey
+
+# (is_long, is_tp) -> fires when the price moves up through the level
+_FIRES_UP = {(True, True): True, (False, False): True, (True, False): False, (False, True): False}
+
+
+@dataclass
+class TriggerHit:
+    trigger: PriceTrigger
+    trigger_price: float
+    price: float
+
+    @property
+    def is_tp(self) -> bool:
+        return self.trigger.kind in ("tp", "partial_tp")
+
+    @property
+    def distance_p(self) -> float:
+        """|trigger - price| in % of price."""
+        return abs(self.trigger_price - self.price) / self.price * 100 if self.price else 0.0
+
+
+@dataclass
+class TriggerCrossing(TriggerHit):
+    """A trigger the last price move went through in its firing direction."""
+
+    previous_price: float = 0.0
+    timestamp_ms: int | None = None
+
+
+class TriggerIndex:
+    """Sorted per-pair TP/SL trigger arrays fed from the live price book.
+
+    Load from ``account.positions()`` (every ``price_triggers`` entry with a
+    non-zero ``final_trigger_price``; SL 0 means none) and feed prices via
+    :meth:`update` or the stream callback :meth:`on_price` (needs a
+    :class:`FeedRouter`); ``on_crossing`` (sync or async) receives each
+    :class:`TriggerCrossing`.
+    """
+
+    def __init__(
+        self,
+        *,
+        router: FeedRouter | None = None,
+        on_crossing: Callable[[TriggerCrossing], Awaitable[None] | None] | None = None,
+    ) -> None:
+        self._router = router
+        self._on_crossing = on_crossing
+        self._books: dict[tuple[int, bool, bool], SortedPrices] = {}
+        self._triggers: dict[
+            str, tuple[PriceTrigger, float, tuple[int, bool, bool], PositionKey]
+        ] = {}
+        self._by_position: dict[PositionKey, set[str]] = {}
+        self._last: dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._triggers)
+
+    # ------------------------------------------------------------------ index
+
+    def load(self, positions: Iterable[Position]) -> None:
+        for position in positions:
+            self.replace_position(position)
+
+    def replace_position(self, position: Position) -> None:
+        """Re-index one position's triggers (drops ones no longer listed)."""
+        key = (position.trader.lower(), position.pair_index, position.index)
+        for entity_id in list(self._by_position.get(key, ())):
+            self.remove(entity_id)
+        for trigger in position.price_triggers:
+            self.add(trigger, trader=position.trader)
+
+    def add(self, trigger: PriceTrigger, *, trader: str | None = None) -> None:
+        """Index one trigger; ``trader`` defaults to ``trigger.trader``."""
+        if trigger.kind not in ("tp", "sl", "partial_tp", "partial_sl"):
+            return
+        price = float(trigger.final_trigger_price)
+        if price <= 0:
+            return
+        self.remove(trigger.entity_id)
+        book = (trigger.pair_index, trigger.buy, trigger.kind in ("tp", "partial_tp"))
+        self._books.setdefault(book, SortedPrices()).insert(price, trigger.entity_id)
+        key = ((trader or trigger.trader).lower(), trigger.pair_index, trigger.index)
+        self._triggers[trigger.entity_id] = (trigger, price, book, key)
+        self._by_position.setdefault(key, set()).add(trigger.entity_id)
+
+    def remove(self, entity_id: str) -> None:
+        entry = self._triggers.pop(entity_id, None)
+        if entry is None:
+            return
+        _, price, book, key = entry
+        self._books[book].remove(price, entity_id)
+        ids = self._by_position.get(key)
+        if ids is not None:
+            ids.discard(entity_id)
+            if not ids:
+                del self._by_position[key]
+
+    # ------------------------------------------------------------------ queries
+
+    def _pair_books(self, pair_index: int) -> Iterable[tuple[tuple[int, bool, bool], SortedPrices]]:
+        for side in (True, False):
+            for is_tp in (True, False):
+                book = self._books.get((pair_index, side, is_tp))
+                if book:
+                    yield (pair_index, side, is_tp), book
+
+    def near(self, pair_index: int, price: float, within_p: float) -> list[TriggerHit]:
+        """Triggers on ``pair_index`` within ``within_p`` % of ``price``,
+        nearest first."""
+        band = price * within_p / 100
+        hits = [
+            TriggerHit(self._triggers[book.keys[slot]][0], book.prices[slot], price)
+            for _, book in self._pair_books(pair_index)
+            for slot in book.between(price - band, price + band)
+        ]
+        hits.sort(key=lambda hit: abs(hit.trigger_price - price))
+        return hits
+
+    def update(
+        self, pair_index: int, price: float, *, timestamp_ms: int | None = None
+    ) -> list[TriggerCrossing]:
+        """Record a new price; returns the triggers crossed since the last one
+        (none on the first price seen for the pair)."""
+        previous = self._last.get(pair_index)
+        self._last[pair_index] = price
+        if previous is None or previous == price:
+            return []
+        up = price > previous
+        crossings: list[TriggerCrossing] = []
+        for (_, side, is_tp), book in self._pair_books(pair_index):
+            if _FIRES_UP[(side, is_tp)] != up:
+                continue
+            slots = (
+                book.between(previous, price, low_open=True)
+                if up
+                else book.between(price, previous, high_open=True)
+            )
+            crossings.extend(
+                TriggerCrossing(
+                    self._triggers[book.keys[slot]][0],
+                    book.prices[slot],
+                    price,
+                    previous_price=previous,
+                    timestamp_ms=timestamp_ms,
+                )
+                for slot in slots
+            )
+        return crossings
+
+    async def on_price(self, update: PriceUpdate) -> None:
+        """Price-stream callback: update every pair on the feed and hand the
+        crossings to ``on_crossing``."""
+        if self._router is None:
+            raise ConfigError("on_price needs a FeedRouter (feed id -> pairIndex)")
+        for pair_index in self._router.pairs_for(update.feed_id):
+            for crossing in self.update(
+                pair_index, update.price, timestamp_ms=update.timestamp_ms
+            ):
+                await dispatch(self._on_crossing, crossing)
@@ -0,0 +1,174 @@
+"""Per-service token-bucket rate limiting with priority classes.
+
+Every upstream service (tx-builder, core, batched-market, blitz, feed, risk
+v2, data, twap, history) gets its own bucket, so a bot polling one service cannot spend the
+request allowance of another. Within a service, queued requests leave in
+:class:`Priority` order: writes (opens, closes, cancels, TP/SL updates,
+relays) before reads, reads before background syncs. A 429 pauses the
+service's bucket for its ``Retry-After``.
+
+Requests are matched to a service by the longest configured base-URL prefix;
+URLs outside every service are not limited. Enabled through
+``AvantisConfig.rate_limits`` (``{"core": 10, ...}`` requests per second).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+
+from .errors import ConfigError
+
+SERVICES = (
+    "tx-builder",
+    "core",
+    "batched-market",
+    "blitz",
+    "feed",
+    "risk-v2",
+    "data",
+    "twap",
+    "history",
+)
+
+
+class Priority(IntEnum):
+    ORDER = 0  # state-changing calls (default for non-GET requests)
+    READ = 1  # snapshots, positions, prices (default for GETs)
+    BACKGROUND = 2  # history syncs, bulk backfills
+
+
+@dataclass
+class ServiceStats:
+    requests: int = 0
+    waited: int = 0  # requests that had to queue
+    wait_s: float = 0.0  # total queueing time
+    max_wait_s: float = 0.0
+    throttled: int = 0  # 429 responses
+    queued: int = 0  # waiting right now
+
+
+@dataclass
+class _Bucket:
+    rate: float
+    burst: float
+    tokens: float
+    updated: float
+    blocked_until: float = 0.0
+    waiters: list[tuple[int, int]] = field(default_factory=list)  # (priority, seq) heap
+    stats: ServiceStats = field(default_factory=ServiceStats)
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def eta(self, now: float) -> float:
+        """Seconds until a token can be taken."""
+        return max(self.blocked_until - now, (1 - self.tokens) / self.rate, 0.0)
+
+
+class RateLimiter:
+    """Token buckets keyed by service, shared by one :class:`HttpTransport`.
+
+    >>> limiter = RateLimiter({"https://api/core": "core"}, {"core": 10})
+    >>> await limiter.acquire("https://api/core/user-data", Priority.READ)
+    """
+
+    def __init__(
+        self,
+        routes: Mapping[str, str],
+        rates: Mapping[str, float],
+        *,
+        burst: Mapping[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        unknown = set(rates) - set(SERVICES)
+        if unknown:
+            raise ConfigError(f"unknown rate-limited services {sorted(unknown)}; use {SERVICES}")
+        if any(rate <= 0 for rate in rates.values()):
+            raise ConfigError("rate limits must be positive requests per second")
+        self._clock = clock
+        now = clock()
+        self._buckets: dict[str, _Bucket] = {}
+        for service, rate in rates.items():
+            size = (burst or {}).get(service, max(1.0, rate))
+            self._buckets[service] = _Bucket(rate=rate, burst=size, tokens=size, updated=now)
+        # longest prefix first, so /batched-market is not taken for its parent
+        self._routes = sorted(
+            ((base.rstrip("/"), service) for base, service in routes.items() if base),
+            key=lambda route: -len(route[0]),
+        )
+        self._seq = itertools.count()
+
+    def service_for(self, url: str) -> str | None:
+        for base, service in self._routes:
+            if url.startswith(base) and service in self._buckets:
+                return service
+        return None
+
+    def stats(self) -> dict[str, ServiceStats]:
+        """Per-service counters (``queued`` is the current queue depth)."""
+        for bucket in self._buckets.values():
+            bucket.stats.queued = len(bucket.waiters)
+        return {service: bucket.stats for service, bucket in self._buckets.items()}
+
+    async def acquire(self, url: str, priority: Priority = Priority.READ) -> float:
+        """Wait for a token of ``url``'s service; returns the seconds waited."""
+        service = self.service_for(url)
+        if service is None:
+            return 0.0
+        bucket = self._buckets[service]
+        entry = (int(priority), next(self._seq))
+        heapq.heappush(bucket.waiters, entry)
+        started = self._clock()
+        queued = False
+        try:
+            while True:
+                now = self._clock()
+                bucket.refill(now)
+                if bucket.waiters[0] == entry and now >= bucket.blocked_until and bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    break
+                queued = True
+                await asyncio.sleep(bucket.eta(now) or 0.001)
+        finally:
+            bucket.waiters.remove(entry)
+            heapq.heapify(bucket.waiters)
+        waited = self._clock() - started if queued else 0.0
+        stats = bucket.stats
+        stats.requests += 1
+        if queued:
+            stats.waited += 1
+            stats.wait_s += waited
+            stats.max_wait_s = max(stats.max_wait_s, waited)
+        return waited
+
+    def throttled(self, url: str, retry_after_s: float) -> None:
+        """Record a 429 and hold ``url``'s service for ``retry_after_s``."""
+        service = self.service_for(url)
+        if service is None:
+            return
+        bucket = self._buckets[service]
+        bucket.stats.throttled += 1
+        bucket.blocked_until = max(bucket.blocked_until, self._clock() + retry_after_s)
+
+
+def retry_after_s(value: str | None, default: float = 1.0) -> float:
+    """Seconds from a ``Retry-After`` header (delta-seconds or HTTP date;
+    missing or unparsable values give ``default``)."""
+    if value is None:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
@@ -0,0 +1,168 @@
+"""Stale-while-revalidate caching for slow-moving reads.
+
+A :class:`Refreshing` value is served straight from memory while it is
+younger than ``ttl_s``. Past that it is still served, and a single
+background fetch replaces it; callers never queue behind that fetch. Only an
+empty cache, ``force=True`` or a value older than ``max_stale_s`` makes a
+caller wait, and concurrent waiters share one request.
+
+:meth:`Refreshing.start` keeps the value warm instead: a task refetches it
+at ``refresh_ahead`` of the TTL (jittered, so many clients do not poll in
+lockstep), which means even the first stale read never happens.
+
+Used for ``/v2/meta`` (shared by the client and the execution engine) and
+for the markets snapshot, open interests and orderbook snapshots.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+from .errors import ConfigError
+
+T = TypeVar("T")
+
+
+class Refreshing(Generic[T]):
+    """One cached value with single-flight, ahead-of-expiry refreshes.
+
+    >>> meta = Refreshing(txb.meta, ttl_s=300)
+    >>> await meta.get()     # fetched once, then served from memory
+    >>> meta.start()         # optional: refresh in the background
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[T]],
+        *,
+        ttl_s: float,
+        max_stale_s: float | None = None,
+        refresh_ahead: float = 0.8,
+        jitter: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        if ttl_s <= 0:
+            raise ConfigError("ttl_s must be positive")
+        if max_stale_s is not None and max_stale_s < ttl_s:
+            raise ConfigError("max_stale_s must be at least ttl_s")
+        if not 0 < refresh_ahead <= 1 or not 0 <= jitter < 1:
+            raise ConfigError("refresh_ahead must be in (0, 1] and jitter in [0, 1)")
+        self._fetch = fetch
+        self.ttl_s = ttl_s
+        self.max_stale_s = max_stale_s
+        self.refresh_ahead = refresh_ahead
+        self.jitter = jitter
+        self._clock = clock
+        self._rng = rng
+        self._value: T | None = None
+        self.fetched_at: float = 0.0  # clock() when the current value's fetch began
+        self.refreshes = 0
+        self.failures = 0  # consecutive
+        self.last_error: Exception | None = None
+        self._inflight: asyncio.Task[T] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    # ------------------------------------------------------------------ reads
+
+    @property
+    def age_s(self) -> float | None:
+        return None if self._value is None else self._clock() - self.fetched_at
+
+    def peek(self) -> T | None:
+        """The cached value, however old (``None`` before the first fetch)."""
+        return self._value
+
+    def invalidate(self) -> None:
+        """Drop the cached value; the next :meth:`get` fetches."""
+        self._value = None
+
+    async def get(self, *, force: bool = False) -> T:
+        """The cached value, refreshed as described in the module docstring."""
+        age = self.age_s
+        if force or age is None:
+            return await self.refresh()
+        if age > self.ttl_s:
+            if self.max_stale_s is not None and age > self.max_stale_s:
+                return await self.refresh()
+            self._kick()
+        assert self._value is not None
+        return self._value
+
+    async def refresh(self) -> T:
+        """Fetch now, joining a fetch already in flight. Cancelling the
+        caller does not cancel the shared fetch."""
+        return await asyncio.shield(self._kick())
+
+    def _kick(self) -> asyncio.Task[T]:
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._run())
+            self._inflight.add_done_callback(_consume)
+        return self._inflight
+
+    async def _run(self) -> T:
+        started = self._clock()
+        try:
+            value = await self._fetch()
+        except Exception as exc:
+            self.failures += 1
+            self.last_error = exc
+            raise
+        self.put(value, fetched_at=started)
+        return value
+
+    def put(self, value: T, *, fetched_at: float | None = None) -> None:
+        """Store a value fetched elsewhere (e.g. by a poller of the same
+        endpoint); ``fetched_at`` defaults to now."""
+        self._value = value
+        self.fetched_at = self._clock() if fetched_at is None else fetched_at
+        self.refreshes += 1
+        self.failures = 0
+        self.last_error = None
+
+    # ------------------------------------------------------------------ background
+
+    def next_delay_s(self) -> float:
+        """Seconds until the background task's next fetch."""
+        age = self.age_s
+        if self.failures:
+            delay = min(self.ttl_s, 0.5 * 2 ** (self.failures - 1))
+        elif age is None:
+            return 0.0
+        else:
+            delay = self.ttl_s * self.refresh_ahead - age
+        spread = 1 + self.jitter * (2 * self._rng() - 1)
+        return max(0.0, delay * spread)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._inflight is not None and not self._inflight.done():
+            self._inflight.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._inflight
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.next_delay_s())
+            with contextlib.suppress(Exception):  # kept in last_error
+                await self.refresh()
+
+
+def _consume(task: asyncio.Task) -> None:
+    # A background refresh nobody awaits must not log "exception never
+    # retrieved"; the error is kept in last_error.
+    if not task.cancelled():
+        task.exception()
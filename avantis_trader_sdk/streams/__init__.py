@@ -1,11 +1,20 @@
-from .orders import OrderEventStream
+from .bars import Bar, BarBuilder, BarClose, BarSeries
+from .orders import OrderEvent, OrderEventStream
 from .pairdata import PairDataStream
 from .prices import HermesPriceStream, LazerPriceStream, PriceUpdate
+from .recording import StreamRecorder, StreamReplay
 
 __all__ = [
     "LazerPriceStream",
     "HermesPriceStream",
     "PriceUpdate",
     "PairDataStream",
+    "OrderEvent",
     "OrderEventStream",
+    "StreamRecorder",
+    "StreamReplay",
+    "Bar",
+    "BarBuilder",
+    "BarClose",
+    "BarSeries",
 ]
@@ -0,0 +1,252 @@
+"""Streaming OHLC bars built from live price ticks.
+
+Polling ``markets.candles`` for the forming bar costs a round-trip per
+read and is rate-limited. :class:`BarBuilder` consumes ``PriceUpdate``
+objects from ``LazerPriceStream`` / ``HermesPriceStream`` (or a
+``StreamReplay``) and keeps rolling bars per feed at several resolutions:
+
+- each (feed, resolution) holds its closed bars in a fixed-capacity ring
+  of typed ``array`` columns, so memory does not grow with uptime;
+- a tick that opens a new bucket closes the forming bar and emits a
+  :class:`BarClose` to ``on_close``;
+- :meth:`BarBuilder.seed` / :meth:`BarBuilder.backfill` load history from
+  the TradingView shim (or a ``CandleStore``) at startup, the last bar
+  continuing as the forming one.
+
+Bars are bucketed by the tick's exchange timestamp (``timestamp_ms``; the
+local clock when absent). Ticks older than the forming bar are dropped; a
+late tick inside it widens its range but never moves its close. Buckets
+with no ticks produce no bar (as on the shim). Tick-built bars have no
+traded volume: ``volume`` counts ticks, seeded bars keep the shim's.
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from .._aio import dispatch
+from ..markets.candles import CandleSeries, resolution_seconds
+from .prices import PriceUpdate
+
+FetchCandles = Callable[[str, str, int, int], Awaitable[Any]]
+
+
+def _feed_key(feed_id: str | int) -> str | int:
+    # Hermes ids arrive with or without 0x; Lazer ids are ints.
+    return feed_id.lower().removeprefix("0x") if isinstance(feed_id, str) else feed_id
+
+
+@dataclass
+class Bar:
+    time: int  # bucket start, unix seconds
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float = 0.0
+
+
+@dataclass
+class BarClose:
+    """A bar that just closed (the first tick of the next bucket arrived)."""
+
+    feed_id: str | int
+    resolution: str
+    bar: Bar
+
+
+class BarSeries:
+    """Closed bars in a fixed-capacity ring plus the forming bar."""
+
+    def __init__(self, resolution: str, capacity: int) -> None:
+        self.resolution = resolution
+        self.step = resolution_seconds(resolution)
+        self.capacity = capacity
+        self._time = array("q", bytes(8 * capacity))
+        self._cols = tuple(array("d", bytes(8 * capacity)) for _ in range(5))
+        self._head = 0  # next write slot
+        self._count = 0
+        self._last_ts = 0.0
+        self.current: Bar | None = None
+
+    def __len__(self) -> int:
+        """Closed bars held (at most ``capacity``)."""
+        return self._count
+
+    def __getitem__(self, i: int) -> Bar:
+        """``series[-1]`` is the latest CLOSED bar; ``series.current`` the forming one."""
+        if not -self._count <= i < self._count:
+            raise IndexError("bar index out of range")
+        slot = (self._head - self._count + (i % self._count)) % self.capacity
+        return Bar(self._time[slot], *(col[slot] for col in self._cols))
+
+    def _push(self, bar: Bar) -> None:
+        slot = self._head
+        self._time[slot] = bar.time
+        o, h, low, c, v = self._cols
+        o[slot], h[slot], low[slot], c[slot], v[slot] = (
+            bar.open, bar.high, bar.low, bar.close, bar.volume,
+        )
+        self._head = (slot + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def add(self, ts: float, price: float, volume: float = 1.0) -> Bar | None:
+        """Apply one tick; returns the bar it closed, if any."""
+        bucket = int(ts) // self.step * self.step
+        bar = self.current
+        if bar is not None and bucket == bar.time:
+            if price > bar.high:
+                bar.high = price
+            elif price < bar.low:
+                bar.low = price
+            if ts >= self._last_ts:  # out-of-order ticks never move the close
+                bar.close = price
+                self._last_ts = ts
+            bar.volume += volume
+            return None
+        if bar is not None and bucket < bar.time:
+            return None  # late tick for a bar already closed
+        self.current = Bar(bucket, price, price, price, price, volume)
+        self._last_ts = ts
+        if bar is not None:
+            self._push(bar)
+        return bar
+
+    def series(self, *, include_current: bool = True) -> CandleSeries:
+        """Copy of the bars, oldest first (the forming bar last, if any)."""
+        out = CandleSeries()
+        start = (self._head - self._count) % self.capacity
+        columns: tuple[array, ...] = (out.time, out.open, out.high, out.low, out.close, out.volume)
+        sources: tuple[array, ...] = (self._time, *self._cols)
+        for column, source in zip(columns, sources, strict=True):
+            if start + self._count <= self.capacity:
+                column.extend(source[start : start + self._count])
+            else:
+                column.extend(source[start:])
+                column.extend(source[: self._head])
+        bar = self.current
+        if include_current and bar is not None:
+            out.time.append(bar.time)
+            out.open.append(bar.open)
+            out.high.append(bar.high)
+            out.low.append(bar.low)
+            out.close.append(bar.close)
+            out.volume.append(bar.volume)
+        return out
+
+
+class BarBuilder:
+    """Rolling OHLC bars per feed at several resolutions.
+
+    >>> bars = BarBuilder(["1", "5", "60"], on_close=on_bar)
+    >>> await bars.backfill(client.markets.candles, "ETH/USD", eth_lazer_id)
+    >>> await stream.run(bars.on_price)
+    >>> bars.series(eth_lazer_id, "5").close[-1]   # up to the last tick
+
+    ``capacity`` closed bars are kept per (feed, resolution). ``on_close``
+    (sync or async) receives each :class:`BarClose`, shortest resolution
+    first.
+    """
+
+    def __init__(
+        self,
+        resolutions: Iterable[str],
+        *,
+        capacity: int = 1000,
+        on_close: Callable[[BarClose], Awaitable[None] | None] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.resolutions = sorted(set(resolutions), key=resolution_seconds)
+        self.capacity = capacity
+        self._on_close = on_close
+        self._clock = clock
+        self._feeds: dict[str | int, dict[str, BarSeries]] = {}
+
+    def _feed(self, feed_id: str | int) -> dict[str, BarSeries]:
+        key = _feed_key(feed_id)
+        books = self._feeds.get(key)
+        if books is None:
+            books = self._feeds[key] = {
+                res: BarSeries(res, self.capacity) for res in self.resolutions
+            }
+        return books
+
+    def bars(self, feed_id: str | int, resolution: str) -> BarSeries:
+        return self._feed(feed_id)[resolution]
+
+    def series(
+        self, feed_id: str | int, resolution: str, *, include_current: bool = True
+    ) -> CandleSeries:
+        return self.bars(feed_id, resolution).series(include_current=include_current)
+
+    # ------------------------------------------------------------------ ticks
+
+    def update(self, update: PriceUpdate) -> list[BarClose]:
+        """Apply one tick to every resolution; returns the bars it closed."""
+        ts = (
+            update.timestamp_ms / 1000
+            if update.timestamp_ms is not None
+            else self._clock()
+        )
+        closed = []
+        for series in self._feed(update.feed_id).values():
+            bar = series.add(ts, update.price)
+            if bar is not None:
+                closed.append(BarClose(update.feed_id, series.resolution, bar))
+        return closed
+
+    async def on_price(self, update: PriceUpdate) -> None:
+        """Price-stream callback: update the bars, emit closes to ``on_close``."""
+        for event in self.update(update):
+            await dispatch(self._on_close, event)
+
+    # ------------------------------------------------------------------ history
+
+    def seed(self, feed_id: str | int, resolution: str, candles: CandleSeries | dict) -> None:
+        """Load history (a ``CandleSeries`` or a TradingView-shim payload).
+        The last bar becomes the forming one; bars at or before the
+        current forming bar are skipped."""
+        rows: Iterator[tuple[Any, ...]]
+        if isinstance(candles, dict):
+            times = candles.get("t") or []
+            rows = zip(
+                times,
+                candles.get("o") or [],
+                candles.get("h") or [],
+                candles.get("l") or [],
+                candles.get("c") or [],
+                candles.get("v") or [0.0] * len(times),
+                strict=True,
+            )
+        else:
+            rows = candles.rows()
+        series = self.bars(feed_id, resolution)
+        for t, o, h, low, c, v in rows:
+            bucket = int(t) // series.step * series.step
+            if series.current is not None and bucket <= series.current.time:
+                continue
+            if series.current is not None:
+                series._push(series.current)
+            series.current = Bar(bucket, float(o), float(h), float(low), float(c), float(v))
+            series._last_ts = bucket
+
+    async def backfill(
+        self,
+        fetch: FetchCandles,
+        symbol: str,
+        feed_id: str | int,
+        *,
+        bars: int | None = None,
+    ) -> None:
+        """Seed every resolution from ``fetch(symbol, resolution, start, end)``
+        (``client.markets.candles`` or ``CandleStore.get``), ``bars`` bars
+        back (default: ``capacity``)."""
+        now = int(self._clock())
+        for resolution in self.resolutions:
+            step = resolution_seconds(resolution)
+            start = now - (bars or self.capacity) * step
+            self.seed(feed_id, resolution, await fetch(symbol, resolution, start, now + step))
@@ -18,6 +18,7 @@ from dataclasses import dataclass
 
 import httpx
 
+from .._aio import dispatch
 from ..errors import ApiError
 
 Callback = Callable[["PriceUpdate"], Awaitable[None] | None]
@@ -33,14 +34,6 @@ class PriceUpdate:
     raw: dict | None = None
 
 
-async def _dispatch(callback: Callback | None, update: PriceUpdate) -> None:
-    if callback is None:
-        return
-    result = callback(update)
-    if asyncio.iscoroutine(result):
-        await result
-
-
 class _ReconnectingStream:
     def __init__(self) -> None:
         self._stop = asyncio.Event()
@@ -85,7 +78,7 @@ class LazerPriceStream(_ReconnectingStream):
                                 ts = int(ts) if ts is not None else None
                                 for feed in data.get("priceFeeds", []):
                                     price = float(feed["price"]) * 10 ** feed.get("exponent", 0)
-                                    await _dispatch(
+                                    await dispatch(
                                         callback,
                                         PriceUpdate(
                                             feed_id=feed.get("priceFeedId"),
@@ -153,7 +146,7 @@ class HermesPriceStream(_ReconnectingStream):
                         feed = data.get("price_feed", {})
                         p = feed.get("price", {})
                         price = float(p.get("price", 0)) * 10 ** p.get("expo", 0)
-                        await _dispatch(
+                        await dispatch(
                             callback,
                             PriceUpdate(
                                 feed_id=feed.get("id"),
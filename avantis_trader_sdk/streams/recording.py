@@ -0,0 +1,337 @@
+"""Record live stream messages to an append-only log and replay them.
+
+:class:`StreamRecorder` taps any stream callback and appends every message
+with its receive timestamp to a compact binary log; :class:`StreamReplay`
+memory-maps the log and re-emits the messages through the same interface
+the live streams expose (``run(callback)``, ``stop()``, ``async for``), so
+strategy code runs unchanged against a capture, at wall-clock speed (or a
+multiple of it) or as fast as possible.
+
+Log layout: an 8-byte magic, then records of a 13-byte header (kind u8,
+payload length u32, receive time ns i64; little-endian) plus the payload.
+Lazer ticks (int feed ids, the bulk of any capture) are fixed-width and
+written in blocks of up to ``block_size`` ticks, each carrying its own
+receive time, so replay decodes a block with one ``struct.iter_unpack``;
+that keeps replay around a million ticks per second (trivial callback,
+one core). Hermes ticks are single fixed-width records; ``PairDataStream``
+snapshots and ``OrderEventStream`` events are stored as JSON. ``PriceUpdate.raw`` is
+dropped unless ``keep_raw=True`` (stored as JSON, at JSON replay speed).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import math
+import mmap
+import os
+import struct
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import Any, BinaryIO
+
+from ..errors import ConfigError
+from .orders import OrderEvent
+from .prices import PriceUpdate
+
+MAGIC = b"AVSREC1\n"
+
+_HEADER = struct.Struct("<BIq")
+_PRICE = struct.Struct("<dqdd")  # price, timestamp_ms (-1 = None), bid, ask (NaN = None)
+# One tick inside a _TICKS block: recv_ns, feed id, then the _PRICE fields.
+_TICK = struct.Struct("<qqdqdd")
+
+# record kinds
+_TICKS = 1  # block of int-feed-id (Lazer) ticks, n x _TICK
+_PRICE_STR = 2  # str feed id (Hermes): _PRICE + utf-8 feed id
+_PRICE_JSON = 3  # keep_raw=True
+_PAIR_DATA = 4
+_ORDER_EVENT = 5
+
+_KINDS = {
+    "price": (_TICKS, _PRICE_STR, _PRICE_JSON),
+    "pair_data": (_PAIR_DATA,),
+    "order_event": (_ORDER_EVENT,),
+}
+
+Message = PriceUpdate | OrderEvent | dict[str, Any]
+Callback = Callable[[Any], Awaitable[None] | None]
+
+
+def _opt(value: float | None) -> float:
+    return math.nan if value is None else value
+
+
+class StreamRecorder:
+    """Append-only capture of stream messages.
+
+    >>> with StreamRecorder("eth.avsrec") as rec:
+    ...     await stream.run(rec.tap(strategy))   # record and pass through
+
+    ``tap(callback)`` returns a callback that records each message, then
+    forwards it; :meth:`record` takes any ``PriceUpdate``, ``OrderEvent`` or
+    ``PairDataStream`` payload dict directly. Lazer ticks are held until a
+    block fills (``block_size``) or another kind of message arrives; call
+    :meth:`flush` (or close) to make everything visible to a replay.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        keep_raw: bool = False,
+        block_size: int = 1024,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.keep_raw = keep_raw
+        self.block_size = block_size
+        self._fh: BinaryIO = open(self.path, "ab")
+        if self._fh.tell() == 0:
+            self._fh.write(MAGIC)
+        self._ticks: list[bytes] = []
+        self._ticks_ns = 0
+        self.records = 0
+
+    def record(self, message: Message, *, recv_ns: int | None = None) -> None:
+        recv_ns = time.time_ns() if recv_ns is None else recv_ns
+        if isinstance(message, PriceUpdate):
+            if not self.keep_raw and isinstance(message.feed_id, int):
+                if not self._ticks:
+                    self._ticks_ns = recv_ns
+                self._ticks.append(
+                    _TICK.pack(
+                        recv_ns,
+                        message.feed_id,
+                        message.price,
+                        -1 if message.timestamp_ms is None else message.timestamp_ms,
+                        _opt(message.best_bid),
+                        _opt(message.best_ask),
+                    )
+                )
+                self.records += 1
+                if len(self._ticks) >= self.block_size:
+                    self._write_ticks()
+                return
+            kind, payload = self._encode_price(message)
+        elif isinstance(message, OrderEvent):
+            kind = _ORDER_EVENT
+            payload = json.dumps(
+                {"event": message.event, "data": message.data, "channel": message.channel},
+                separators=(",", ":"),
+            ).encode()
+        elif isinstance(message, dict):
+            kind, payload = _PAIR_DATA, json.dumps(message, separators=(",", ":")).encode()
+        else:
+            raise TypeError(f"cannot record {type(message).__name__}")
+        self._write_ticks()  # keep the log in receive order
+        self._write(kind, payload, recv_ns)
+        self.records += 1
+
+    def _encode_price(self, update: PriceUpdate) -> tuple[int, bytes]:
+        if self.keep_raw:
+            return _PRICE_JSON, json.dumps(
+                {
+                    "feed_id": update.feed_id,
+                    "price": update.price,
+                    "timestamp_ms": update.timestamp_ms,
+                    "best_bid": update.best_bid,
+                    "best_ask": update.best_ask,
+                    "raw": update.raw,
+                },
+                separators=(",", ":"),
+            ).encode()
+        fixed = _PRICE.pack(
+            update.price,
+            -1 if update.timestamp_ms is None else update.timestamp_ms,
+            _opt(update.best_bid),
+            _opt(update.best_ask),
+        )
+        return _PRICE_STR, fixed + str(update.feed_id).encode()
+
+    def _write(self, kind: int, payload: bytes, recv_ns: int) -> None:
+        self._fh.write(_HEADER.pack(kind, len(payload), recv_ns))
+        self._fh.write(payload)
+
+    def _write_ticks(self) -> None:
+        if self._ticks:
+            self._write(_TICKS, b"".join(self._ticks), self._ticks_ns)
+            self._ticks.clear()
+
+    def tap(self, callback: Callback | None = None) -> Callback:
+        """Stream callback that records each message, then forwards it."""
+
+        async def _tap(message: Message) -> None:
+            self.record(message)
+            if callback is not None:
+                result = callback(message)
+                if asyncio.iscoroutine(result):
+                    await result
+
+        return _tap
+
+    def flush(self) -> None:
+        self._write_ticks()
+        self._fh.flush()
+
+    def close(self) -> None:
+        if not self._fh.closed:
+            self.flush()
+            self._fh.close()
+
+    def __enter__(self) -> StreamRecorder:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class StreamReplay:
+    """Re-emit a recorded log through the live-stream interface.
+
+    ``speed=None`` (default) replays as fast as possible; ``speed=1.0``
+    reproduces the recorded receive-time gaps, ``2.0`` twice as fast.
+    ``kinds`` limits the replay to ``"price"``, ``"pair_data"`` and/or
+    ``"order_event"`` messages. :attr:`recv_ns` is the receive time of the
+    message currently being delivered.
+    """
+
+    # As-fast-as-possible mode yields to the event loop every N messages so
+    # stop() and other tasks still get to run.
+    yield_every = 4096
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        speed: float | None = None,
+        kinds: set[str] | None = None,
+    ) -> None:
+        if speed is not None and speed <= 0:
+            raise ConfigError("speed must be > 0 (None replays as fast as possible)")
+        if kinds is not None and not kinds <= _KINDS.keys():
+            raise ConfigError(f"kinds must be a subset of {sorted(_KINDS)}")
+        self.path = os.fspath(path)
+        self.speed = speed
+        self._kinds = {k for name in (kinds or _KINDS) for k in _KINDS[name]}
+        self._stop = asyncio.Event()
+        self.recv_ns = 0
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def messages(self) -> Iterator[tuple[int, Message]]:
+        """``(recv_ns, message)`` for every record, straight off the map."""
+        with open(self.path, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size <= len(MAGIC):
+                return
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                if buf[: len(MAGIC)] != MAGIC:
+                    raise ConfigError(f"{self.path} is not a stream recording")
+                view = memoryview(buf)
+                try:
+                    yield from self._decode(buf, view)
+                finally:
+                    view.release()
+
+    def _decode(self, buf: mmap.mmap, view: memoryview) -> Iterator[tuple[int, Message]]:
+        unpack_header = _HEADER.unpack_from
+        unpack_price = _PRICE.unpack_from
+        iter_ticks = _TICK.iter_unpack
+        header_size, price_size = _HEADER.size, _PRICE.size
+        kinds, end, offset = self._kinds, len(buf), len(MAGIC)
+        while offset + header_size <= end:
+            kind, length, recv_ns = unpack_header(buf, offset)
+            offset += header_size
+            start, offset = offset, offset + length
+            if offset > end:
+                return  # torn tail from a crashed writer
+            if kind not in kinds:
+                continue
+            if kind == _TICKS:
+                block = view[start:offset]
+                try:
+                    for recv_ns, feed, price, ts, bid, ask in iter_ticks(block):
+                        yield recv_ns, PriceUpdate(
+                            feed,
+                            price,
+                            None if ts < 0 else ts,
+                            None if bid != bid else bid,  # NaN -> None
+                            None if ask != ask else ask,
+                        )
+                finally:
+                    block.release()
+            elif kind == _PRICE_STR:
+                price, ts, bid, ask = unpack_price(buf, start)
+                yield recv_ns, PriceUpdate(
+                    buf[start + price_size : offset].decode(),
+                    price,
+                    None if ts < 0 else ts,
+                    None if bid != bid else bid,
+                    None if ask != ask else ask,
+                )
+            elif kind == _PRICE_JSON:
+                yield recv_ns, PriceUpdate(**json.loads(buf[start:offset]))
+            elif kind == _ORDER_EVENT:
+                yield recv_ns, OrderEvent(**json.loads(buf[start:offset]))
+            elif kind == _PAIR_DATA:
+                yield recv_ns, json.loads(buf[start:offset])
+
+    async def run(self, callback: Callback) -> None:
+        """Deliver every recorded message to ``callback`` (sync or async)."""
+        if self.speed is not None:
+            await self._run_paced(callback, self.speed)
+            return
+        stop, yield_every = self._stop, self.yield_every
+        countdown = yield_every
+        iscoroutine = asyncio.iscoroutine
+        for recv_ns, message in self.messages():
+            countdown -= 1
+            if not countdown:
+                countdown = yield_every
+                await asyncio.sleep(0)
+                if stop.is_set():
+                    return
+            self.recv_ns = recv_ns
+            result = callback(message)
+            if result is not None and iscoroutine(result):
+                await result
+                if stop.is_set():
+                    return
+
+    async def _run_paced(self, callback: Callback, speed: float) -> None:
+        loop = asyncio.get_running_loop()
+        first_ns: int | None = None
+        started = loop.time()
+        for recv_ns, message in self.messages():
+            if first_ns is None:
+                first_ns = recv_ns
+            delay = started + (recv_ns - first_ns) / 1e9 / speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self._stop.is_set():
+                return
+            self.recv_ns = recv_ns
+            result = callback(message)
+            if asyncio.iscoroutine(result):
+                await result
+
+    async def __aiter__(self) -> AsyncIterator[Message]:
+        queue: asyncio.Queue[Message] = asyncio.Queue(maxsize=self.yield_every)
+        task = asyncio.create_task(self.run(queue.put))
+        try:
+            while not (task.done() and queue.empty()):
+                getter = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait(
+                    {getter, task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if getter in done:
+                    yield getter.result()
+                else:
+                    getter.cancel()
+            task.result()
+        finally:
+            self.stop()
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
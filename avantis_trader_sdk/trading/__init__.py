@@ -1,3 +1,5 @@
 from .api import TradeApi
+from .confirmations import TpSlConfirmations
+from .models import BulkResult, TpSlLevel, TpSlUpdate
 
-__all__ = ["TradeApi"]
+__all__ = ["TradeApi", "TpSlConfirmations", "BulkResult", "TpSlLevel", "TpSlUpdate"]
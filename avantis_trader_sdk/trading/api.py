@@ -20,15 +20,17 @@ means upside pairs are market-only: no limit/stop opens and no TWAP.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import Awaitable, Callable, Mapping
 from typing import Any
 
+from .._aio import gather_bounded
 from ..account.models import Position, UserData
 from ..base_api import ExecutingApi
 from ..config import AvantisConfig
-from ..errors import ApiError, ConfigError, RelayTimeoutError, ValidationError
+from ..errors import ApiError, ConfigError, ValidationError
 from ..execution import ExecutionEngine
-from ..execution.batched_market import BatchedMarketEventHook
+from ..execution.batched_market import BatchedMarketEvent, BatchedMarketEventHook
 from ..execution.local_intents import LocalIntentBuilder
 from ..markets.models import PairInfo
 from ..signing import sign_intent
@@ -45,12 +47,32 @@ from ..types import (
     TriggerType,
     from_1e10,
 )
+from .confirmations import TpSlConfirmations
+from .models import BulkResult, TpSlLevel, TpSlUpdate
 
 PairRef = str | int
 
 
+def _fill_direction(
+    on_event: BatchedMarketEventHook | None, *, opening: bool
+) -> BatchedMarketEventHook | None:
+    """``on_event`` with the ``MarketOrderExecuted`` terminal tagged ``open``
+    (unless the server already sent it), so ``markets.apply_fill`` knows
+    whether the fill added or removed open interest."""
+    if on_event is None:
+        return None
+
+    def hook(ev: BatchedMarketEvent) -> Any:
+        if ev.type == "MarketOrderExecuted":
+            ev = BatchedMarketEvent(ev.type, {"open": opening, **ev.data}, ev.seq)
+        return on_event(ev)
+
+    return hook
+
+
 class TradeApi(ExecutingApi):
     _local: LocalIntentBuilder | None = None  # lazy; for locally-built intents
+    _confirmations: TpSlConfirmations | None = None  # lazy; shared TP/SL watcher
 
     def __init__(
         self,
@@ -167,7 +189,11 @@ class TradeApi(ExecutingApi):
                 else AggregatorOrderType.MARKET_OPEN
             )
             return await self._engine.submit_intent_batch(
-                intent, agg, calldata=calldata, wait=wait, on_event=on_event
+                intent,
+                agg,
+                calldata=calldata,
+                wait=wait,
+                on_event=_fill_direction(on_event, opening=True),
             )
         return await self._engine.submit_direct(
             await self._calldata("/v2/trade/open", params), wait=wait
@@ -228,7 +254,11 @@ class TradeApi(ExecutingApi):
                 else AggregatorOrderType.MARKET_OPEN_WITH_COIN_EXPOSURE
             )
             return await self._engine.submit_intent_batch(
-                intent, agg, calldata=calldata, wait=wait, on_event=on_event
+                intent,
+                agg,
+                calldata=calldata,
+                wait=wait,
+                on_event=_fill_direction(on_event, opening=True),
             )
         return await self._engine.submit_direct(
             await self._calldata("/v2/trade/open-coin", params), wait=wait
@@ -313,7 +343,11 @@ class TradeApi(ExecutingApi):
                 else AggregatorOrderType.MARKET_CLOSE
             )
             return await self._engine.submit_intent_batch(
-                intent, agg, calldata=calldata, wait=wait, on_event=on_event
+                intent,
+                agg,
+                calldata=calldata,
+                wait=wait,
+                on_event=_fill_direction(on_event, opening=False),
             )
         return await self._engine.submit_direct(
             await self._calldata("/v2/trade/close", params), wait=wait
@@ -351,12 +385,172 @@ class TradeApi(ExecutingApi):
                 else AggregatorOrderType.MARKET_CLOSE_WITH_COIN_EXPOSURE
             )
             return await self._engine.submit_intent_batch(
-                intent, agg, calldata=calldata, wait=wait, on_event=on_event
+                intent,
+                agg,
+                calldata=calldata,
+                wait=wait,
+                on_event=_fill_direction(on_event, opening=False),
             )
         return await self._engine.submit_direct(
             await self._calldata("/v2/trade/close-coin", params), wait=wait
         )
 
+    # ------------------------------------------------------------------ bulk closes
+
+    async def _last_prices(self) -> dict[int, float]:
+        """pairIndex -> latest price from ONE feed-v3 last-price read (the
+        endpoint returns every pair, so bulk closes price the whole book at
+        the cost of a single request)."""
+        assert self._t is not None
+        data = await self._t.json(
+            "GET", f"{self._cfg.feed_url}/v1/price-feeds/last-price", hedge="last-price"
+        )
+        rows = data if isinstance(data, list) else data.get("data", [])
+        return {int(row["pairIndex"]): float(row["c"]) for row in rows}
+
+    async def close_many(
+        self,
+        positions: list[Position | tuple[PairRef, int]],
+        *,
+        prices: dict[int, Num] | None = None,
+        max_in_flight: int = 8,
+        wait: bool = True,
+        on_event: BatchedMarketEventHook | None = None,
+    ) -> list[BulkResult[ExecutionReceipt]]:
+        """Fully close several positions concurrently.
+
+        ``positions`` are ``account.positions()`` entries or ``(pair,
+        trade_index)`` refs; refs are resolved against ONE ``/user-data``
+        read. On the relayer route each CloseTradeReq is built locally from
+        the snapshot (full collateral, the position's open timestamp),
+        signed up front, and submitted to batched-market with at most
+        ``max_in_flight`` orders in flight; Upside positions take the PnL
+        close type automatically. The direct route runs
+        :meth:`market_close` per position under the same cap.
+
+        Relayer-route pricing: every CloseTradeReq's ``wanted_price`` (the
+        slippage reference the keeper checks) comes from ONE feed-v3
+        last-price read taken before signing, not a read per close. Pass
+        ``prices`` (pairIndex -> price) to supply your own, e.g. from a
+        live price stream when the market is moving fast.
+
+        Returns one :class:`BulkResult` per input, in input order; a
+        declined or rejected close fails only its own slot.
+        """
+        results = [BulkResult[ExecutionReceipt](item=p) for p in positions]
+        resolved: list[tuple[int, Position]] = []
+        user_data = None
+        for slot, ref in enumerate(positions):
+            if isinstance(ref, Position):
+                resolved.append((slot, ref))
+                continue
+            try:
+                info = await self._resolve_pair(ref[0])
+                if user_data is None:
+                    user_data = await self._fetch_user_data()
+                position = user_data.position(info.index, ref[1])
+                if position is None:
+                    raise ValidationError(
+                        f"no open position for {self.trader} at "
+                        f"pairIndex={info.index} index={ref[1]}",
+                        code="NO_POSITION",
+                        status=404,
+                    )
+            except Exception as exc:
+                results[slot].error = exc
+                continue
+            results[slot].item = position
+            resolved.append((slot, position))
+        if not resolved:
+            return results
+
+        if not self._engine.is_relayer_mode:
+            slots = [slot for slot, _ in resolved]
+            outcomes = await gather_bounded(
+                (
+                    self.market_close(
+                        p.pair_index, p.index, p.collateral,
+                        open_timestamp=p.opened_at or None, wait=wait,
+                    )
+                    for _, p in resolved
+                ),
+                max_in_flight,
+                return_exceptions=True,
+            )
+        else:
+            signer = self._engine.signer
+            if signer is None:
+                raise ConfigError("close_many requires a signing key")
+            builder = await self._local_intents()
+            book: Mapping[int, Num] = (
+                prices if prices is not None else await self._last_prices()
+            )
+            signed: list[tuple[int, IntentPayload, str, AggregatorOrderType]] = []
+            for slot, position in resolved:
+                price = book.get(position.pair_index)
+                if price is None:
+                    results[slot].error = ApiError(
+                        f"no last price for pairIndex={position.pair_index}"
+                    )
+                    continue
+                intent = builder.close_trade(
+                    trader=position.trader,
+                    pair_index=position.pair_index,
+                    index=position.index,
+                    open_timestamp=position.opened_at,
+                    amount_usdc=position.collateral,
+                    wanted_price=price,
+                )
+                agg = (
+                    AggregatorOrderType.MARKET_CLOSE_PNL
+                    if position.is_upside
+                    else AggregatorOrderType.MARKET_CLOSE
+                )
+                signed.append(
+                    (slot, intent, sign_intent(intent, signer).signature, agg)
+                )
+            slots = [slot for slot, *_ in signed]
+            closes = _fill_direction(on_event, opening=False)
+            outcomes = await gather_bounded(
+                (
+                    self._engine.submit_intent_batch(
+                        intent, agg, wait=wait, on_event=closes, signature=sig
+                    )
+                    for _, intent, sig, agg in signed
+                ),
+                max_in_flight,
+                return_exceptions=True,
+            )
+        for slot, out in zip(slots, outcomes, strict=True):
+            results[slot] = BulkResult.of(results[slot].item, out)
+        return results
+
+    async def close_all(
+        self,
+        filter: Callable[[Position], bool] | None = None,
+        *,
+        prices: dict[int, Num] | None = None,
+        max_in_flight: int = 8,
+        wait: bool = True,
+        on_event: BatchedMarketEventHook | None = None,
+    ) -> list[BulkResult[ExecutionReceipt]]:
+        """Flatten the book: fully close every open position (or those
+        ``filter`` keeps) from one ``/user-data`` read, via
+        :meth:`close_many`.
+
+        >>> await client.trade.close_all(lambda p: p.pair_index == 1)
+        """
+        positions = (await self._fetch_user_data()).positions
+        if filter is not None:
+            positions = [p for p in positions if filter(p)]
+        return await self.close_many(
+            list(positions),
+            prices=prices,
+            max_in_flight=max_in_flight,
+            wait=wait,
+            on_event=on_event,
+        )
+
     # ------------------------------------------------------------------ limit order mgmt
 
     async def update_limit_order(
@@ -527,17 +721,22 @@ class TradeApi(ExecutingApi):
             await self._calldata("/v2/position/increase-coin", params), wait=wait
         )
 
-    async def _fetch_position(self, pair_index: int, trade_index: int) -> Position:
-        """The open position at (trader, pairIndex, index) from the core API,
-        or a 404-flavored ValidationError (mirrors the backend's global
-        price-trigger path, which rejects mutations on unknown positions)."""
+    async def _fetch_user_data(self) -> UserData:
+        """The trader's account snapshot from the core API ``/user-data``."""
         assert self._t is not None
         data = await self._t.json(
             "GET",
             f"{self._cfg.core_api_url}/user-data",
             params={"trader": self.trader},
+            hedge="user-data",
         )
-        position = UserData.model_validate(data).position(pair_index, trade_index)
+        return UserData.model_validate(data)
+
+    async def _fetch_position(self, pair_index: int, trade_index: int) -> Position:
+        """The open position at (trader, pairIndex, index) from the core API,
+        or a 404-flavored ValidationError (mirrors the backend's global
+        price-trigger path, which rejects mutations on unknown positions)."""
+        position = (await self._fetch_user_data()).position(pair_index, trade_index)
         if position is None:
             raise ValidationError(
                 f"no open position for {self.trader} at pairIndex={pair_index} "
@@ -570,7 +769,8 @@ class TradeApi(ExecutingApi):
         executes ``executePositionUpdateBatched(UPDATE_SL, ...)`` through the
         Avantis operator. Same path in relayer and direct mode. A 2xx means
         ACCEPTED for execution, not mined: with ``wait=True`` the SDK polls
-        the position until the new levels are visible on ``/user-data``.
+        the position until the new levels are visible on ``/user-data``
+        (concurrent updates share one poll; see :attr:`tp_sl_confirmations`).
 
         These levels surface on positions as the ``priceTriggers`` entries
         flagged ``isGlobal`` (deterministic ``global-tp-*`` / ``global-sl-*``
@@ -598,33 +798,59 @@ class TradeApi(ExecutingApi):
         )
         signed = sign_intent(intent, signer)
 
+        receipt = await self._put_global_tp_sl(
+            position, intent, signed.signature, tp_changed=take_profit is not None
+        )
+        if wait:
+            await self._wait_for_tp_sl_change(
+                info.index,
+                trade_index,
+                before=(position.tp_raw, position.sl_raw),
+                expected=(str(intent.message["_newTp"]), str(intent.message["_newSl"])),
+            )
+        return receipt
+
+    async def _put_global_tp_sl(
+        self,
+        position: Position,
+        intent: IntentPayload,
+        signature: str,
+        *,
+        tp_changed: bool,
+    ) -> ExecutionReceipt:
+        """Submit a signed UpdateTpSlReq to the core API (ACCEPTED, not mined)."""
         # Either leg's synthetic id addresses the same position; the backend
         # routes on the id shape and validates trader/pair/index against the
         # signed intent. Use the leg being changed for readability.
-        kind = "tp" if take_profit is not None else "sl"
-        entity_id = f"global-{kind}-{position.trader}-{info.index}-{trade_index}"
+        kind = "tp" if tp_changed else "sl"
+        entity_id = (
+            f"global-{kind}-{position.trader}-{position.pair_index}-{position.index}"
+        )
         assert self._t is not None
         response = await self._t.json(
             "PUT",
             f"{self._cfg.core_api_url}/price-triggers/{entity_id}",
-            json={
-                "userIntent": intent.encoded_intent,
-                "signedMessage": signed.signature,
-            },
+            json={"userIntent": intent.encoded_intent, "signedMessage": signature},
         )
-        receipt = ExecutionReceipt(
+        return ExecutionReceipt(
             route="price-triggers",
             description=intent.intent,
             raw=response if isinstance(response, dict) else None,
         )
-        if wait:
-            await self._wait_for_tp_sl_change(
-                info.index,
-                trade_index,
-                before=(position.tp_raw, position.sl_raw),
-                expected=(str(intent.message["_newTp"]), str(intent.message["_newSl"])),
+
+    @property
+    def tp_sl_confirmations(self) -> TpSlConfirmations:
+        """Shared watcher behind ``update_tp_sl(wait=True)``: one ``/user-data``
+        poll per interval resolves every pending update (see
+        :class:`~avantis_trader_sdk.trading.confirmations.TpSlConfirmations`;
+        feed it snapshots via ``observe()`` or ``poke()`` it on events)."""
+        if self._confirmations is None:
+            self._confirmations = TpSlConfirmations(
+                self._fetch_user_data,
+                poll_interval_s=self._cfg.relay_poll_interval_s,
+                timeout_s=self._cfg.relay_poll_timeout_s,
             )
-        return receipt
+        return self._confirmations
 
     async def _wait_for_tp_sl_change(
         self,
@@ -634,42 +860,14 @@ class TradeApi(ExecutingApi):
         before: tuple[str, str],
         expected: tuple[str, str],
     ) -> None:
-        """Poll /user-data until the position's (tp, sl) match the accepted
-        update. ``take_profit=0`` is contract-corrected to the max-gain price
-        (PairStorage.correctTp), so an exact match cannot be required for a
-        zero TP leg; any change from the pre-update snapshot settles it too.
-
-        One reset case is unobservable: signing ``_newTp = 0`` when the TP
-        already sits at the corrected default re-stores the same value, so
-        nothing on /user-data changes. If the timeout expires with every
-        OTHER leg confirmed and only a zero-TP leg pending, the update is
-        treated as settled instead of raising."""
-        sl_ok = False
-        now = before
-        deadline = asyncio.get_event_loop().time() + self._cfg.relay_poll_timeout_s
-        while asyncio.get_event_loop().time() < deadline:
-            position = await self._fetch_position(pair_index, trade_index)
-            now = (position.tp_raw, position.sl_raw)
-            tp_ok = now[0] == expected[0] or (expected[0] == "0" and now[0] != before[0])
-            sl_ok = now[1] == expected[1]
-            if tp_ok and sl_ok:
-                return
-            await asyncio.sleep(self._cfg.relay_poll_interval_s)
-        if sl_ok and expected[0] == "0":
-            return  # zero-TP reset with no observable change (see docstring)
-
-        def _px(raw: str) -> str:
-            return f"{float(from_1e10(raw)):g}"
-
-        raise RelayTimeoutError(
-            f"TP/SL update accepted but not visible on the position after "
-            f"{self._cfg.relay_poll_timeout_s:.0f}s (pairIndex={pair_index} "
-            f"index={trade_index}): signed UpdateTpSlReq with "
-            f"tp={_px(expected[0])} sl={_px(expected[1])}"
-            f"{' (tp=0 resets to the max-gain cap)' if expected[0] == '0' else ''}, "
-            f"position still shows tp={_px(now[0])} sl={_px(now[1])} "
-            f"(was tp={_px(before[0])} sl={_px(before[1])} before the update). "
-            f"The operator may still execute it; re-check account.positions()."
+        """Wait until the position's (tp, sl) match the accepted update.
+
+        Delegates to the shared :attr:`tp_sl_confirmations` watcher so
+        concurrent updates on many positions share one account poll; the
+        zero-TP reset semantics live in
+        :meth:`TpSlConfirmations.expect`."""
+        await self.tp_sl_confirmations.expect(
+            pair_index, trade_index, before=before, expected=expected
         )
 
     async def _partial_tp_sl_submission(
@@ -704,7 +902,11 @@ class TradeApi(ExecutingApi):
         signer = self._engine.signer
         if signer is None:
             raise ConfigError("partial_tp_sl requires a signing key")
-        signed = sign_intent(intent, signer)
+        return self._tp_sl_submission_body(intent, sign_intent(intent, signer).signature)
+
+    @staticmethod
+    def _tp_sl_submission_body(intent: IntentPayload, signature: str) -> dict[str, Any]:
+        """Core-API ``/price-triggers`` body for a signed TpSlReq."""
         msg = intent.message
         submission = {
             "trader": msg["trader"],
@@ -718,7 +920,7 @@ class TradeApi(ExecutingApi):
             "timestamp": int(msg["timestamp"]),
             "signTimestamp": int(msg["signTimestamp"]),
             "orderType": int(msg["orderType"]),
-            "signedMessage": signed.signature,
+            "signedMessage": signature,
         }
         if "nonce" in msg:
             submission["nonce"] = str(msg["nonce"])
@@ -864,6 +1066,172 @@ class TradeApi(ExecutingApi):
             json={"entityId": str(entity_id), "signedMessage": signed.signature},
         )
 
+    # ------------------------------------------------------------------ bulk TP/SL
+
+    async def tp_sl_ladder(
+        self,
+        position: Position,
+        levels: list[TpSlLevel],
+        *,
+        max_in_flight: int = 8,
+    ) -> list[BulkResult[dict[str, Any]]]:
+        """Place several partial TP/SL orders on one position in one go.
+
+        ``position`` is an ``account.positions()`` entry; its trader, side
+        and open timestamp are read from that snapshot, so no per-level
+        tx-builder or account round-trip happens. Every TpSlReq is built
+        locally and signed up front (an invalid level raises before anything
+        is submitted), then ``POST {core}/price-triggers`` runs concurrently
+        with at most ``max_in_flight`` requests open.
+
+        Returns one :class:`BulkResult` per level, in input order; ``result``
+        is the stored order (as from :meth:`partial_tp_sl`), ``error`` the
+        exception a rejected level raised.
+        """
+        signer = self._engine.signer
+        if signer is None:
+            raise ConfigError("tp_sl_ladder requires a signing key")
+        builder = await self._local_intents()
+        sign_timestamp_ms = int(time.time() * 1000)
+        submissions = []
+        for level in levels:
+            intent = builder.partial_tp_sl(
+                trader=position.trader,
+                pair_index=position.pair_index,
+                index=position.index,
+                kind=level.kind,
+                is_long=position.buy,
+                coin_exposure=level.coin_exposure,
+                open_timestamp=position.opened_at,
+                trigger=level.trigger_type.value,
+                price=level.price,
+                percentage=level.percentage,
+                sign_timestamp_ms=sign_timestamp_ms,
+            )
+            submissions.append(
+                self._tp_sl_submission_body(
+                    intent, sign_intent(intent, signer).signature
+                )
+            )
+
+        async def _post(submission: dict[str, Any]) -> dict[str, Any]:
+            assert self._t is not None
+            stored = await self._t.json(
+                "POST", f"{self._cfg.core_api_url}/price-triggers", json=submission
+            )
+            return {**submission, **(stored if isinstance(stored, dict) else {})}
+
+        outcomes = await gather_bounded(
+            (_post(s) for s in submissions), max_in_flight, return_exceptions=True
+        )
+        return [BulkResult.of(level, out) for level, out in zip(levels, outcomes, strict=True)]
+
+    async def update_tp_sl_many(
+        self,
+        updates: list[TpSlUpdate],
+        *,
+        wait: bool = True,
+        max_in_flight: int = 8,
+    ) -> list[BulkResult[ExecutionReceipt]]:
+        """:meth:`update_tp_sl` for many positions from ONE account read.
+
+        Positions come from a single ``/user-data`` snapshot, the
+        UpdateTpSlReq intents are built locally and signed in a batch, and
+        the ``PUT /price-triggers/global-...`` calls run concurrently with at
+        most ``max_in_flight`` open. With ``wait=True`` every accepted update
+        is then confirmed through the shared :attr:`tp_sl_confirmations`
+        watcher (one poll for all of them).
+
+        Returns one :class:`BulkResult` per update, in input order. A bad
+        entry (unknown pair, no open position, nothing to update) fails only
+        its own slot.
+        """
+        signer = self._engine.signer
+        if signer is None:
+            raise ConfigError("update_tp_sl_many requires a signing key")
+        builder = await self._local_intents()
+        user_data = await self._fetch_user_data()
+
+        results = [BulkResult[ExecutionReceipt](item=u) for u in updates]
+        prepared: list[tuple[int, Position, IntentPayload, str]] = []
+        for slot, update in enumerate(updates):
+            try:
+                if update.take_profit is None and update.stop_loss is None:
+                    raise ValidationError(
+                        "update_tp_sl needs take_profit and/or stop_loss",
+                        code="NOTHING_TO_UPDATE",
+                    )
+                info = await self._resolve_pair(update.pair)
+                position = user_data.position(info.index, update.trade_index)
+                if position is None:
+                    raise ValidationError(
+                        f"no open position for {self.trader} at "
+                        f"pairIndex={info.index} index={update.trade_index}",
+                        code="NO_POSITION",
+                        status=404,
+                    )
+                intent = builder.update_tp_sl(
+                    trader=self.trader,
+                    pair_index=info.index,
+                    index=update.trade_index,
+                    tp=(
+                        update.take_profit
+                        if update.take_profit is not None
+                        else from_1e10(position.tp_raw)
+                    ),
+                    sl=(
+                        update.stop_loss
+                        if update.stop_loss is not None
+                        else from_1e10(position.sl_raw)
+                    ),
+                )
+            except Exception as exc:
+                results[slot].error = exc
+                continue
+            prepared.append(
+                (slot, position, intent, sign_intent(intent, signer).signature)
+            )
+
+        outcomes = await gather_bounded(
+            (
+                self._put_global_tp_sl(
+                    position,
+                    intent,
+                    signature,
+                    tp_changed=updates[slot].take_profit is not None,
+                )
+                for slot, position, intent, signature in prepared
+            ),
+            max_in_flight,
+            return_exceptions=True,
+        )
+        accepted = []
+        for (slot, position, intent, _), out in zip(prepared, outcomes, strict=True):
+            results[slot] = BulkResult.of(updates[slot], out)
+            if results[slot].ok:
+                accepted.append((slot, position, intent))
+
+        if wait and accepted:
+            confirmations = await asyncio.gather(
+                *(
+                    self._wait_for_tp_sl_change(
+                        position.pair_index,
+                        position.index,
+                        before=(position.tp_raw, position.sl_raw),
+                        expected=(
+                            str(intent.message["_newTp"]),
+                            str(intent.message["_newSl"]),
+                        ),
+                    )
+                    for _, position, intent in accepted
+                ),
+                return_exceptions=True,
+            )
+            for (slot, _, _), out in zip(accepted, confirmations, strict=True):
+                # keeps the receipt; a cancelled confirmation is re-raised
+                results[slot].error = BulkResult.of(updates[slot], out).error
+        return results
+
     # ------------------------------------------------------------------ TWAP / RFQ
 
     async def _submit_twap(self, path: str, intent: IntentPayload) -> ExecutionReceipt:
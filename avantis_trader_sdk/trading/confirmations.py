@@ -0,0 +1,230 @@
+"""Shared confirmation of accepted global TP/SL updates.
+
+A 2xx from ``PUT /price-triggers/global-...`` means ACCEPTED, not mined, so
+``update_tp_sl(wait=True)`` has to watch the position until the new levels
+show up on ``/user-data``. Polling once per call scales badly (30 updates =
+30 loops each downloading the whole account); :class:`TpSlConfirmations`
+keeps ONE watcher per trader instead: every pending expectation is keyed by
+``(pairIndex, index)`` and all of them are resolved from the same account
+snapshot, one fetch per ``poll_interval_s``.
+
+Snapshots can also be pushed in (:meth:`TpSlConfirmations.observe`, e.g.
+from an ``account.positions()`` read the caller does anyway) and an early
+poll requested (:meth:`TpSlConfirmations.poke`, e.g. on an
+``OrderEventStream`` event), so confirmations are event-driven when such a
+source exists and fall back to the interval otherwise.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from ..account.models import UserData
+from ..errors import RelayTimeoutError, ValidationError
+from ..types import from_1e10
+
+FetchUserData = Callable[[], Awaitable[UserData]]
+
+
+@dataclass
+class _Pending:
+    pair_index: int
+    trade_index: int
+    before: tuple[str, str]
+    expected: tuple[str, str]
+    timeout_s: float
+    deadline: float
+    future: asyncio.Future[None]
+    now: tuple[str, str] | None = None
+    sl_ok: bool = False
+
+    def check(self, tp_raw: str, sl_raw: str) -> bool:
+        """Record the observed levels; True once the update is visible.
+
+        ``take_profit=0`` is contract-corrected to the max-gain price
+        (PairStorage.correctTp), so an exact match cannot be required for a
+        zero TP leg; any change from the pre-update snapshot settles it too.
+        """
+        self.now = (tp_raw, sl_raw)
+        tp_ok = tp_raw == self.expected[0] or (
+            self.expected[0] == "0" and tp_raw != self.before[0]
+        )
+        self.sl_ok = sl_raw == self.expected[1]
+        return tp_ok and self.sl_ok
+
+
+class TpSlConfirmations:
+    """One ``/user-data`` watcher resolving every pending TP/SL expectation.
+
+    The poll task only runs while something is pending and stops by itself
+    once the last expectation settles, so an idle client costs nothing. A
+    failed poll is kept in ``last_error`` and retried on the next interval;
+    it only surfaces (as the cause of the timeout) on entries whose own
+    deadline passes before a poll succeeds.
+    """
+
+    def __init__(
+        self,
+        fetch_user_data: FetchUserData,
+        *,
+        poll_interval_s: float = 1.0,
+        timeout_s: float = 60.0,
+    ) -> None:
+        self._fetch = fetch_user_data
+        self.poll_interval_s = poll_interval_s
+        self.timeout_s = timeout_s
+        self._pending: dict[tuple[int, int], list[_Pending]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._wake = asyncio.Event()
+        self.last_error: Exception | None = None  # the last failed poll
+
+    @property
+    def pending(self) -> int:
+        """Number of expectations still waiting for confirmation."""
+        return sum(len(entries) for entries in self._pending.values())
+
+    async def expect(
+        self,
+        pair_index: int,
+        trade_index: int,
+        *,
+        before: tuple[str, str],
+        expected: tuple[str, str],
+        timeout_s: float | None = None,
+    ) -> None:
+        """Wait until the position shows ``expected`` (raw tp, sl).
+
+        ``before`` is the pre-update (tp, sl) snapshot. Raises
+        :class:`RelayTimeoutError` when the levels are not visible in time and
+        ``ValidationError(NO_POSITION)`` when the position disappears.
+
+        One reset case is unobservable: signing ``_newTp = 0`` when the TP
+        already sits at the corrected default re-stores the same value, so
+        nothing on /user-data changes. If the timeout expires with every
+        OTHER leg confirmed and only a zero-TP leg pending, the update is
+        treated as settled instead of raising.
+        """
+        loop = asyncio.get_running_loop()
+        timeout = timeout_s if timeout_s is not None else self.timeout_s
+        entry = _Pending(
+            pair_index=pair_index,
+            trade_index=trade_index,
+            before=before,
+            expected=expected,
+            timeout_s=timeout,
+            deadline=loop.time() + timeout,
+            future=loop.create_future(),
+        )
+        self._pending.setdefault((pair_index, trade_index), []).append(entry)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        else:
+            self._wake.set()  # poll right away for the newcomer
+        try:
+            await entry.future
+        finally:
+            self._discard(entry)
+
+    def observe(self, user_data: UserData) -> None:
+        """Resolve pending expectations from an externally fetched snapshot."""
+        for (pair_index, trade_index), entries in list(self._pending.items()):
+            position = user_data.position(pair_index, trade_index)
+            for entry in list(entries):
+                if entry.future.done():
+                    continue
+                if position is None:
+                    entry.future.set_exception(
+                        ValidationError(
+                            f"no open position at pairIndex={pair_index} "
+                            f"index={trade_index}",
+                            code="NO_POSITION",
+                            status=404,
+                        )
+                    )
+                elif entry.check(position.tp_raw, position.sl_raw):
+                    entry.future.set_result(None)
+
+    def poke(self) -> None:
+        """Request an immediate poll (e.g. on an order-execution event)."""
+        self._wake.set()
+
+    async def aclose(self) -> None:
+        """Stop the poll task; still-pending waiters are cancelled."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for entries in self._pending.values():
+            for entry in entries:
+                entry.future.cancel()
+
+    # ------------------------------------------------------------------ internal
+
+    def _discard(self, entry: _Pending) -> None:
+        key = (entry.pair_index, entry.trade_index)
+        entries = self._pending.get(key)
+        if entries is None:
+            return
+        with contextlib.suppress(ValueError):
+            entries.remove(entry)
+        if not entries:
+            del self._pending[key]
+
+    def _expire(self, now: float) -> None:
+        for entries in list(self._pending.values()):
+            for entry in list(entries):
+                if entry.future.done() or now < entry.deadline:
+                    continue
+                if entry.sl_ok and entry.expected[0] == "0":
+                    entry.future.set_result(None)  # unobservable zero-TP reset
+                else:
+                    error = self._timeout_error(entry)
+                    error.__cause__ = self.last_error
+                    entry.future.set_exception(error)
+
+    def _next_deadline(self) -> float | None:
+        deadlines = [
+            e.deadline for entries in self._pending.values() for e in entries
+            if not e.future.done()
+        ]
+        return min(deadlines) if deadlines else None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while any(not e.future.done() for es in self._pending.values() for e in es):
+            self._wake.clear()
+            try:
+                user_data = await self._fetch()
+            except Exception as exc:
+                self.last_error = exc  # transient until a deadline says otherwise
+            else:
+                self.last_error = None
+                self.observe(user_data)
+            self._expire(loop.time())
+            deadline = self._next_deadline()
+            if deadline is None:
+                return
+            wait_s = min(self.poll_interval_s, max(deadline - loop.time(), 0.0))
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=wait_s)
+
+    def _timeout_error(self, entry: _Pending) -> RelayTimeoutError:
+        def _px(raw: str) -> str:
+            return f"{float(from_1e10(raw)):g}"
+
+        before, expected = entry.before, entry.expected
+        now = entry.now or before
+        return RelayTimeoutError(
+            f"TP/SL update accepted but not visible on the position after "
+            f"{entry.timeout_s:.0f}s (pairIndex={entry.pair_index} "
+            f"index={entry.trade_index}): signed UpdateTpSlReq with "
+            f"tp={_px(expected[0])} sl={_px(expected[1])}"
+            f"{' (tp=0 resets to the max-gain cap)' if expected[0] == '0' else ''}, "
+            f"position still shows tp={_px(now[0])} sl={_px(now[1])} "
+            f"(was tp={_px(before[0])} sl={_px(before[1])} before the update). "
+            f"The operator may still execute it; re-check account.positions()."
+        )
@@ -0,0 +1,45 @@
+"""Request/result shapes for the bulk trading methods (human units)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from ..types import BulkResult, Num, TriggerType
+
+__all__ = ["BulkResult", "PairRef", "TpSlLevel", "TpSlUpdate"]
+
+PairRef = str | int
+
+
+@dataclass
+class TpSlLevel:
+    """One rung of a partial TP/SL ladder (see ``TradeApi.tp_sl_ladder``).
+
+    ``trigger`` defaults from the level itself: ``percentage`` given and no
+    ``price`` -> percentage trigger, otherwise fixed price.
+    """
+
+    kind: str  # "tp"/"take_profit" | "sl"/"stop_loss"
+    coin_exposure: Num
+    price: Num | None = None
+    percentage: Num | None = None
+    trigger: TriggerType | str | None = None
+
+    @property
+    def trigger_type(self) -> TriggerType:
+        if self.trigger is not None:
+            return TriggerType(self.trigger)
+        if self.price is None and self.percentage is not None:
+            return TriggerType.PERCENTAGE
+        return TriggerType.FIXED
+
+
+@dataclass
+class TpSlUpdate:
+    """A global TP/SL change for ``TradeApi.update_tp_sl_many``: same leg
+    semantics as ``update_tp_sl`` (``None`` keeps a leg, ``0`` clears it)."""
+
+    pair: PairRef
+    trade_index: int
+    take_profit: Num | None = None
+    stop_loss: Num | None = None
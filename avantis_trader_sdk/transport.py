@@ -3,50 +3,164 @@
 Handles the tx-builder ``{ok, data|error}`` envelope, the avantis-server
 ``{success, ...}`` wrapper, retries on transient failures, and mapping of
 error codes to typed exceptions.
+
+Idempotent GETs can be *hedged* (opt-in, see :class:`Hedging`): when the
+response has not arrived by the endpoint's observed pN latency, a duplicate
+is sent and whichever answers first wins.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Collection
 from typing import Any
 
 import httpx
 
 from ._version import __version__
-from .errors import ApiError, api_error_from_envelope
+from .circuit import BreakerState, CircuitBreakers
+from .errors import ApiError, ConfigError, api_error_from_envelope
+from .ratelimit import Priority, RateLimiter, retry_after_s
 
 _RETRYABLE_STATUS = {502, 503, 504}
 _DEFAULT_RETRIES = 2
 
 
+class Hedging:
+    """Latency tracking and hedge budget for hedged GETs.
+
+    Latencies are kept per endpoint class (the ``hedge=`` name a call site
+    passes, e.g. ``"user-data"``) over the last ``window`` responses. Once
+    ``min_samples`` are in, a request still unanswered after the
+    ``percentile`` latency gets one duplicate. Each hedged-eligible request
+    earns ``budget_ratio`` of a hedge (banked up to ``burst``), and a hedge
+    spends a whole one, so hedges never exceed that share of traffic;
+    ``budget_ratio`` is capped at 1 (never more than double the load).
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 95.0,
+        budget_ratio: float = 0.1,
+        burst: float = 10.0,
+        min_samples: int = 20,
+        window: int = 200,
+    ) -> None:
+        if not 0 < budget_ratio <= 1:
+            raise ConfigError("hedge budget_ratio must be in (0, 1]")
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.burst = burst
+        self.min_samples = min_samples
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._tokens = 0.0
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def delay(self, key: str) -> float | None:
+        """Seconds to wait before hedging ``key`` (None: too few samples)."""
+        samples = self._samples.get(key)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        rank = math.ceil(self.percentile / 100 * len(ordered)) - 1
+        return ordered[min(max(rank, 0), len(ordered) - 1)]
+
+    def record(self, key: str, seconds: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def _earn(self) -> None:
+        self.requests += 1
+        self._tokens = min(self.burst, self._tokens + self.budget_ratio)
+
+    def _spend(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        self.hedged += 1
+        return True
+
+
 class HttpTransport:
     """Thin wrapper over a shared httpx.AsyncClient."""
 
-    def __init__(self, timeout_s: float = 30.0) -> None:
+    def __init__(
+        self,
+        timeout_s: float = 30.0,
+        *,
+        hedging: Hedging | None = None,
+        limiter: RateLimiter | None = None,
+        breakers: CircuitBreakers | None = None,
+    ) -> None:
         self._client = httpx.AsyncClient(
             timeout=timeout_s,
             headers={"User-Agent": f"avantis-trader-sdk/{__version__}"},
         )
+        self.hedging = hedging
+        self.limiter = limiter
+        self.breakers = breakers
+        if breakers is not None:
+            breakers.bind(self._probe)
 
     async def aclose(self) -> None:
+        if self.breakers is not None:
+            await self.breakers.aclose()
         await self._client.aclose()
 
-    def stream(
+    async def _probe(self, url: str) -> bool:
+        """Breaker health check: any answer but a 502/503/504 means up."""
+        try:
+            resp = await self._client.get(url, timeout=5.0)
+        except httpx.TransportError:
+            return False
+        return resp.status_code not in _RETRYABLE_STATUS
+
+    @contextlib.asynccontextmanager
+    async def stream(
         self,
         method: str,
         url: str,
         *,
         json: Any = None,
         read_timeout_s: float | None = None,
-    ):
-        """Streaming request (SSE). Returns httpx's async context manager.
+    ) -> AsyncIterator[httpx.Response]:
+        """Streaming request (SSE), used as ``async with transport.stream(...)``.
 
         ``read_timeout_s`` bounds the gap between chunks; it must exceed the
         server's keep-alive interval (batched-market heartbeats every 15s),
         not the total stream lifetime.
+
+        With :attr:`breakers`, opening the stream counts like a request
+        attempt: a transport error or 502-504 is a failure, any other
+        status a success. Errors after the headers are left to the caller.
         """
+        if self.breakers is not None:
+            self.breakers.check(url)
         timeout = httpx.Timeout(10.0, read=read_timeout_s)
-        return self._client.stream(method, url, json=json, timeout=timeout)
+        opened = False
+        try:
+            async with self._client.stream(method, url, json=json, timeout=timeout) as resp:
+                opened = True
+                if self.breakers is not None:
+                    if resp.status_code in _RETRYABLE_STATUS:
+                        self.breakers.failure(url)
+                    else:
+                        self.breakers.success(url)
+                yield resp
+        except httpx.TransportError:
+            if not opened and self.breakers is not None:
+                self.breakers.failure(url)
+            raise
 
     async def request(
         self,
@@ -57,17 +171,58 @@ class HttpTransport:
         json: Any = None,
         retries: int = _DEFAULT_RETRIES,
         allow_404: bool = False,
+        hedge: str | None = None,
+        priority: Priority | None = None,
+        busy_statuses: Collection[int] = (),
     ) -> httpx.Response:
+        """``hedge`` names the endpoint class of an idempotent GET that may be
+        hedged (only when the transport has :attr:`hedging` enabled).
+
+        With a :attr:`limiter`, each attempt first takes a token from the
+        URL's service at ``priority`` (default: ``READ`` for GETs, ``ORDER``
+        otherwise), and a 429 holds the service for its ``Retry-After`` and
+        is retried like a 5xx.
+
+        With :attr:`breakers`, an attempt on an upstream whose circuit is
+        open raises :class:`~.errors.CircuitOpenError` at once. A hedge's
+        duplicate is gated the same way and takes its own limiter token.
+        ``busy_statuses`` are answers that mean the upstream is up but
+        saturated (the relayer's 503 while every wallet is in flight); they
+        do not count against its breaker.
+        """
+        if priority is None:
+            priority = Priority.READ if method == "GET" else Priority.ORDER
         attempt = 0
         while True:
+            if self.breakers is not None:
+                self.breakers.check(url)
+            if self.limiter is not None:
+                await self.limiter.acquire(url, priority)
             try:
-                resp = await self._client.request(method, url, params=params, json=json)
+                if hedge is not None and self.hedging is not None and method == "GET":
+                    resp = await self._hedged(self.hedging, hedge, url, params, priority)
+                else:
+                    resp = await self._client.request(method, url, params=params, json=json)
             except httpx.TransportError as exc:
+                if self.breakers is not None:
+                    self.breakers.failure(url)
+                    self.breakers.check(url)  # just tripped: skip the retry sleeps
                 if attempt < retries:
                     attempt += 1
                     await asyncio.sleep(0.25 * 2**attempt)
                     continue
                 raise ApiError(f"network error calling {url}: {exc}", url=url) from exc
+            if self.breakers is not None:
+                if resp.status_code in _RETRYABLE_STATUS and resp.status_code not in busy_statuses:
+                    self.breakers.failure(url)
+                    self.breakers.check(url)
+                else:
+                    self.breakers.success(url)
+            if resp.status_code == 429 and self.limiter is not None:
+                self.limiter.throttled(url, retry_after_s(resp.headers.get("Retry-After")))
+                if attempt < retries:
+                    attempt += 1
+                    continue  # the next acquire waits out Retry-After
             if resp.status_code in _RETRYABLE_STATUS and attempt < retries:
                 attempt += 1
                 await asyncio.sleep(0.25 * 2**attempt)
@@ -76,6 +231,73 @@ class HttpTransport:
                 return resp
             return resp
 
+    async def _hedged(
+        self,
+        hedging: Hedging,
+        key: str,
+        url: str,
+        params: dict[str, Any] | None,
+        priority: Priority,
+    ) -> httpx.Response:
+        hedging._earn()
+        delay = hedging.delay(key)
+        started = time.monotonic()
+        primary = asyncio.create_task(self._client.get(url, params=params))
+        if delay is not None:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            # no duplicate into an upstream whose circuit opened meanwhile
+            closed = self.breakers is None or self.breakers.state(url) is BreakerState.CLOSED
+            if not done and closed and hedging._spend():
+                return await self._race(hedging, key, primary, started, url, params, priority)
+        resp = await primary
+        hedging.record(key, time.monotonic() - started)
+        return resp
+
+    async def _race(
+        self,
+        hedging: Hedging,
+        key: str,
+        primary: asyncio.Task[httpx.Response],
+        primary_started: float,
+        url: str,
+        params: dict[str, Any] | None,
+        priority: Priority,
+    ) -> httpx.Response:
+        started = time.monotonic()
+
+        async def _backup() -> httpx.Response:
+            # the duplicate is a request of its own: it takes a token and is
+            # gated like any attempt (a failure here leaves the primary racing)
+            nonlocal started
+            if self.limiter is not None:
+                await self.limiter.acquire(url, priority)
+            if self.breakers is not None:
+                self.breakers.check(url)
+            started = time.monotonic()
+            return await self._client.get(url, params=params)
+
+        backup = asyncio.create_task(_backup())
+        pending: set[asyncio.Task[httpx.Response]] = {primary, backup}
+        try:
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((t for t in done if t.exception() is None), None)
+                if winner is backup:
+                    hedging.hedge_wins += 1
+                    hedging.record(key, time.monotonic() - started)
+                    return winner.result()
+                if winner is primary:
+                    hedging.record(key, time.monotonic() - primary_started)
+                    return winner.result()
+                if not pending:  # both failed: surface the primary's error
+                    error = primary.exception()
+                    assert error is not None
+                    raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     # -- tx-builder envelope -------------------------------------------------
 
     async def txb(
@@ -85,9 +307,10 @@ class HttpTransport:
         *,
         params: dict[str, Any] | None = None,
         json: Any = None,
+        priority: Priority | None = None,
     ) -> Any:
         """Call a tx-builder endpoint and unwrap ``{ok, data}`` / raise on error."""
-        resp = await self.request(method, url, params=params, json=json)
+        resp = await self.request(method, url, params=params, json=json, priority=priority)
         try:
             body = resp.json()
         except ValueError as exc:
@@ -120,8 +343,18 @@ class HttpTransport:
         params: dict[str, Any] | None = None,
         json: Any = None,
         allow_404: bool = False,
+        hedge: str | None = None,
+        priority: Priority | None = None,
     ) -> Any:
-        resp = await self.request(method, url, params=params, json=json, allow_404=allow_404)
+        resp = await self.request(
+            method,
+            url,
+            params=params,
+            json=json,
+            allow_404=allow_404,
+            hedge=hedge,
+            priority=priority,
+        )
         if allow_404 and resp.status_code == 404:
             return None
         if resp.status_code >= 400:
@@ -9,9 +9,10 @@ Unit conventions (see docs/v2/RESEARCH.md §2):
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum, IntEnum
-from typing import Any, Literal
+from typing import Any, Generic, Literal, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -31,6 +32,22 @@ def from_1e10(raw: int | str) -> Decimal:
     return Decimal(raw) / PRECISION_10
 
 
+# Binary-float multiplication can truncate one unit low
+# (``int(0.0003 * 1e10) == 2_999_999``, bites low-priced pair prices and
+# TP/SL); a float's ``str()`` is its shortest exact decimal representation,
+# so scaling through Decimal gives the raw value the user actually meant.
+
+
+def to_usdc(value: int | float | str | Decimal) -> int:
+    """Human USDC -> raw 1e6 integer (exact decimal scaling)."""
+    return int(Decimal(str(value)) * USDC_SCALE)
+
+
+def to_1e10(value: int | float | str | Decimal) -> int:
+    """Human price/leverage/coin amount -> raw 1e10 integer."""
+    return int(Decimal(str(value)) * PRECISION_10)
+
+
 Num = int | float | str | Decimal
 """Human-unit numeric input. Strings are preferred for exact decimals."""
 
@@ -232,3 +249,30 @@ class ExecutionReceipt(BaseModel):
     order_id: int | None = None  # on-chain order id from the initiation event
     description: str | None = None
     raw: dict[str, Any] | None = None
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class BulkResult(Generic[T]):
+    """Per-item outcome of a bulk call: the input ``item`` plus either its
+    ``result`` or the ``error`` it raised (bulk calls never abort half-way)."""
+
+    item: Any
+    result: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @classmethod
+    def of(cls, item: Any, outcome: T | BaseException) -> BulkResult[T]:
+        """From one ``gather(..., return_exceptions=True)`` outcome; a
+        cancellation is re-raised rather than reported as an item error."""
+        if isinstance(outcome, Exception):
+            return cls(item, error=outcome)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return cls(item, result=outcome)
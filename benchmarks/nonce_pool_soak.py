@@ -0,0 +1,50 @@
+"""Soak benchmark: NoncePool memory stays flat over millions of intents.
+
+Simulates a market maker signing ``--rate`` intents per (simulated) second
+with ``--deadline-ms`` deadlines and reports the live nonce count, traced
+memory and throughput every ``--report`` intents. With eviction the pool
+plateaus at about rate * (deadline + grace); the unbounded pool it replaced
+grew linearly (~200 bytes per nonce).
+
+    python benchmarks/nonce_pool_soak.py                 # 10M intents
+    python benchmarks/nonce_pool_soak.py --intents 1000000 --rate 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+from avantis_trader_sdk.execution.local_intents import NoncePool
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--intents", type=int, default=10_000_000)
+    parser.add_argument("--rate", type=int, default=2_000, help="intents per simulated second")
+    parser.add_argument("--deadline-ms", type=int, default=120_000)
+    parser.add_argument("--grace-ms", type=int, default=60_000)
+    parser.add_argument("--report", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    sim = [1_800_000_000.0]
+    pool = NoncePool(ttl_ms=args.deadline_ms, grace_ms=args.grace_ms, clock=lambda: sim[0])
+    step = 1.0 / args.rate
+    tracemalloc.start()
+    started = time.perf_counter()
+    print(f"{'intents':>12} {'live':>10} {'traced MiB':>11} {'peak MiB':>9} {'us/next':>8}")
+    for i in range(1, args.intents + 1):
+        pool.next(int(sim[0] * 1000) + args.deadline_ms)
+        sim[0] += step
+        if i % args.report == 0:
+            current, peak = tracemalloc.get_traced_memory()
+            elapsed = time.perf_counter() - started
+            print(
+                f"{i:>12,} {len(pool):>10,} {current / 2**20:>11.1f} "
+                f"{peak / 2**20:>9.1f} {elapsed / i * 1e6:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
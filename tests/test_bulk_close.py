@@ -0,0 +1,152 @@
+"""Bulk closes: one /user-data read, locally built CloseTradeReq intents
+priced from one last-price read, concurrent batched-market submissions
+under an in-flight cap, per-position outcomes."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from avantis_trader_sdk import AsyncAvantis
+from avantis_trader_sdk.errors import ValidationError
+from tests.conftest import META, TEST_KEY, TRADER, mock_data_api
+
+TXB = "https://txb.test"
+CORE = "https://core.test"
+DATA = "https://data.test"
+BATCHED = "https://batched.test"
+FEED = "https://feed.test"
+
+
+def _ok(data):
+    return httpx.Response(200, json={"ok": True, "data": data})
+
+
+def _client() -> AsyncAvantis:
+    return AsyncAvantis(
+        network="testnet",
+        private_key=TEST_KEY,
+        trader_address=TRADER,
+        tx_builder_url=TXB,
+        core_api_url=CORE,
+        batched_market_url=BATCHED,
+        data_api_url=DATA,
+        feed_url=FEED,
+        relay_poll_interval_s=0.01,
+    )
+
+
+def _sse(*events: tuple[int, str, dict]) -> httpx.Response:
+    frames = "".join(
+        f"id: {seq}\nevent: {kind}\ndata: {json.dumps(payload)}\n\n"
+        for seq, kind, payload in events
+    )
+    return httpx.Response(
+        200,
+        content=frames.encode(),
+        headers={"content-type": "text/event-stream; charset=utf-8"},
+    )
+
+
+def _position(pair_index: int, index: int, *, upside: bool = False) -> dict:
+    return {
+        "trader": TRADER,
+        "pairIndex": pair_index,
+        "index": index,
+        "buy": True,
+        "isPnl": upside,
+        "collateral": "100000000",
+        "leverage": "100000000000",
+        "openPrice": "40000000000000",
+        "openedAt": 1782374525,
+    }
+
+
+def _mock_book(positions: list[dict]):
+    respx.get(f"{TXB}/v2/meta").mock(return_value=_ok(META))
+    mock_data_api(DATA)
+    respx.get(f"{FEED}/v1/price-feeds/last-price").mock(
+        return_value=httpx.Response(
+            200, json=[{"pairIndex": 1, "c": 4000.5}, {"pairIndex": 116, "c": 95000}]
+        )
+    )
+    return respx.get(f"{CORE}/user-data").mock(
+        return_value=httpx.Response(200, json={"positions": positions})
+    )
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_close_all_submits_local_intents_concurrently_with_cap():
+    user_data = _mock_book(
+        [_position(1, i) for i in range(5)] + [_position(116, 0, upside=True)]
+    )
+    close_route = respx.post(f"{TXB}/v2/intents/close")
+    in_flight = peak = 0
+
+    async def execute(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _sse((0, "MarketOrderAccepted", {"trackingId": "trk"}))
+
+    execute_route = respx.post(f"{BATCHED}/market/execute-batched").mock(
+        side_effect=execute
+    )
+
+    async with _client() as client:
+        results = await client.trade.close_all(max_in_flight=3, wait=False)
+
+    assert len(user_data.calls) == 1
+    assert not close_route.called  # no tx-builder round-trips
+    assert all(r.ok for r in results) and len(results) == 6
+    assert len(execute_route.calls) == 6 and peak == 3
+    bodies = [json.loads(c.request.content) for c in execute_route.calls]
+    assert sorted(b["orderType"] for b in bodies) == [1, 1, 1, 1, 1, 7]
+    assert all("eip7702" not in b for b in bodies)
+    assert results[0].result.tracking_id == "trk"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_close_all_filter_and_close_many_refs():
+    user_data = _mock_book([_position(1, 0), _position(1, 1), _position(116, 0, upside=True)])
+    execute_route = respx.post(f"{BATCHED}/market/execute-batched").mock(
+        return_value=_sse((0, "MarketOrderAccepted", {"trackingId": "trk"}))
+    )
+
+    async with _client() as client:
+        upside = await client.trade.close_all(lambda p: p.is_upside, wait=False)
+        refs = await client.trade.close_many([("ETH/USD", 1), ("ETH/USD", 9)], wait=False)
+
+    assert [r.item.pair_index for r in upside] == [116]
+    assert refs[0].ok and refs[0].item.index == 1
+    assert isinstance(refs[1].error, ValidationError)
+    assert refs[1].error.code == "NO_POSITION"
+    assert len(execute_route.calls) == 2
+    assert len(user_data.calls) == 2  # one read per bulk call
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_close_many_propagates_cancellation_instead_of_reporting_it():
+    _mock_book([_position(1, 0), _position(1, 1)])
+    calls = 0
+
+    async def execute(request):
+        nonlocal calls
+        calls += 1
+        if calls == 2:  # the second close's task is cancelled mid-request
+            asyncio.current_task().cancel()
+            await asyncio.sleep(0)
+        return _sse((0, "MarketOrderAccepted", {"trackingId": "trk"}))
+
+    respx.post(f"{BATCHED}/market/execute-batched").mock(side_effect=execute)
+
+    async with _client() as client:
+        with pytest.raises(asyncio.CancelledError):
+            await client.trade.close_all(wait=False)
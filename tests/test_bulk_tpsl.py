@@ -0,0 +1,162 @@
+"""Bulk TP/SL: a partial ladder on one position and global updates on many
+positions, built locally from one snapshot and submitted concurrently."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from avantis_trader_sdk import AsyncAvantis
+from avantis_trader_sdk.account.models import Position
+from avantis_trader_sdk.trading import TpSlLevel, TpSlUpdate
+from tests.conftest import META, TEST_KEY, TRADER, mock_data_api
+
+TXB = "https://txb.test"
+CORE = "https://core.test"
+DATA = "https://data.test"
+
+
+def _ok(data):
+    return httpx.Response(200, json={"ok": True, "data": data})
+
+
+def _client(**kw) -> AsyncAvantis:
+    return AsyncAvantis(
+        network="testnet",
+        private_key=TEST_KEY,
+        trader_address=TRADER,
+        tx_builder_url=TXB,
+        core_api_url=CORE,
+        data_api_url=DATA,
+        relay_poll_interval_s=0.01,
+        **kw,
+    )
+
+
+def _position(index: int, tp_raw: str = "50000000000000", sl_raw: str = "0") -> dict:
+    return {
+        "trader": TRADER,
+        "pairIndex": 1,
+        "index": index,
+        "buy": True,
+        "collateral": "100000000",
+        "leverage": "100000000000",
+        "openPrice": "40000000000000",
+        "tp": tp_raw,
+        "sl": sl_raw,
+        "openedAt": 1782374525,
+    }
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_tp_sl_ladder_posts_every_level_with_bounded_fan_out():
+    respx.get(f"{TXB}/v2/meta").mock(return_value=_ok(META))
+    mock_data_api(DATA)
+    in_flight = peak = 0
+
+    async def store(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        body = json.loads(request.content)
+        if body["price"] == str(4600 * 10**10):
+            return httpx.Response(400, json={"message": "too many triggers"})
+        return httpx.Response(200, json={"entityId": f"id-{body['nonce']}"})
+
+    post_route = respx.post(f"{CORE}/price-triggers").mock(side_effect=store)
+    tpsl_route = respx.post(f"{TXB}/v2/intents/tpsl-partial")
+    levels = [
+        TpSlLevel("tp", "0.1", price=4200),
+        TpSlLevel("tp", "0.1", price=4400),
+        TpSlLevel("tp", "0.1", price=4600),
+        TpSlLevel("sl", "0.3", percentage=-5),
+    ]
+
+    async with _client() as client:
+        results = await client.trade.tp_sl_ladder(
+            Position.model_validate(_position(0)), levels, max_in_flight=2
+        )
+
+    assert not tpsl_route.called  # built locally, no tx-builder round-trip
+    assert len(post_route.calls) == 4 and peak == 2
+    assert [r.ok for r in results] == [True, True, False, True]
+    assert [r.item for r in results] == levels
+    bodies = [json.loads(c.request.content) for c in post_route.calls]
+    assert {b["timestamp"] for b in bodies} == {1782374525}
+    assert len({b["nonce"] for b in bodies}) == 4
+    assert results[3].result["triggerType"] == 1  # percentage inferred
+    assert results[0].result["entityId"].startswith("id-")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_update_tp_sl_many_reads_account_once_and_reports_per_slot():
+    from avantis_trader_sdk.errors import ValidationError
+
+    respx.get(f"{TXB}/v2/meta").mock(return_value=_ok(META))
+    mock_data_api(DATA)
+    user_data = respx.get(f"{CORE}/user-data")
+    user_data.side_effect = [
+        httpx.Response(200, json={"positions": [_position(i) for i in range(3)]}),
+        httpx.Response(
+            200,
+            json={
+                "positions": [
+                    _position(i, tp_raw=str(6000 * 10**10)) for i in range(3)
+                ]
+            },
+        ),
+    ]
+    put_routes = [
+        respx.put(f"{CORE}/price-triggers/global-tp-{TRADER}-1-{i}").mock(
+            return_value=httpx.Response(200, json={"success": True})
+        )
+        for i in range(3)
+    ]
+    updates = [
+        TpSlUpdate("ETH/USD", 0, take_profit=6000),
+        TpSlUpdate("ETH/USD", 1, take_profit=6000),
+        TpSlUpdate("ETH/USD", 7, take_profit=6000),  # no such position
+        TpSlUpdate("ETH/USD", 2, take_profit=6000),
+    ]
+
+    async with _client() as client:
+        results = await client.trade.update_tp_sl_many(updates)
+
+    assert [r.ok for r in results] == [True, True, False, True]
+    assert isinstance(results[2].error, ValidationError)
+    assert results[2].error.code == "NO_POSITION"
+    assert all(route.call_count == 1 for route in put_routes)
+    # one snapshot to build from + one shared confirmation poll
+    assert len(user_data.calls) == 2
+    assert results[0].result.route == "price-triggers"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_update_tp_sl_many_propagates_cancellation_instead_of_reporting_it():
+    respx.get(f"{TXB}/v2/meta").mock(return_value=_ok(META))
+    mock_data_api(DATA)
+    respx.get(f"{CORE}/user-data").mock(
+        return_value=httpx.Response(
+            200, json={"positions": [_position(i) for i in range(2)]}
+        )
+    )
+
+    async def put(request):
+        if request.url.path.endswith("-1"):  # the second update is cancelled
+            asyncio.current_task().cancel()
+            await asyncio.sleep(0)
+        return httpx.Response(200, json={"success": True})
+
+    respx.put(url__regex=rf"{CORE}/price-triggers/.*").mock(side_effect=put)
+    updates = [TpSlUpdate("ETH/USD", i, take_profit=6000) for i in range(2)]
+
+    async with _client() as client:
+        with pytest.raises(asyncio.CancelledError):
+            await client.trade.update_tp_sl_many(updates, wait=False)
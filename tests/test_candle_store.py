@@ -0,0 +1,107 @@
+"""Local candle store: only missing ranges are fetched, the open bar is
+refreshed, and range reads come back as typed array columns."""
+
+import httpx
+import pytest
+import respx
+
+from avantis_trader_sdk import AsyncAvantis
+from avantis_trader_sdk.errors import ApiError, ConfigError
+from avantis_trader_sdk.markets import CandleStore
+from tests.conftest import TEST_KEY, TRADER
+
+FEED = "https://feed.test"
+HOUR = 3600
+
+
+def _bars(start: int, end: int) -> dict:
+    times = list(range(start, end, HOUR))
+    return {
+        "s": "ok" if times else "no_data",
+        "t": times,
+        "o": [float(t // HOUR) for t in times],
+        "h": [float(t // HOUR) + 1 for t in times],
+        "l": [float(t // HOUR) - 1 for t in times],
+        "c": [float(t // HOUR) + 0.5 for t in times],
+        "v": [10.0] * len(times),
+    }
+
+
+class _Feed:
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, int]] = []
+
+    async def __call__(self, symbol: str, resolution: str, start: int, end: int) -> dict:
+        self.calls.append((start, end))
+        return _bars(start, end)
+
+
+@pytest.mark.asyncio
+async def test_store_fetches_only_missing_ranges(tmp_path):
+    feed = _Feed()
+    now = 1000 * HOUR + 120  # bar 1000 is still forming
+    path = tmp_path / "candles.db"
+    store = CandleStore(feed, str(path), clock=lambda: now)
+
+    bars = await store.get("ETH/USD", "60", 900 * HOUR, 950 * HOUR + 5)
+    assert feed.calls == [(900 * HOUR, 951 * HOUR)]  # window snapped to bars
+    assert len(bars) == 51 and bars.time[0] == 900 * HOUR
+    assert bars.close.typecode == "d" and bars.close[0] == 900.5
+
+    # a wider window fetches the head and the tail, not the cached middle
+    bars = await store.get("ETH/USD", "60", 880 * HOUR, 1001 * HOUR)
+    assert feed.calls[1:] == [(880 * HOUR, 900 * HOUR), (951 * HOUR, 1001 * HOUR)]
+    assert list(bars.time) == list(range(880 * HOUR, 1001 * HOUR, HOUR))
+    store.close()
+
+    # persisted: a fresh store only re-fetches the open bar
+    store = CandleStore(feed, str(path), clock=lambda: now)
+    assert store.missing("ETH/USD", "60", 880 * HOUR, 1001 * HOUR) == [
+        (1000 * HOUR, 1001 * HOUR)
+    ]
+    await store.get("ETH/USD", "60", 880 * HOUR, 1001 * HOUR)
+    assert feed.calls[-1] == (1000 * HOUR, 1001 * HOUR)
+    assert store.missing("ETH/USD", "60", 880 * HOUR, 1000 * HOUR) == []
+    assert store.missing("ETH/USD", "D", 0, 86400) == [(0, 86400)]
+
+
+@pytest.mark.asyncio
+async def test_store_chunks_large_gaps_and_caches_empty_ranges():
+    feed = _Feed()
+    store = CandleStore(feed, max_bars=10, clock=lambda: 10**9)
+    await store.get("BTC/USD", "60", 0, 25 * HOUR)
+    assert feed.calls == [(0, 10 * HOUR), (10 * HOUR, 20 * HOUR), (20 * HOUR, 25 * HOUR)]
+
+    async def empty(*_):
+        return {"s": "no_data"}
+
+    store._fetch = empty
+    assert len(await store.get("SOL/USD", "60", 0, HOUR)) == 0
+    assert store.missing("SOL/USD", "60", 0, HOUR) == []
+
+    async def broken(*_):
+        return {"s": "error", "errmsg": "unknown symbol"}
+
+    store._fetch = broken
+    with pytest.raises(ApiError, match="unknown symbol"):
+        await store.get("XYZ/USD", "60", 0, HOUR)
+    with pytest.raises(ConfigError):
+        await store.get("BTC/USD", "7", 0, HOUR)
+
+
+@pytest.mark.asyncio
+async def test_markets_candle_store_uses_the_shim():
+    client = AsyncAvantis(
+        network="testnet", private_key=TEST_KEY, trader_address=TRADER, feed_url=FEED
+    )
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.get(f"{FEED}/v1/shims/tradingview/history").mock(
+            return_value=httpx.Response(200, json=_bars(0, 3 * HOUR))
+        )
+        store = client.markets.candle_store()
+        bars = await store.get("ETH/USD", "60", 0, 3 * HOUR)
+        await store.get("ETH/USD", "60", 0, 3 * HOUR)
+    assert route.call_count == 1
+    assert route.calls[0].request.url.params["from"] == "0"
+    assert list(bars.volume) == [10.0, 10.0, 10.0]
+    await client.aclose()
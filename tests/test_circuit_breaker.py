@@ -0,0 +1,140 @@
+"""Circuit breakers: repeated 5xx on one upstream opens its breaker, calls
+then fail fast with CircuitOpenError, other upstreams are unaffected, and a
+background probe closes the breaker once the upstream answers again."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+import respx
+
+from avantis_trader_sdk import AsyncAvantis, CircuitOpenError
+from avantis_trader_sdk.circuit import BreakerState, CircuitBreakers
+from avantis_trader_sdk.execution.relayer import RelayerClient
+from avantis_trader_sdk.transport import HttpTransport
+
+CORE = "https://api.test/core"
+DATA = "https://api.test/data"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_open_breaker_fails_fast_and_recovers_through_probes():
+    core = respx.get(url__startswith=CORE).mock(return_value=httpx.Response(503))
+    respx.get(f"{DATA}/v2/trading").mock(return_value=httpx.Response(200, json={}))
+    changes: list[tuple[str, BreakerState]] = []
+    breakers = CircuitBreakers(
+        {CORE: "core", DATA: "data"},
+        failure_threshold=3,
+        reset_s=0.05,
+        on_change=lambda name, state: changes.append((name, state)),
+    )
+    transport = HttpTransport(breakers=breakers)
+
+    with pytest.raises(CircuitOpenError):  # trips on the third attempt
+        await transport.json("GET", f"{CORE}/user-data")
+    assert core.call_count == 3
+    assert breakers.state("core") is BreakerState.OPEN
+
+    started = time.monotonic()
+    with pytest.raises(CircuitOpenError) as info:
+        await transport.json("GET", f"{CORE}/user-data")
+    assert time.monotonic() - started < 0.01 and core.call_count == 3
+    assert info.value.upstream == "core" and info.value.retry_in_s <= 0.05
+    assert await transport.json("GET", f"{DATA}/v2/trading") == {}  # other upstream
+
+    await asyncio.sleep(0.08)  # first probe: still down, period doubles
+    assert core.call_count == 4
+    assert breakers.state(f"{CORE}/user-data") is BreakerState.OPEN
+    assert breakers._breakers["core"].reset_s == 0.1
+
+    core.mock(return_value=httpx.Response(200, json={"ok": 1}))
+    await asyncio.sleep(0.15)
+    assert breakers.states() == {"core": BreakerState.CLOSED, "data": BreakerState.CLOSED}
+    assert await transport.json("GET", f"{CORE}/user-data") == {"ok": 1}
+    assert [state for name, state in changes if name == "core"] == [
+        BreakerState.OPEN,
+        BreakerState.HALF_OPEN,
+        BreakerState.OPEN,
+        BreakerState.HALF_OPEN,
+        BreakerState.CLOSED,
+    ]
+    await transport.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_unrouted_urls_are_keyed_by_host_and_breakers_are_configurable():
+    respx.get("https://other.test/a").mock(side_effect=httpx.ConnectError("down"))
+    breakers = CircuitBreakers(failure_threshold=2, reset_s=60)
+    transport = HttpTransport(breakers=breakers)
+    started = time.monotonic()
+    with pytest.raises(CircuitOpenError):  # tripped by the retry: no second sleep
+        await transport.json("GET", "https://other.test/a")
+    assert time.monotonic() - started < 0.9
+    with pytest.raises(CircuitOpenError):
+        await transport.json("GET", "https://other.test/b")
+    assert breakers.states() == {"https://other.test": BreakerState.OPEN}
+    await transport.aclose()
+
+    assert AsyncAvantis(network="testnet").transport.breakers is None  # opt-in
+    assert AsyncAvantis(network="testnet", circuit_breakers=True).transport.breakers is not None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_relayer_busy_503_is_not_a_failure_and_tracking_outlives_an_open_breaker(
+    monkeypatch,
+):
+    blitz = "https://blitz.test"
+    sleep = asyncio.sleep
+    monkeypatch.setattr(asyncio, "sleep", lambda s: sleep(min(s, 0.01)))
+    respx.post(f"{blitz}/relays").mock(
+        side_effect=[httpx.Response(503, text="busy")] * 3
+        + [httpx.Response(200, json={"requestId": "r1"})]
+    )
+    breakers = CircuitBreakers(failure_threshold=2, reset_s=0.02)
+    transport = HttpTransport(breakers=breakers)
+    relayer = RelayerClient(transport, blitz, poll_interval_s=0.01)
+    assert await relayer.create({"to": "0x"}) == "r1"
+    assert breakers.state(blitz) is BreakerState.CLOSED
+
+    respx.get(blitz, path="/").mock(return_value=httpx.Response(200))  # recovery probe
+    respx.get(f"{blitz}/relays/r1").mock(
+        side_effect=[httpx.ConnectError("down")] * 2
+        + [httpx.Response(200, json={"status": "Finalised", "receipt": {"status": "0x1"}})]
+    )
+    status = await relayer.wait("r1", timeout_s=5)  # trips the breaker, then recovers
+    assert status.success and breakers._breakers["https://blitz.test"].trips == 1
+    await transport.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_streams_record_their_outcome_on_the_breaker():
+    url = "https://bm.test/market/execute-batched"
+    respx.post(url).mock(
+        side_effect=[
+            httpx.Response(502),
+            httpx.Response(200, text="data: {}\n\n"),
+            httpx.ConnectError("down"),
+            httpx.Response(504),
+        ]
+    )
+    breakers = CircuitBreakers(failure_threshold=2, reset_s=60)
+    transport = HttpTransport(breakers=breakers)
+    async with transport.stream("POST", url) as resp:
+        assert resp.status_code == 502
+    async with transport.stream("POST", url) as resp:  # healthy: the count resets
+        assert resp.status_code == 200
+    with pytest.raises(httpx.ConnectError):
+        async with transport.stream("POST", url):
+            pass
+    async with transport.stream("POST", url) as resp:
+        assert resp.status_code == 504
+    assert breakers.state(url) is BreakerState.OPEN
+    with pytest.raises(CircuitOpenError):
+        async with transport.stream("POST", url):
+            pass
+    await transport.aclose()
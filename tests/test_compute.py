@@ -4,11 +4,16 @@ mirror the avantis-ui-v2 implementations."""
 import pytest
 
 from avantis_trader_sdk.compute import (
+    ConstraintTable,
+    OiDelta,
+    OrderCandidate,
     adjusted_max_gain_p,
     available_liquidity,
     estimate_liquidation_price,
     gross_pnl,
+    liquidity_surface,
     maker_or_taker_fee_p,
+    max_position_size,
     net_pnl,
     pnl_fee_by_gross_profit_p,
     pnl_order_min_sl,
@@ -17,6 +22,7 @@ from avantis_trader_sdk.compute import (
     tp_percent_to_price,
     tp_price_to_percent,
     validate_order,
+    validate_orders,
 )
 from avantis_trader_sdk.markets.models import TradingSnapshot
 
@@ -297,3 +303,94 @@ def test_market_hours_crypto_always_open():
 def test_pair_lookup_by_symbol():
     assert SNAPSHOT.pair_by_symbol("eth-usd").index == 0
     assert SNAPSHOT.pair_by_symbol("ETH/USD").symbol == "ETH/USD"
+
+
+def test_validate_orders_matches_the_scalar_validator():
+    import json
+    import random
+    from pathlib import Path
+
+    raw = json.loads((Path(__file__).parent / "vectors" / "trading_snapshot.json").read_text())
+    raw = raw.get("data", raw)
+    upside = json.loads(json.dumps(ETH_PAIR))
+    upside.update({"index": 116, "from": "ETH_UPSIDE", "isPairListed": False})
+    upside["pnlFees"] = {"numTiers": 2, "tierP": [0, 500], "feesP": [10, 20]}
+    upside["additionalPairParams2"] = {"closeOnlyMode": True}
+    raw["pairInfos"]["116"] = upside
+    snap = TradingSnapshot.model_validate(raw)
+    table = ConstraintTable(snap)
+    assert len(table) == len(snap.pair_infos) and table.is_current(snap) is (
+        snap.data_version is not None
+    )
+
+    rng = random.Random(3)
+    pairs = sorted(snap.pairs)
+    orders = [
+        OrderCandidate(
+            pair_index=rng.choice(pairs),
+            collateral=rng.choice([1, 20, 100, 5000, 2e6]),
+            leverage=rng.choice([1, 10, 75, 100, 250, 500]),
+            is_long=rng.random() < 0.5,
+            is_upside=rng.choice([None, None, True, False]),
+            limit_price=rng.choice([None, 90, 110]),
+            market_price=100,
+            take_profit_percent=rng.choice([None, 100, 2000, 3000]),
+            stop_loss_percent=rng.choice([None, 1, 10, 90]),
+            dynamic_spread_p=rng.choice([None, 0.05, 0.3, 1.2]),
+            wallet_oi=rng.choice([0, 45_000_000]),
+            open_trades_on_pair=rng.choice([0, 40]),
+        )
+        for _ in range(2000)
+    ]
+    batch = validate_orders(table, orders)
+    for order, got in zip(orders, batch, strict=True):
+        expected = validate_order(
+            snap.pairs[order.pair_index], snap,
+            collateral=order.collateral, leverage=order.leverage, is_long=order.is_long,
+            is_upside=order.is_upside, limit_price=order.limit_price,
+            market_price=order.market_price, take_profit_percent=order.take_profit_percent,
+            stop_loss_percent=order.stop_loss_percent,
+            dynamic_spread_p=order.dynamic_spread_p, wallet_oi=order.wallet_oi,
+            open_trades_on_pair=order.open_trades_on_pair,
+        )
+        assert got.errors == expected.errors
+    assert sum(v.ok for v in batch) > 0 and sum(not v.ok for v in batch) > 0
+
+    [unknown] = validate_orders(table, [OrderCandidate(9999, 100, 10, True)])
+    assert unknown.errors == ["unknown pair index 9999"]
+
+
+def test_liquidity_surface_matches_per_pair_and_applies_pending_oi():
+    import json
+    from pathlib import Path
+
+    raw = json.loads((Path(__file__).parent / "vectors" / "trading_snapshot.json").read_text())
+    snap = TradingSnapshot.model_validate(raw.get("data", raw))
+    surface = liquidity_surface(snap, wallet_oi=1_000_000)
+    assert len(surface) == len(snap.pair_infos)
+    for index, info in snap.pairs.items():
+        for is_long in (True, False):
+            assert surface.headroom(index, is_long=is_long) == max_position_size(
+                info, snap, is_long=is_long, wallet_oi=1_000_000
+            )
+
+    # a pending 15M long on ETH eats into ETH and, through the group cap,
+    # into its group peer BTC; SOL (another group) only loses wallet room
+    eth, btc, sol = snap.pairs[0], snap.pairs[1], snap.pairs[2]
+    assert eth.group_index == btc.group_index != sol.group_index
+    group = snap.group_info[str(eth.group_index)]
+    after = liquidity_surface(snap, pending=[OiDelta(0, True, 15_000_000)])
+    before = liquidity_surface(snap)
+    group_left = group.group_max_oi - group.group_oi
+    assert before[1].short < group_left
+    assert after[1].short == pytest.approx(group_left - 15_000_000)
+    assert after[1].short < before[1].short
+    assert after[0].long < before[0].long
+    assert after[2].long == before[2].long
+    # a pending close releases what the open took
+    undone = liquidity_surface(
+        snap, pending=[OiDelta(0, True, 15_000_000), OiDelta(0, True, -15_000_000)]
+    )
+    assert undone[0].long == pytest.approx(before[0].long)
+    with pytest.raises(ValueError):
+        liquidity_surface(snap, pending=[OiDelta(9999, True, 1)])
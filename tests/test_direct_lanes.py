@@ -0,0 +1,198 @@
+"""Direct-mode lanes: orders spread over several delegate EOAs with per-lane
+nonces, and a stalled lane stops receiving orders until its transaction
+mines or is dropped. Runs against a small in-process JSON-RPC node."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+import rlp
+from eth_account import Account
+from eth_utils import keccak
+
+from avantis_trader_sdk import AsyncAvantis
+from avantis_trader_sdk.errors import ConfigError
+from avantis_trader_sdk.signing import LocalSigner
+from avantis_trader_sdk.types import CallData
+from tests.conftest import META, TEST_KEY, TRADER
+
+TXB = "https://txb.test"
+RPC = "https://rpc.test"
+DATA = "https://data.test"
+SNAPSHOT = json.loads((Path(__file__).parent / "vectors" / "trading_snapshot.json").read_text())
+LANE_KEYS = ["0x" + f"{i:064x}" for i in range(1, 5)]
+
+
+class Node:
+    """Accepts txs only at the sender's next nonce; mines them at once unless
+    the sender is ``stuck``."""
+
+    def __init__(self, start_nonces: dict[str, int] | None = None) -> None:
+        self.nonces = {a.lower(): n for a, n in (start_nonces or {}).items()}
+        self.txs: dict[str, tuple[str, int]] = {}  # hash -> (sender, nonce)
+        self.data: dict[str, str] = {}  # hash -> calldata
+        self.mined: set[str] = set()
+        self.stuck: set[str] = set()
+
+    def drop(self, tx_hash: str) -> None:
+        sender, _ = self.txs.pop(tx_hash)
+        self.nonces[sender] -= 1
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        method, params = body["method"], body["params"]
+        reply = {"jsonrpc": "2.0", "id": body["id"]}
+        if method == "eth_getTransactionCount":
+            reply["result"] = hex(self.nonces.get(params[0].lower(), 0))
+        elif method == "eth_sendRawTransaction":
+            raw = bytes.fromhex(params[0][2:])
+            sender = Account.recover_transaction(raw).lower()
+            nonce = int.from_bytes(rlp.decode(raw[1:])[1], "big")
+            if nonce != self.nonces.get(sender, 0):
+                reply["error"] = {"code": -32000, "message": "nonce too low"}
+            else:
+                tx_hash = "0x" + keccak(raw).hex()
+                self.nonces[sender] = nonce + 1
+                self.txs[tx_hash] = (sender, nonce)
+                self.data[tx_hash] = "0x" + rlp.decode(raw[1:])[7].hex()
+                if sender not in self.stuck:
+                    self.mined.add(tx_hash)
+                reply["result"] = tx_hash
+        elif method == "eth_getTransactionReceipt":
+            mined = params[0] in self.mined
+            reply["result"] = {"status": "0x1", "transactionHash": params[0]} if mined else None
+        elif method == "eth_getTransactionByHash":
+            reply["result"] = {"hash": params[0]} if params[0] in self.txs else None
+        else:
+            reply["result"] = {
+                "eth_estimateGas": "0x30d40",
+                "eth_maxPriorityFeePerGas": "0xf4240",
+                "eth_getBlockByNumber": {"baseFeePerGas": "0x3b9aca00"},
+            }[method]
+        return httpx.Response(200, json=reply)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(trader: str | None = TRADER) -> AsyncAvantis:
+    return AsyncAvantis(
+        network="testnet",
+        private_key=TEST_KEY,
+        trader_address=trader,
+        tx_builder_url=TXB,
+        data_api_url=DATA,
+        execution="direct",
+        rpc_url=RPC,
+    )
+
+
+def _calldata(i: int) -> CallData:
+    return CallData.model_validate(
+        {
+            "to": META["addresses"]["tradingRouter"],
+            "from": TRADER,
+            "data": "0xdeadbeef" + f"{i:08x}",
+            "chainId": META["chainId"],
+            "description": f"order {i}",
+        }
+    )
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_orders_spread_over_lanes_with_contiguous_nonces():
+    respx.get(f"{TXB}/v2/meta").mock(
+        return_value=httpx.Response(200, json={"ok": True, "data": META})
+    )
+    signers = [LocalSigner(k) for k in LANE_KEYS]
+    node = Node({signers[1].address: 7})
+    respx.post(RPC).mock(side_effect=node)
+    async with _client() as client:
+        lanes = client.engine.use_lanes(signers)
+        receipts = await asyncio.gather(
+            *(client.engine.submit_direct(_calldata(i)) for i in range(40))
+        )
+
+    assert all(r.route == "rpc" and r.raw["status"] == "0x1" for r in receipts)
+    assert len({r.tx_hash for r in receipts}) == 40
+    assert [lane.sent for lane in lanes.lanes] == [10, 10, 10, 10]
+    assert all(not lane.pending for lane in lanes.lanes)
+    by_sender: dict[str, list[int]] = {}
+    for sender, nonce in node.txs.values():
+        by_sender.setdefault(sender, []).append(nonce)
+    assert sorted(by_sender[signers[1].address.lower()]) == list(range(7, 17))
+    assert sorted(by_sender[signers[0].address.lower()]) == list(range(10))
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stalled_lane_is_bypassed_until_its_transaction_clears():
+    respx.get(f"{TXB}/v2/meta").mock(
+        return_value=httpx.Response(200, json={"ok": True, "data": META})
+    )
+    signers = [LocalSigner(k) for k in LANE_KEYS[:3]]
+    stuck = signers[0].address.lower()
+    node = Node()
+    node.stuck.add(stuck)
+    respx.post(RPC).mock(side_effect=node)
+    clock = Clock()
+    async with _client() as client:
+        lanes = client.engine.use_lanes(signers, stall_s=30.0, clock=clock)
+        first = [await client.engine.submit_direct(_calldata(i), wait=False) for i in range(3)]
+        assert [lane.sent for lane in lanes.lanes] == [1, 1, 1]
+
+        clock.now += 31
+        await lanes.poll()
+        assert [lane.stalled for lane in lanes.lanes] == [True, False, False]
+        for i in range(4):
+            await client.engine.submit_direct(_calldata(10 + i), wait=False)
+        assert [lane.sent for lane in lanes.lanes] == [1, 3, 3]
+
+        node.drop(first[0].tx_hash)  # evicted from the mempool
+        node.stuck.clear()
+        await lanes.poll()
+        assert not lanes.lanes[0].stalled and not lanes.lanes[0].pending
+        await client.engine.submit_direct(_calldata(20), wait=False)
+        assert lanes.lanes[0].sent == 2
+        assert sorted(n for s, n in node.txs.values() if s == stuck) == [0]  # nonce reused
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_lanes_send_delegate_wrapped_calldata_and_keep_own_calls_on_the_signer():
+    respx.get(f"{TXB}/v2/meta").mock(
+        return_value=httpx.Response(200, json={"ok": True, "data": META})
+    )
+    respx.get(f"{DATA}/v2/trading").mock(return_value=httpx.Response(200, json=SNAPSHOT))
+    wrapped = _calldata(1).model_dump(by_alias=True) | {"data": "0x5d4e0c1a" + "ab" * 32}
+    cancel = respx.post(f"{TXB}/v2/limit/cancel").mock(
+        return_value=httpx.Response(200, json={"ok": True, "data": wrapped})
+    )
+    node = Node()
+    respx.post(RPC).mock(side_effect=node)
+    signers = [LocalSigner(k) for k in LANE_KEYS[:2]]
+    own = LocalSigner(TEST_KEY).address.lower()
+
+    async with _client(trader=None) as client:  # the key is the trader itself
+        with pytest.raises(ConfigError):
+            client.engine.use_lanes(signers)
+
+    async with _client() as client:
+        client.engine.use_lanes(signers)
+        receipt = await client.trade.cancel_limit_order("ETH/USD", 3)
+        assert json.loads(cancel.calls.last.request.content)["delegate"].lower() == own
+        sender, _ = node.txs[receipt.tx_hash]
+        assert sender in {s.address.lower() for s in signers}
+        assert node.data[receipt.tx_hash] == wrapped["data"]
+
+        own_call = await client.engine.submit_direct(_calldata(2), lane=False)
+        assert node.txs[own_call.tx_hash][0] == own
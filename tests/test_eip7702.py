@@ -8,9 +8,22 @@ the actual Gelato SDK from avantis-ui-v2's node_modules.
 import json
 from pathlib import Path
 
-from avantis_trader_sdk.eip7702 import Call, GelatoDelegationEncoder, encode_nonce
+import httpx
+import pytest
+import respx
+
+from avantis_trader_sdk import AsyncAvantis
+from avantis_trader_sdk.config import AvantisConfig
+from avantis_trader_sdk.eip7702 import (
+    Call,
+    ExecNonceAllocator,
+    GelatoDelegationEncoder,
+    encode_nonce,
+)
 from avantis_trader_sdk.eip7702.account import delegation_code
+from avantis_trader_sdk.errors import ConfigError
 from avantis_trader_sdk.signing import LocalSigner
+from tests.conftest import META, TEST_KEY, TRADER
 
 REF = json.loads((Path(__file__).parent / "vectors" / "eip7702_reference.json").read_text())
 
@@ -76,3 +89,62 @@ def test_delegation_code():
         delegation_code("0x5aF42746a8Af42d8a4708dF238C53F1F71abF0E0")
         == "0xef01005af42746a8af42d8a4708df238c53f1f71abf0e0"
     )
+
+
+def test_exec_nonce_allocator_is_unique_under_concurrency():
+    from concurrent.futures import ThreadPoolExecutor
+
+    frozen = ExecNonceAllocator(clock=lambda: 1_800_000_000.0)  # every call in one µs
+    workers = [ExecNonceAllocator(worker_id=w, worker_bits=4) for w in range(3)]
+
+    def draw(alloc: ExecNonceAllocator) -> list[int]:
+        return [alloc.next() for _ in range(2_000)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        batches = list(pool.map(draw, [frozen] * 4 + workers * 2))
+    nonces = [n for batch in batches for n in batch]
+    assert len(set(nonces)) == len(nonces) == 20_000
+    assert all(n & (2**64 - 1) == 0 for n in nonces)  # fresh keys: sequence 0
+    assert {n >> (64 + 188) for n in batches[4]} == {0}
+    assert {n >> (64 + 188) for n in batches[6]} == {2}
+    assert min(n >> 64 for n in batches[0]) >= 1_800_000_000 * 10**6
+
+
+def test_exec_nonce_allocator_sequential_mode_per_key():
+    alloc = ExecNonceAllocator()
+    assert [alloc.next_sequential(7) for _ in range(3)] == [encode_nonce(7, s) for s in range(3)]
+    assert alloc.next_sequential(8) == encode_nonce(8, 0)
+    alloc.sync(7, 10)
+    assert alloc.next_sequential(7) == encode_nonce(7, 10)
+    with pytest.raises(ConfigError):
+        ExecNonceAllocator(worker_id=4, worker_bits=2)
+
+
+def test_encoder_draws_exec_nonces_from_its_allocator():
+    encoder = _encoder()
+    encoder.exec_nonces = ExecNonceAllocator(clock=lambda: 1.0)
+    a, b = encoder.encode_call_data(_calls()), encoder.encode_call_data(_calls())
+    assert a != b
+    assert encoder.exec_nonces.next() == encode_nonce(1_000_002, 0)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_engine_encoder_takes_its_worker_id_from_config(monkeypatch):
+    respx.get("https://txb.test/v2/meta").mock(
+        return_value=httpx.Response(200, json={"ok": True, "data": META})
+    )
+    monkeypatch.setenv("AVANTIS_EXEC_NONCE_WORKER_ID", "5")
+    async with AsyncAvantis(
+        network="testnet",
+        private_key=TEST_KEY,
+        trader_address=TRADER,
+        tx_builder_url="https://txb.test",
+        exec_nonce_worker_bits=4,
+    ) as client:
+        encoder = await client.engine.encoder()
+        assert {encoder.exec_nonces.next() >> (64 + 188) for _ in range(3)} == {5}
+
+    monkeypatch.setenv("AVANTIS_EXEC_NONCE_WORKER_ID", "five")
+    with pytest.raises(ConfigError):
+        AvantisConfig.load(network="testnet")
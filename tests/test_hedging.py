@@ -0,0 +1,106 @@
+"""Hedged GETs: a duplicate goes out once a request outlives the endpoint's
+observed pN latency, the first answer wins, and a budget caps the extra load."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+import respx
+
+from avantis_trader_sdk import AsyncAvantis
+from avantis_trader_sdk.circuit import CircuitBreakers
+from avantis_trader_sdk.errors import ConfigError
+from avantis_trader_sdk.ratelimit import RateLimiter
+from avantis_trader_sdk.transport import Hedging, HttpTransport
+
+URL = "https://core.test/user-data"
+
+
+class Server:
+    """Serves request n after ``delays[n]`` seconds (``default`` once the list
+    runs out); counts requests sent, including cancelled ones."""
+
+    def __init__(self, delays: list[float], default: float = 0.0) -> None:
+        self.delays = iter(delays)
+        self.default = default
+        self.sent = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.sent += 1
+        delay = next(self.delays, self.default)
+        await asyncio.sleep(delay)
+        return httpx.Response(200, json={"delay": delay})
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_slow_request_is_hedged_and_the_fast_copy_wins():
+    server = Server([0.01] * 5 + [1.0])
+    respx.get(URL).mock(side_effect=server)
+    hedging = Hedging(percentile=50, min_samples=5, budget_ratio=1.0, burst=1.0)
+    transport = HttpTransport(hedging=hedging)
+    for _ in range(5):  # warm up: five ~10 ms samples
+        await transport.json("GET", URL, hedge="user-data")
+    assert hedging.hedged == 0
+
+    started = time.monotonic()
+    body = await transport.json("GET", URL, params={"trader": "0x1"}, hedge="user-data")
+    assert time.monotonic() - started < 0.5
+    assert body == {"delay": 0.0}  # the duplicate answered
+    assert server.sent == 7
+    assert (hedging.requests, hedging.hedged, hedging.hedge_wins) == (6, 1, 1)
+    await transport.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_budget_caps_hedges_and_unhedged_calls_are_untouched():
+    server = Server([], default=0.02)
+    respx.get(URL).mock(side_effect=server)
+    hedging = Hedging(percentile=50, min_samples=3, budget_ratio=0.25, burst=1.0)
+    for _ in range(100):  # p50 of 1 ms: every 20 ms request is hedge-eligible
+        hedging.record("user-data", 0.001)
+    transport = HttpTransport(hedging=hedging)
+    for _ in range(11):
+        await transport.json("GET", URL, hedge="user-data")
+    assert hedging.hedged == 2  # 11 requests x 0.25 = 2.75 hedges earned
+    assert server.sent == 13
+
+    await transport.json("GET", URL)  # no hedge= name: never duplicated
+    assert server.sent == 14
+    await transport.aclose()
+
+    with pytest.raises(ConfigError):
+        Hedging(budget_ratio=1.5)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_the_duplicate_takes_a_limiter_token_and_respects_the_breaker():
+    server = Server([0.01] * 5 + [0.3, 0.0, 0.3])
+    respx.get(URL).mock(side_effect=server)
+    hedging = Hedging(percentile=50, min_samples=5, budget_ratio=1.0, burst=2.0)
+    limiter = RateLimiter({"https://core.test": "core"}, {"core": 1000})
+    breakers = CircuitBreakers(failure_threshold=1)
+    transport = HttpTransport(hedging=hedging, limiter=limiter, breakers=breakers)
+    for _ in range(5):
+        await transport.json("GET", URL, hedge="user-data")
+
+    await transport.json("GET", URL, hedge="user-data")
+    assert hedging.hedge_wins == 1
+    assert limiter.stats()["core"].requests == 7  # primary + duplicate
+
+    async def trip():  # the upstream fails elsewhere while this GET waits
+        await asyncio.sleep(0.005)
+        breakers.failure(URL)
+
+    await asyncio.gather(transport.json("GET", URL, hedge="user-data"), trip())
+    assert server.sent == 8  # no duplicate into an open circuit
+    assert hedging.hedged == 1 and limiter.stats()["core"].requests == 8
+    await transport.aclose()
+
+
+def test_hedging_is_opt_in_from_config():
+    assert AsyncAvantis(network="testnet").transport.hedging is None
+    assert AsyncAvantis(network="testnet", hedge_reads=True).transport.hedging is not None
@@ -0,0 +1,121 @@
+"""Paged history: iterators prefetch a bounded number of pages and stop at
+the first short page; the SQLite store syncs only records newer than the
+last sync."""
+
+import asyncio
+import re
+
+import httpx
+import pytest
+import respx
+
+from avantis_trader_sdk import AsyncAvantis
+from avantis_trader_sdk._aio import iter_pages
+from avantis_trader_sdk.info import HistoryStore
+from tests.conftest import META, TEST_KEY, TRADER
+
+HISTORY = "https://history.test"
+TWAP = "https://twap.test"
+TXB = "https://txb.test"
+
+
+def _client() -> AsyncAvantis:
+    return AsyncAvantis(
+        network="testnet",
+        private_key=TEST_KEY,
+        trader_address=TRADER,
+        tx_builder_url=TXB,
+        history_api_url=HISTORY,
+        twap_api_url=TWAP,
+    )
+
+
+def _history(total: int, *, page_size: int):
+    """Newest-first trade ids total-1 .. 0, served in pages."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page, limit = map(int, request.url.path.rsplit("/", 2)[-2:])
+        assert limit == page_size
+        ids = list(range(total - 1, -1, -1))[page * limit : (page + 1) * limit]
+        return httpx.Response(
+            200, json={"portfolio": [{"_id": str(i), "pnl": i} for i in ids], "pageCount": 9}
+        )
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_keeps_prefetch_bounded_and_stops_early():
+    in_flight, peak, requested = 0, 0, []
+
+    async def fetch(page):
+        nonlocal in_flight, peak
+        requested.append(page)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return [page * 10 + i for i in range(10 if page < 5 else 3)]
+
+    items = [item async for item in iter_pages(fetch, page_size=10, prefetch=3)]
+    assert items == list(range(50)) + [50, 51, 52]
+    assert peak == 3
+
+    requested.clear()
+    pages = iter_pages(fetch, page_size=10, prefetch=3)
+    async for item in pages:
+        if item == 4:
+            break
+    await pages.aclose()
+    assert requested == [0, 1, 2]  # nothing fetched beyond the prefetch window
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_history_store_syncs_only_new_records(tmp_path):
+    pattern = re.compile(rf"{HISTORY}/v2/history/trade-history/{TRADER}/\d+/25")
+    route = respx.get(url__regex=pattern).mock(side_effect=_history(60, page_size=25))
+    path = str(tmp_path / "history.db")
+
+    async with _client() as client:
+        store = HistoryStore(path)
+        added = await store.sync(
+            "trades", TRADER, client.info.iter_trade_history(TRADER, page_size=25)
+        )
+        assert added == 60 and route.call_count >= 3
+        store.close()
+
+        # five new fills later: page 0 only, stopping at the first known id
+        route.side_effect = _history(65, page_size=25)
+        route.reset()
+        store = HistoryStore(path)
+        added = await store.sync(
+            "trades", TRADER,
+            client.info.iter_trade_history(TRADER, page_size=25, prefetch=1),
+        )
+        assert added == 5 and route.call_count == 1
+        assert [r["_id"] for r in store.records("trades", TRADER, limit=7)] == [
+            "64", "63", "62", "61", "60", "59", "58",
+        ]
+        assert store.count("trades", TRADER.upper()) == 65
+        assert store.count("orders", TRADER) == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_iter_twaps_walks_twap_app_pages():
+    respx.get(f"{TXB}/v2/meta").mock(
+        return_value=httpx.Response(200, json={"ok": True, "data": META})
+    )
+
+    def handler(request):
+        page = int(request.url.params["pageNum"])
+        size = int(request.url.params["pageSize"])
+        ids = list(range(7))[page * size : (page + 1) * size]
+        return httpx.Response(200, json=[{"twapId": i} for i in ids])
+
+    route = respx.get(f"{TWAP}/twaps").mock(side_effect=handler)
+    async with _client() as client:
+        twaps = [t async for t in client.account.iter_twaps(page_size=3, prefetch=2)]
+    assert [t["twapId"] for t in twaps] == list(range(7))
+    assert {c.request.url.params["includeCanceled"] for c in route.calls} == {"false"}
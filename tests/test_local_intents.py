@@ -3,13 +3,16 @@
 match viem's abi encoding byte-for-byte."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
+from avantis_trader_sdk.errors import ConfigError
 from avantis_trader_sdk.execution.local_intents import LocalIntentBuilder, NoncePool
 from avantis_trader_sdk.intents_schema import INTENT_TYPES
 from avantis_trader_sdk.signing import LocalSigner, sign_intent
+from avantis_trader_sdk.types import to_1e10, to_usdc
 from tests.conftest import TEST_KEY, VECTORS
 
 ENC_REF = json.loads(
@@ -378,6 +381,49 @@ def test_nonce_pool_unique():
     assert len(nonces) == 1000
 
 
+def test_nonce_pool_evicts_after_deadline_and_partitions_workers():
+    now = [1_800_000_000.0]
+    pool = NoncePool(ttl_ms=10_000, grace_ms=5_000, clock=lambda: now[0])
+    early = [pool.next() for _ in range(100)]  # deadline = now + ttl
+    late = pool.next(deadline_ms=int(now[0] * 1000) + 60_000)
+    pool.release(early[0])
+    assert len(pool) == 100 and early[0] not in pool._used
+    now[0] += 14  # within ttl + grace: still reserved
+    pool.next()
+    assert len(pool) == 101
+    now[0] += 2  # the first batch's deadline bucket is past its grace
+    pool.next()
+    assert len(pool) == 3 and late in pool._used and early[1] not in pool._used
+
+    workers = [NoncePool(worker_id=i, worker_bits=4) for i in range(3)]
+    for i, worker in enumerate(workers):
+        assert all(worker.next() >> 252 == i for _ in range(50))
+    with pytest.raises(ConfigError):
+        NoncePool(worker_id=16, worker_bits=4)
+
+
+def test_builder_helpers_reserve_nonces_until_their_own_deadline():
+    now = [1_800_000_000.0]
+    b = _builder()
+    b.nonces = NoncePool(ttl_ms=10_000, grace_ms=0, clock=lambda: now[0])
+    deadline = int(now[0] * 1000) + 600_000  # well past the pool's default ttl
+    payload = b.close_trade(
+        trader="0x" + "11" * 20, pair_index=1, index=0, open_timestamp=1,
+        amount_usdc=10, wanted_price=4000, deadline_ms=deadline,
+    )
+    nonce = int(payload.message["_nonce"])
+    now[0] += 60
+    b.nonces.next()  # evicts everything past its deadline bucket
+    assert nonce in b.nonces._used
+
+
+def test_nonce_pool_is_thread_safe():
+    pool = NoncePool()
+    with ThreadPoolExecutor(8) as threads:
+        nonces = list(threads.map(lambda _: pool.next(), range(4000)))
+    assert len(set(nonces)) == len(pool) == 4000
+
+
 def test_build_accepts_decimal_string_values():
     # callers may pass raw values as decimal strings (API convention);
     # digest and encoding must be identical to int inputs
@@ -389,3 +435,59 @@ def test_build_accepts_decimal_string_values():
     assert from_strings.encoded_intent == from_ints.encoded_intent
     # bools survived (isCoin=False in this vector)
     assert from_strings.message["isCoin"] is False
+
+
+def test_intent_templates_match_the_helpers():
+    b = _builder()
+    template = b.open_trade_template(
+        trader=TRADER, pair_index=1, is_long=True, leverage=10, tp=90000, slippage_percent=0.3
+    )
+    assert template.variables == ("price", "size", "nonce", "deadline_ms")
+    for price, collateral in ((80000.0, 100), (80001.5, 2500)):
+        fast = template.build(
+            price=to_1e10(price), size=to_usdc(collateral), nonce=7, deadline_ms=1800000000123
+        )
+        slow = b.open_trade(
+            trader=TRADER, pair_index=1, is_long=True, collateral_usdc=collateral,
+            leverage=10, open_price=price, tp=90000, slippage_percent=0.3,
+            nonce=7, deadline_ms=1800000000123,
+        )
+        assert fast.model_dump(by_alias=True) == slow.model_dump(by_alias=True)
+    sign_intent(fast, LocalSigner(TEST_KEY))  # digest gate
+
+    close = b.close_trade_template(trader=TRADER, pair_index=1, index=2, open_timestamp=99)
+    assert close.build(
+        price=to_1e10(79000), size=to_usdc(40), nonce=3, deadline_ms=5
+    ).model_dump(by_alias=True) == b.close_trade(
+        trader=TRADER, pair_index=1, index=2, open_timestamp=99, amount_usdc=40,
+        wanted_price=79000, nonce=3, deadline_ms=5,
+    ).model_dump(by_alias=True)
+
+    # generic: free fields both inside the Trade struct and at the top level
+    vector = next(v for v in VECTORS["vectors"] if v["kind"] == "OpenTradeCoinExposureReq")
+    message = _int_message("OpenTradeCoinExposureReq", vector["message"])
+    coin = b.template(
+        "OpenTradeCoinExposureReq",
+        message,
+        {"price": ("_t", "openPrice"), "coin": ("_coinExposure",)},
+    ).build(
+        price=message["_t"]["openPrice"],
+        coin=message["_coinExposure"],
+        nonce=message["_nonce"],
+        deadline_ms=message["_deadline"],
+    )
+    assert coin.digest == vector["digest"]
+    assert coin.encoded_intent == b.build("OpenTradeCoinExposureReq", message).encoded_intent
+
+
+def test_intent_template_rejects_non_static_kinds_and_missing_values():
+    b = _builder()
+    with pytest.raises(ValueError):
+        b.template("CancelOffchainOrder", {"entityId": "x"}, {})
+    with pytest.raises(ValueError):
+        b.template("DelegateReq", {}, {})
+    template = b.close_trade_template(trader=TRADER, pair_index=1, index=0, open_timestamp=0)
+    with pytest.raises(TypeError, match="size"):
+        template.build(price=1)
+    first, second = template.build(price=1, size=1), template.build(price=1, size=1)
+    assert first.message["_nonce"] != second.message["_nonce"]  # pool nonces
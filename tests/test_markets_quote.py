@@ -0,0 +1,170 @@
+"""Pre-trade quote aggregator: one call (or one batch) yields price, spread,
+fees, headroom, liquidation and validation, matching the individual
+compute helpers, with network legs run concurrently."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from avantis_trader_sdk import AsyncAvantis, compute
+from avantis_trader_sdk.errors import ApiError
+from avantis_trader_sdk.markets import QuoteRequest
+from avantis_trader_sdk.markets.models import TradingSnapshot
+from tests.conftest import TEST_KEY, TRADER
+
+FEED = "https://feed.test"
+DATA = "https://data.test"
+RISK_V2 = "https://risk-v2.test"
+
+SNAPSHOT = json.loads(
+    (Path(__file__).parent / "vectors" / "trading_snapshot.json").read_text()
+)
+
+
+def _client() -> AsyncAvantis:
+    return AsyncAvantis(
+        network="testnet",
+        private_key=TEST_KEY,
+        trader_address=TRADER,
+        feed_url=FEED,
+        data_api_url=DATA,
+        risk_v2_api_url=RISK_V2,
+    )
+
+
+def _mock_market():
+    respx.get(f"{DATA}/v2/trading").mock(return_value=httpx.Response(200, json=SNAPSHOT))
+    price = respx.get(f"{FEED}/v1/price-feeds/last-price").mock(
+        return_value=httpx.Response(
+            200, json=[{"pairIndex": 0, "c": 2000.0}, {"pairIndex": 1, "c": 60000.0}]
+        )
+    )
+
+    def spread(request):
+        body = json.loads(request.content)
+        if body["pairIndex"] == 1:
+            return httpx.Response(403, json={"message": "blocked"})
+        return httpx.Response(200, json={"spreadPctWithoutFlow10": "500000000"})  # 0.05%
+
+    return price, respx.post(f"{RISK_V2}/spread").mock(side_effect=spread)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_quote_matches_the_individual_helpers():
+    _, spread_route = _mock_market()
+    async with _client() as client:
+        q = await client.markets.quote(
+            "ETH/USD", is_long=True, collateral=100, leverage=10, stop_loss_percent=50
+        )
+
+    snap = TradingSnapshot.model_validate(SNAPSHOT.get("data", SNAPSHOT))
+    eth = snap.pair_by_symbol("ETH/USD")
+    assert q.ok and q.price == 2000 and q.spread_p == pytest.approx(0.05)
+    assert json.loads(spread_route.calls[0].request.content)["coinSize10"] == str(int(0.5e10))
+    fee_p, fee = compute.skew_adjusted_open_fee(
+        position_size=1000, is_long=True, oi_long=eth.open_interest.long,
+        oi_short=eth.open_interest.short, skew_eq_params=eth.skew_eq_params,
+    )
+    assert (q.open_fee_p, q.open_fee) == (fee_p, fee)
+    assert q.max_position_size == compute.max_position_size(eth, snap, is_long=True)
+    assert q.liquidation_price == compute.estimate_liquidation_price(
+        open_price=2000, collateral=100, leverage=10, is_long=True
+    )
+    expected = compute.validate_order(
+        eth, snap, collateral=100, leverage=10, is_long=True, market_price=2000,
+        stop_loss_percent=50, dynamic_spread_p=0.05,
+    )
+    assert q.validation.errors == expected.errors
+    assert {"snapshot", "price", "spread", "compute", "total"} <= q.timings_ms.keys()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_quote_many_shares_one_price_read_and_keeps_slots():
+    price_route, spread_route = _mock_market()
+    async with _client() as client:
+        quotes = await client.markets.quote_many(
+            [
+                QuoteRequest("ETH/USD", is_long=True, collateral=100, leverage=10),
+                QuoteRequest(1, is_long=False, collateral=100, leverage=500),
+                QuoteRequest("NOPE/USD", is_long=True, collateral=1, leverage=2),
+                QuoteRequest(0, is_long=True, collateral=100, leverage=5, limit_price=1900),
+            ]
+        )
+
+    assert price_route.call_count == 1 and spread_route.call_count == 3
+    eth, btc, unknown, limit = quotes
+    assert eth.ok and eth.result.ok
+    assert btc.ok and not btc.result.ok  # blocked spread: quoted, flagged
+    assert btc.result.spread_error.status == 403 and btc.result.spread_p is None
+    assert any("HTTP 403" in e for e in btc.result.validation.errors)
+    assert any("leverage 500" in e for e in btc.result.validation.errors)
+    assert isinstance(unknown.error, ApiError)
+    assert limit.result.entry_price == 1900 and limit.result.price == 2000
+    bodies = [json.loads(c.request.content) for c in spread_route.calls]
+    [body] = [b for b in bodies if b["orderType"] == 1]
+    assert body["wantedPrice10"] == str(int(1900e10))
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_limit_quote_is_checked_against_the_last_price():
+    price_route, _ = _mock_market()
+    async with _client() as client:
+        below = await client.markets.quote(
+            "ETH/USD", is_long=True, collateral=100, leverage=10, limit_price=1900
+        )
+        above = await client.markets.quote(
+            "ETH/USD", is_long=True, collateral=100, leverage=10, limit_price=2100
+        )
+
+    assert price_route.call_count >= 1
+    assert below.price == 2000 and below.entry_price == 1900
+    assert below.ok, below.validation.errors
+    assert not above.ok
+    assert any("below market" in e for e in above.validation.errors)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_spread_quote_does_not_wait_for_the_price_read():
+    price_route, spread_route = _mock_market()
+    prices = price_route.return_value
+    posted = asyncio.Event()
+    spread_route.side_effect = lambda request: (
+        posted.set(),
+        httpx.Response(200, json={"spreadPctWithoutFlow10": "500000000"}),
+    )[1]
+
+    async def slow_price(request):
+        await asyncio.wait_for(posted.wait(), 1)  # the spread POST went first
+        return prices
+
+    async with _client() as client:
+        await client.markets.last_prices()  # warm: market quotes size from it
+        price_route.side_effect = slow_price
+        limit = await client.markets.quote(
+            0, is_long=True, collateral=100, leverage=10, limit_price=1900
+        )
+        posted.clear()
+        market = await client.markets.quote(0, is_long=True, collateral=100, leverage=10)
+
+    assert limit.ok and limit.price == 2000
+    assert market.ok and market.spread_p == pytest.approx(0.05)
+    assert price_route.call_count == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_unknown_pair_error_names_the_pair():
+    _mock_market()
+    async with _client() as client:
+        [outcome] = await client.markets.quote_many(
+            [QuoteRequest(9999, is_long=True, collateral=1, leverage=2)]
+        )
+    assert str(outcome.error) == "unknown pair 9999"
@@ -5,6 +5,7 @@ src/risk-engine-v2-app/spread-module (SpreadRequestDto / SpreadResponseDto)
 and the avantis-ui-v2 useDynamicSpread hook.
 """
 
+import asyncio
 import json
 from pathlib import Path
 
@@ -151,6 +152,71 @@ async def test_spread_requires_sizing_args():
             await client.markets.spread("ETH/USD", is_long=True)
 
 
+@pytest.mark.asyncio
+@respx.mock
+async def test_spread_quotes_and_blocked_outcomes_are_cached():
+    _mock_snapshot()
+    route = respx.post(f"{RISK_V2}/spread").mock(
+        return_value=httpx.Response(200, json=SPREAD_RESPONSE)
+    )
+
+    async with _client() as client:
+        first = await client.markets.spread("ETH/USD", is_long=True, coin_size=2.5)
+        first["spreadPct"] = -1  # callers get copies
+        # same size bucket (3 significant digits) -> cached
+        again = await client.markets.spread("ETH/USD", is_long=True, coin_size=2.501)
+        assert route.call_count == 1 and again["spreadPct"] == pytest.approx(0.075)
+        await client.markets.spread("ETH/USD", is_long=False, coin_size=2.5)
+        await client.markets.spread("ETH/USD", is_long=True, coin_size=2.5, fresh=True)
+        assert route.call_count == 3
+
+        route.mock(return_value=httpx.Response(403, json={"message": "market closed"}))
+        for _ in range(3):
+            with pytest.raises(ApiError) as err:
+                await client.markets.spread("ETH/USD", is_long=True, coin_size=7)
+            assert err.value.status == 403
+        assert route.call_count == 4
+
+        client.markets.spread_ttl_s = 0
+        with pytest.raises(ApiError):
+            await client.markets.spread("ETH/USD", is_long=True, coin_size=7)
+        assert route.call_count == 5
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_spread_ladder_shares_one_reference_price():
+    _mock_snapshot()
+    price_route = respx.get(f"{FEED}/v1/price-feeds/last-price").mock(
+        return_value=httpx.Response(200, json=[{"pairIndex": 0, "c": 2000}])
+    )
+
+    def quote(request):
+        coin = int(json.loads(request.content)["coinSize10"]) / 1e10
+        if coin > 50:
+            return httpx.Response(404, json={"message": "no spread"})
+        return httpx.Response(200, json={**SPREAD_RESPONSE, "spreadPctWithoutFlow10": "1"})
+
+    route = respx.post(f"{RISK_V2}/spread").mock(side_effect=quote)
+
+    async with _client() as client:
+        client.markets.spread_max_in_flight = 2
+        eth = await client.markets.pair("ETH/USD")
+        price_route.mock(
+            return_value=httpx.Response(200, json=[{"pairIndex": eth.index, "c": 2000}])
+        )
+        ladder = await client.markets.spread_ladder(
+            "ETH/USD", [1000, 10_000, 200_000], is_long=True, notional_usd=True
+        )
+
+    assert price_route.call_count == 1 and route.call_count == 3
+    assert [r.item for r in ladder] == [1000, 10_000, 200_000]
+    assert [r.ok for r in ladder] == [True, True, False]
+    assert ladder[2].error.status == 404
+    coins = sorted(int(json.loads(c.request.content)["coinSize10"]) for c in route.calls)
+    assert coins == [int(0.5e10), int(5e10), int(100e10)]
+
+
 @pytest.mark.asyncio
 @respx.mock
 async def test_open_interests_and_orderbook_snapshots():
@@ -174,3 +240,67 @@ async def test_open_interests_and_orderbook_snapshots():
     async with _client() as client:
         assert await client.markets.open_interests() == oi
         assert await client.markets.orderbook_snapshots() == books
+        await asyncio.sleep(0.06)
+        [cached] = await client.markets.orderbook_snapshots()  # still in its TTL
+        [stored] = client.markets.refreshers["orderbook_snapshots"].peek()
+
+    assert 300 <= cached["ageMs"] < 1250  # the time spent cached is added
+    assert stored["ageMs"] == 250  # to a copy
+
+
+BOOKS = [
+    {"source": "BINANCE", "pairIndex": 0, "cumulativeCoinLiquidityBid": "100",
+     "cumulativeCoinLiquidityAsk": "80", "ageMs": 250},
+    {"source": "OKX", "pairIndex": 0, "cumulativeCoinLiquidityBid": "50",
+     "cumulativeCoinLiquidityAsk": "20", "ageMs": 900},
+    {"source": "BYBIT", "pairIndex": 0, "cumulativeCoinLiquidityBid": "999",
+     "cumulativeCoinLiquidityAsk": "999", "ageMs": 60_000},  # stale: left out
+    {"source": "BINANCE", "pairIndex": 1, "cumulativeCoinLiquidityBid": "4",
+     "cumulativeCoinLiquidityAsk": "5", "ageMs": 8_000},
+]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_orderbook_model_impact_and_staleness():
+    respx.get(f"{RISK_V2}/orderbook/snapshots").mock(
+        return_value=httpx.Response(200, json=BOOKS)
+    )
+    now = [100.0]
+    async with _client() as client:
+        books = client.markets.orderbook_model(clock=lambda: now[0])
+        await books.refresh()
+
+    eth = books.depth(0)
+    assert (eth.bid, eth.ask, eth.sources, eth.stale) == (150, 100, 2, False)
+    assert eth.age_ms == 900
+    assert books.depth(1).stale and books.depth(7) is None
+
+    impact = books.impact([0, 0, 0, 1, 7], [10, 50, 30, 1, 1],
+                          is_long=[True, True, False, True, True])
+    assert list(impact) == pytest.approx([0.1, 0.5, 0.2, 0.2, float("inf")])
+    assert books.stale([0, 1, 7]) == [False, True, True]
+    assert books.screen(0, [5, 10, 20, 40], is_long=True, max_impact=0.2) == [5, 10, 20]
+    assert books.screen(1, [1], is_long=True, max_impact=1) == []
+    assert books.screen(1, [1], is_long=True, max_impact=1, allow_stale=True) == [1]
+
+    now[0] += 4.5  # books age locally between refreshes
+    assert books.stale([0]) == [True] and books.depth(0).age_ms == pytest.approx(5400)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_orderbook_model_background_refresh_survives_errors():
+    route = respx.get(f"{RISK_V2}/orderbook/snapshots").mock(
+        side_effect=[httpx.Response(200, json=BOOKS), httpx.Response(503)]
+        + [httpx.Response(200, json=BOOKS[3:])] * 50
+    )
+    async with _client() as client:
+        books = client.markets.orderbook_model(refresh_s=0.001)
+        books.start()
+        for _ in range(1000):
+            if route.call_count >= 3:
+                break
+            await asyncio.sleep(0.001)
+        await books.stop()
+    assert len(books) == 1 and books.last_error is None
@@ -0,0 +1,200 @@
+"""Risk monitors: the price-sorted liquidation index (bisect lookups agree
+with a brute-force scan, fee accrual re-prices, stream routing) and the
+TP/SL trigger index (proximity, directional crossings)."""
+
+import random
+
+import pytest
+
+from avantis_trader_sdk.account.models import Position, PriceTrigger
+from avantis_trader_sdk.compute import estimate_liquidation_price
+from avantis_trader_sdk.errors import ConfigError
+from avantis_trader_sdk.markets.models import PairInfo
+from avantis_trader_sdk.monitor import FeedRouter, LiquidationMonitor, TriggerIndex
+from avantis_trader_sdk.streams import PriceUpdate
+from tests.conftest import TRADER
+
+
+def _position(index: int, *, buy: bool, open_price: float, leverage: float,
+              pair_index: int = 1, rollover: str = "0") -> Position:
+    return Position.model_validate(
+        {
+            "trader": TRADER,
+            "pairIndex": pair_index,
+            "index": index,
+            "buy": buy,
+            "collateral": "100000000",  # 100 USDC
+            "leverage": str(int(leverage * 10**10)),
+            "openPrice": str(int(open_price * 10**10)),
+            "rolloverFee": rollover,
+        }
+    )
+
+
+def _brute_force(positions: list[Position], price: float, buffer_p: float) -> set:
+    hits = set()
+    for p in positions:
+        liq = estimate_liquidation_price(
+            open_price=float(p.open_price), collateral=100,
+            leverage=float(p.leverage), is_long=p.buy,
+        )
+        if (p.buy and price <= liq * (1 + buffer_p / 100)) or (
+            not p.buy and price >= liq * (1 - buffer_p / 100)
+        ):
+            hits.add(p.index)
+    return hits
+
+
+def test_at_risk_matches_a_full_scan():
+    rng = random.Random(7)
+    positions = [
+        _position(i, buy=rng.random() < 0.5, open_price=rng.uniform(3000, 5000),
+                  leverage=rng.choice([5, 10, 25, 50]))
+        for i in range(500)
+    ]
+    monitor = LiquidationMonitor(buffer_p=1.5)
+    monitor.load(positions)
+    assert len(monitor) == 500
+    for price in (2500, 3200, 3900, 4400, 5600):
+        hits = {a.index for a in monitor.at_risk(1, price)}
+        assert hits == _brute_force(positions, price, 1.5)
+    assert monitor.at_risk(2, 4000) == []
+
+
+def test_accrue_and_remove_reindex():
+    monitor = LiquidationMonitor()
+    long = _position(0, buy=True, open_price=4000, leverage=10)
+    liq = monitor.upsert(long)
+    assert liq == pytest.approx(3660)
+    assert monitor.at_risk(1, 3670) == []
+
+    # 20 USDC of rollover pulls the long's liquidation up by 80
+    assert monitor.accrue(TRADER, 1, 0, rollover_fee=20, funding_fee=0) == pytest.approx(3740)
+    [alert] = monitor.at_risk(1, 3670)
+    assert alert.is_long and alert.distance_p < 0
+
+    monitor.remove(TRADER, 1, 0)
+    assert len(monitor) == 0 and monitor.at_risk(1, 3000) == []
+
+
+@pytest.mark.asyncio
+async def test_on_price_routes_feed_ids_to_pairs():
+    alerts = []
+    router = FeedRouter(
+        [
+            PairInfo.model_validate(
+                {"index": 1, "from": "ETH", "to": "USD", "lazerFeed": {"feedId": 2},
+                 "feed": {"feedId": "0xABCD"}}
+            )
+        ]
+    )
+    monitor = LiquidationMonitor(router=router, on_alert=alerts.append)
+    monitor.upsert(_position(0, buy=False, open_price=4000, leverage=10))  # liq 4340
+
+    await monitor.on_price(PriceUpdate(feed_id=2, price=4300))
+    assert alerts == []
+    await monitor.on_price(PriceUpdate(feed_id="abcd", price=4350))  # Hermes id
+    assert [a.index for a in alerts] == [0]
+
+    with pytest.raises(ConfigError):
+        await LiquidationMonitor().on_price(PriceUpdate(feed_id=2, price=1))
+
+
+def _trigger(entity_id: str, order_type: int, price: float, *, buy: bool = True,
+             index: int = 0) -> dict:
+    return {
+        "entityId": entity_id,
+        "trader": TRADER,
+        "pairIndex": 1,
+        "index": index,
+        "orderType": order_type,
+        "buy": buy,
+        "finalTriggerPrice": str(int(price * 10**10)),
+        "isGlobal": order_type in (0, 1),
+    }
+
+
+def _with_triggers(index: int, buy: bool, triggers: list[dict]) -> Position:
+    position = _position(index, buy=buy, open_price=4000, leverage=10)
+    return position.model_copy(
+        update={"price_triggers": [PriceTrigger.model_validate(t) for t in triggers]}
+    )
+
+
+def _book() -> TriggerIndex:
+    index = TriggerIndex()
+    index.load(
+        [
+            _with_triggers(0, True, [
+                _trigger("global-tp-0", 0, 4400),
+                _trigger("global-sl-0", 1, 0),  # no SL: not indexed
+                _trigger("p-tp", 4, 4100),
+                _trigger("p-sl", 5, 3900),
+            ]),
+            _with_triggers(1, False, [
+                _trigger("global-tp-1", 0, 3600, buy=False, index=1),
+                _trigger("global-sl-1", 1, 4200, buy=False, index=1),
+            ]),
+        ]
+    )
+    return index
+
+
+def test_trigger_index_near_is_nearest_first():
+    index = _book()
+    assert len(index) == 5
+    hits = index.near(1, 4000, within_p=5)
+    assert [h.trigger.entity_id for h in hits] == ["p-tp", "p-sl", "global-sl-1"]
+    assert hits[0].is_tp and hits[0].distance_p == pytest.approx(2.5)
+    assert index.near(2, 4000, within_p=50) == []
+
+
+def test_trigger_index_crossings_follow_the_firing_direction():
+    index = _book()
+    assert index.update(1, 4000) == []  # first price: nothing to cross
+    up = index.update(1, 4250)
+    # long TP 4100 and short SL 4200 fire upward; long SL 3900 does not
+    assert {c.trigger.entity_id for c in up} == {"p-tp", "global-sl-1"}
+    assert all(c.previous_price == 4000 for c in up)
+    down = index.update(1, 3550)
+    assert {c.trigger.entity_id for c in down} == {"p-sl", "global-tp-1"}
+
+    # a fresh snapshot of position 0 without its partials drops them
+    index.replace_position(_with_triggers(0, True, [_trigger("global-tp-0", 0, 4400)]))
+    assert len(index) == 3
+    assert {c.trigger.entity_id for c in index.update(1, 4500)} == {
+        "global-tp-0", "global-sl-1",
+    }
+
+
+def test_trigger_index_keys_positions_by_trader():
+    other = "0x" + "22" * 20
+    mine = _with_triggers(0, True, [_trigger("mine-tp", 4, 4100)])
+    theirs = mine.model_copy(
+        update={
+            "trader": other,
+            "price_triggers": [
+                PriceTrigger.model_validate({**_trigger("their-tp", 4, 4200), "trader": other})
+            ],
+        }
+    )
+    index = TriggerIndex()
+    index.load([mine, theirs])
+    assert len(index) == 2  # same pair and slot, different traders
+
+    index.replace_position(mine.model_copy(update={"price_triggers": []}))
+    assert [h.trigger.entity_id for h in index.near(1, 4200, within_p=1)] == ["their-tp"]
+
+
+@pytest.mark.asyncio
+async def test_trigger_index_on_price_emits_crossings():
+    crossings = []
+    router = FeedRouter(
+        [PairInfo.model_validate({"index": 1, "from": "ETH", "to": "USD",
+                                  "lazerFeed": {"feedId": 2}})]
+    )
+    index = TriggerIndex(router=router, on_crossing=crossings.append)
+    index.load([_with_triggers(0, True, [_trigger("p-tp", 4, 4100)])])
+    await index.on_price(PriceUpdate(feed_id=2, price=4000))
+    await index.on_price(PriceUpdate(feed_id=2, price=4100, timestamp_ms=5))
+    assert [(c.trigger.entity_id, c.timestamp_ms) for c in crossings] == [("p-tp", 5)]
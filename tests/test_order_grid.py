@@ -0,0 +1,166 @@
+"""Pre-signed order grid: levels are built and signed ahead of time, a tick
+submits the nearest one with no signing or tx-builder work, and levels are
+re-signed before their deadline with unsubmitted nonces released."""
+
+import json
+
+import httpx
+import pytest
+import respx
+
+from avantis_trader_sdk import AsyncAvantis
+from avantis_trader_sdk.errors import ApiError, ConfigError, RelayTimeoutError
+from avantis_trader_sdk.signing import LocalSigner, sign_intent
+from tests.conftest import META, TEST_KEY, TRADER
+
+TXB = "https://txb.test"
+BATCHED = "https://batched.test"
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_800_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client() -> AsyncAvantis:
+    return AsyncAvantis(
+        network="testnet",
+        private_key=TEST_KEY,
+        trader_address=TRADER,
+        tx_builder_url=TXB,
+        batched_market_url=BATCHED,
+    )
+
+
+def _accepted() -> httpx.Response:
+    return httpx.Response(
+        200,
+        content=b'id: 0\nevent: MarketOrderAccepted\ndata: {"trackingId": "trk"}\n\n',
+        headers={"content-type": "text/event-stream"},
+    )
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fire_submits_the_nearest_presigned_level_and_rearms_it():
+    respx.get(f"{TXB}/v2/meta").mock(
+        return_value=httpx.Response(200, json={"ok": True, "data": META})
+    )
+    execute = respx.post(f"{BATCHED}/market/execute-batched").mock(return_value=_accepted())
+    clock = Clock()
+    async with _client() as client:
+        grid = await client.order_grid(clock=clock, rearm=True)
+        grid.add(1, is_long=True, prices=[4100, 3900, 4000], sizes=[100, 250], leverage=10,
+                 slippage_percent=2)
+        assert len(grid) == 6
+
+        level = grid.select(1, 4040.0, is_long=True, size=100)
+        assert level.price == 4000 and level.collateral == 100
+        assert level.payload.message["_t"]["openPrice"] == str(4000 * 10**10)
+        assert sign_intent(level.payload, LocalSigner(TEST_KEY)).signature == level.signature
+
+        receipt = await grid.fire(1, 4040.0, is_long=True, size=100)
+        assert receipt.tracking_id == "trk"
+        body = json.loads(execute.calls[0].request.content)
+        assert body["orderType"] == 0
+        assert body["erc712"] == {
+            "userIntent": level.payload.encoded_intent,
+            "userSignature": level.signature,
+        }
+        rearmed = grid.select(1, 4040.0, is_long=True, size=100)
+        assert rearmed.nonce != level.nonce
+        assert grid.select(1, 4120, is_long=True, size=100).price == 4100
+        assert grid.select(1, 10_000, is_long=True, size=100) is None  # off the grid
+        assert grid.select(1, 3950, is_long=True, size=250).price == 3900  # tie -> lower
+
+        with pytest.raises(ConfigError):
+            grid.select(1, 4000, is_long=False, size=100)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_refresh_resigns_before_deadline_and_releases_unsubmitted_nonces():
+    respx.get(f"{TXB}/v2/meta").mock(
+        return_value=httpx.Response(200, json={"ok": True, "data": META})
+    )
+    clock = Clock()
+    async with _client() as client:
+        grid = await client.order_grid(
+            clock=clock, deadline_ms=60_000, refresh_margin_ms=10_000
+        )
+        grid.add(1, is_long=False, prices=[3000, 3100], sizes=[50], leverage=5)
+        pool = grid._builder.nonces
+        old = [grid.select(1, p, is_long=False, size=50) for p in (3000, 3100)]
+
+        clock.now += 30
+        assert grid.refresh() == 0  # still 30s left, outside the margin
+        clock.now += 25
+        assert grid.refresh() == 2
+        new = grid.select(1, 3000, is_long=False, size=50)
+        assert new.deadline_ms == int(clock.now * 1000) + 60_000
+        assert all(o.nonce not in pool._used for o in old)
+        assert new.nonce in pool._used
+
+        clock.now += 61  # past the deadline without a refresh: nothing armed
+        assert grid.select(1, 3000, is_long=False, size=50) is None
+        assert await grid.fire(1, 3000, is_long=False, size=50) is None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_levels_are_one_shot_unless_rearmed():
+    respx.get(f"{TXB}/v2/meta").mock(
+        return_value=httpx.Response(200, json={"ok": True, "data": META})
+    )
+    execute = respx.post(f"{BATCHED}/market/execute-batched").mock(
+        side_effect=[httpx.Response(400, json={"message": "rejected"}), _accepted(), _accepted()]
+    )
+    async with _client() as client:
+        grid = await client.order_grid(clock=Clock())
+        grid.add(1, is_long=True, prices=[4000], sizes=[100], leverage=10)
+        first = grid.select(1, 4000, is_long=True, size=100)
+
+        with pytest.raises(ApiError):
+            await grid.fire(1, 4000, is_long=True, size=100)
+        retry = grid.select(1, 4000, is_long=True, size=100)  # failed: re-armed
+        assert retry is not None and retry.nonce != first.nonce
+
+        assert await grid.fire(1, 4000, is_long=True, size=100) is not None
+        assert await grid.fire(1, 4000, is_long=True, size=100) is None  # fired once
+        assert grid.refresh() == 0 and execute.call_count == 2
+
+        assert grid.arm(1, is_long=True, size=100) == 1
+        assert await grid.fire(1, 4000, is_long=True, size=100) is not None
+        assert execute.call_count == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_an_accepted_level_stays_fired_when_waiting_fails():
+    respx.get(f"{TXB}/v2/meta").mock(
+        return_value=httpx.Response(200, json={"ok": True, "data": META})
+    )
+    respx.post(f"{BATCHED}/market/execute-batched").mock(return_value=_accepted())
+    respx.get(f"{BATCHED}/tracking-id/trk/status").mock(
+        return_value=httpx.Response(200, json={"events": []})
+    )
+    async with AsyncAvantis(
+        network="testnet",
+        private_key=TEST_KEY,
+        trader_address=TRADER,
+        tx_builder_url=TXB,
+        batched_market_url=BATCHED,
+        relay_poll_interval_s=0.01,
+        relay_poll_timeout_s=0.05,
+    ) as client:
+        grid = await client.order_grid(clock=Clock())
+        grid.add(1, is_long=True, prices=[4000], sizes=[100], leverage=10)
+        with pytest.raises(RelayTimeoutError):  # the stream ended, no terminal in time
+            await grid.fire(1, 4000, is_long=True, size=100, wait=True)
+        assert grid.select(1, 4000, is_long=True, size=100) is None  # not signed again
+
+        with pytest.raises(ConfigError):
+            grid.add(2, is_long=True, prices=[], sizes=[100], leverage=10)
@@ -0,0 +1,168 @@
+"""Own fills counted in the snapshot's OI until the data API catches up."""
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from avantis_trader_sdk import AsyncAvantis, compute
+from avantis_trader_sdk.execution import BatchedMarketEvent
+from avantis_trader_sdk.markets import parse_fill
+from tests.conftest import META, TEST_KEY, TRADER, mock_data_api
+
+DATA = "https://data.test"
+TXB = "https://txb.test"
+CORE = "https://core.test"
+FEED = "https://feed.test"
+BATCHED = "https://batched.test"
+
+SNAPSHOT = json.loads(
+    (Path(__file__).parent / "vectors" / "trading_snapshot.json").read_text()
+)
+
+
+def _executed(pair=0, buy=True, usdc=50_000, coin=25, sent=0, opening=True):
+    return BatchedMarketEvent(
+        "MarketOrderExecuted",
+        {
+            "open": opening,
+            "orderId": 1,
+            "transactionHash": "0xfill",
+            "positionSizeUSDC": str(int(usdc * 1e6)),
+            "coinExposure": str(int(coin * 1e10)),
+            "usdcSentToTrader": str(int(sent * 1e6)),
+            "t": {"pairIndex": str(pair), "buy": buy, "index": "0"},
+        },
+    )
+
+
+def _as_pair(event):
+    return event.type, event.data
+
+
+def test_parse_fill_reads_opens_closes_and_increases():
+    opened = parse_fill(*_as_pair(_executed()))
+    assert (opened.pair_index, opened.is_long) == (0, True)
+    assert (opened.size_usdc, opened.coin_size) == (50_000, 25)
+    closed = parse_fill(*_as_pair(_executed(buy=False, opening=False)))  # full loss: 0 sent
+    assert not closed.is_long and closed.size_usdc == -50_000
+    forced = parse_fill(*_as_pair(_executed()), closing=True)
+    assert forced.size_usdc == -50_000
+    untagged = _executed(sent=120)
+    del untagged.data["open"]
+    assert parse_fill(*_as_pair(untagged)) is None  # direction unknown
+    # documented payload: coinExposureAdded + the stored trade tuple, valued
+    # at its openPrice (positional list here)
+    increased = parse_fill(
+        "PositionSizeIncreased",
+        {
+            "coinExposureAdded": str(int(2 * 1e10)),
+            "t": ["0xtrader", "1", "0", "0", "0", "20000000000000", False, "0", "0", "0", "0"],
+        },
+    )
+    assert (increased.pair_index, increased.is_long) == (1, False)
+    assert increased.size_usdc == pytest.approx(4000) and increased.coin_size == 2
+    assert parse_fill("MarketOrderAccepted", {"trackingId": "x"}) is None
+    assert parse_fill("MarketOrderExecuted", {"orderId": 1}) is None  # no trade tuple
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fills_adjust_headroom_until_a_newer_snapshot():
+    versions = iter([1, 1, 2])
+
+    def trading(request):
+        return httpx.Response(200, json={**SNAPSHOT, "dataVersion": next(versions)})
+
+    respx.get(f"{DATA}/v2/trading").mock(side_effect=trading)
+    async with AsyncAvantis(
+        network="testnet", private_key=TEST_KEY, trader_address=TRADER, data_api_url=DATA
+    ) as client:
+        markets = client.markets
+        base = await markets.snapshot()
+        eth = base.pairs[0]
+        before = compute.max_position_size(eth, base, is_long=True)
+        expected = compute.liquidity_surface(
+            base, pending=[compute.OiDelta(0, True, 50_000)]
+        )[0].long
+
+        assert markets.apply_fill(BatchedMarketEvent("MarketOrderAccepted", {})) is None
+        fill = markets.apply_fill(_executed())
+        snap = await markets.snapshot()
+        adjusted = snap.pairs[0]
+        assert adjusted.open_interest.long == eth.open_interest.long + 50_000
+        assert adjusted.coin_oi.long == pytest.approx(eth.coin_oi.long + 25)
+        assert snap.total_oi == base.total_oi + 50_000
+        assert snap.group_info["0"].group_oi == base.group_info["0"].group_oi + 50_000
+        assert compute.max_position_size(adjusted, snap, is_long=True) == expected < before
+        assert base.pairs[0].open_interest.long == eth.open_interest.long  # untouched
+
+        # same dataVersion: the data API has not indexed the fill yet
+        await markets.snapshot(force=True)
+        assert markets.provisional_fills == [fill]
+        # a newer version fetched after the fill supersedes it
+        fresh = await markets.snapshot(force=True)
+        assert markets.provisional_fills == []
+        assert fresh.pairs[0].open_interest.long == eth.open_interest.long
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_closes_passed_to_apply_fill_remove_oi_even_at_a_full_loss():
+    respx.get(f"{TXB}/v2/meta").mock(
+        return_value=httpx.Response(200, json={"ok": True, "data": META})
+    )
+    mock_data_api(DATA)
+    respx.get(f"{FEED}/v1/price-feeds/last-price").mock(
+        return_value=httpx.Response(200, json=[{"pairIndex": 1, "c": 4000}])
+    )
+    position = {
+        "trader": TRADER,
+        "pairIndex": 1,
+        "index": 0,
+        "buy": True,
+        "collateral": "100000000",
+        "leverage": "100000000000",
+        "openPrice": "40000000000000",
+        "openedAt": 1782374525,
+    }
+    respx.get(f"{CORE}/user-data").mock(
+        return_value=httpx.Response(200, json={"positions": [position]})
+    )
+    executed = {
+        "orderId": 5,
+        "transactionHash": "0xclose",
+        "price": "30000000000000",
+        "positionSizeUSDC": "1000000000",
+        "percentProfit": "-1000000000000",
+        "usdcSentToTrader": "0",
+        "isPnl": False,
+        "coinExposure": str(int(0.25 * 1e10)),
+        "t": {"pairIndex": "1", "buy": True, "index": "0", "openPrice": "40000000000000"},
+    }
+    respx.post(f"{BATCHED}/market/execute-batched").mock(
+        return_value=httpx.Response(
+            200,
+            content=(
+                'id: 0\nevent: MarketOrderAccepted\ndata: {"trackingId": "t"}\n\n'
+                f"id: 1\nevent: MarketOrderExecuted\ndata: {json.dumps(executed)}\n\n"
+            ).encode(),
+            headers={"content-type": "text/event-stream"},
+        )
+    )
+    async with AsyncAvantis(
+        network="testnet",
+        private_key=TEST_KEY,
+        trader_address=TRADER,
+        tx_builder_url=TXB,
+        core_api_url=CORE,
+        feed_url=FEED,
+        batched_market_url=BATCHED,
+        data_api_url=DATA,
+    ) as client:
+        results = await client.trade.close_all(on_event=client.markets.apply_fill)
+        assert results[0].ok
+        [fill] = client.markets.provisional_fills
+        assert (fill.pair_index, fill.is_long, fill.size_usdc) == (1, True, -1000)
@@ -0,0 +1,130 @@
+"""Per-service token buckets: orders leave the queue ahead of reads, one
+service's backlog never delays another, and a 429 holds the service for its
+Retry-After before the request is retried."""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from avantis_trader_sdk import AsyncAvantis
+from avantis_trader_sdk.errors import ConfigError
+from avantis_trader_sdk.ratelimit import Priority, RateLimiter, retry_after_s
+from avantis_trader_sdk.transport import HttpTransport
+from tests.conftest import TEST_KEY, TRADER
+
+CORE = "https://api.test/core"
+DATA = "https://api.test/data"
+ROUTES = {CORE: "core", DATA: "data"}
+SNAPSHOT = json.loads((Path(__file__).parent / "vectors" / "trading_snapshot.json").read_text())
+
+
+@pytest.mark.asyncio
+async def test_orders_jump_ahead_of_queued_reads():
+    limiter = RateLimiter(ROUTES, {"core": 50, "data": 50}, burst={"core": 1})
+    await limiter.acquire(f"{CORE}/user-data")  # drain the only token
+    order: list[str] = []
+
+    async def call(name: str, priority: Priority) -> None:
+        await limiter.acquire(f"{CORE}/x", priority)
+        order.append(name)
+
+    reads = [asyncio.create_task(call(f"read{i}", Priority.READ)) for i in range(3)]
+    await asyncio.sleep(0)
+    assert limiter.stats()["core"].queued == 3
+    history = asyncio.create_task(call("history", Priority.BACKGROUND))
+    close = asyncio.create_task(call("close", Priority.ORDER))
+
+    started = time.monotonic()
+    assert await limiter.acquire(f"{DATA}/v2/trading") == 0.0  # other service: no wait
+    assert time.monotonic() - started < 0.01
+
+    await asyncio.gather(*reads, history, close)
+    assert order == ["close", "read0", "read1", "read2", "history"]
+    stats = limiter.stats()["core"]
+    assert (stats.requests, stats.waited, stats.queued) == (6, 5, 0)
+    assert stats.max_wait_s >= 0.08  # five tokens at 50/s
+    assert limiter.service_for("https://elsewhere.test/x") is None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_429_holds_the_service_for_retry_after_then_retries():
+    route = respx.get(f"{CORE}/user-data").mock(
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "0.1"}),
+            httpx.Response(200, json={"ok": 1}),
+        ]
+    )
+    limiter = RateLimiter(ROUTES, {"core": 100})
+    transport = HttpTransport(limiter=limiter)
+    started = time.monotonic()
+    assert await transport.json("GET", f"{CORE}/user-data") == {"ok": 1}
+    assert time.monotonic() - started >= 0.1
+    assert route.call_count == 2
+    assert limiter.stats()["core"].throttled == 1
+    await transport.aclose()
+
+    assert retry_after_s("2") == 2.0
+    assert retry_after_s("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert retry_after_s("soon", default=3.0) == 3.0
+
+
+def test_rate_limits_are_opt_in_from_config():
+    assert AsyncAvantis(network="testnet").transport.limiter is None
+    client = AsyncAvantis(network="testnet", rate_limits={"core": 5, "tx-builder": 20})
+    limiter = client.transport.limiter
+    assert limiter.service_for(f"{client.config.core_api_url}/user-data") == "core"
+    assert limiter.service_for(f"{client.config.batched_market_url}/market") is None
+    with pytest.raises(ConfigError):
+        AsyncAvantis(network="testnet", rate_limits={"history-v0": 5})
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_history_pages_queue_as_background_and_spread_posts_as_reads():
+    history, twap, risk = "https://history.test", "https://twap.test", "https://risk-v2.test"
+    respx.get(url__startswith=f"{history}/v2/history/trade-history/").mock(
+        return_value=httpx.Response(200, json=[{"id": 1}])
+    )
+    respx.get(f"{twap}/twaps").mock(return_value=httpx.Response(200, json={"data": []}))
+    respx.get("https://data.test/v2/trading").mock(
+        return_value=httpx.Response(200, json=SNAPSHOT)
+    )
+    respx.post(f"{risk}/spread").mock(
+        return_value=httpx.Response(200, json={"spreadPctWithoutFlow10": "500000000"})
+    )
+    client = AsyncAvantis(
+        network="testnet",
+        private_key=TEST_KEY,
+        trader_address=TRADER,
+        history_api_url=history,
+        twap_api_url=twap,
+        risk_v2_api_url=risk,
+        data_api_url="https://data.test",
+        rate_limits={"history": 100, "twap": 100, "risk-v2": 100, "data": 100},
+    )
+    limiter = client.transport.limiter
+    seen: list[tuple[str | None, Priority]] = []
+    acquire = limiter.acquire
+
+    async def record(url: str, priority: Priority = Priority.READ) -> float:
+        seen.append((limiter.service_for(url), priority))
+        return await acquire(url, priority)
+
+    limiter.acquire = record
+    async with client:
+        assert [t async for t in client.info.iter_trade_history(TRADER, prefetch=1)]
+        assert [t async for t in client.account.iter_twaps(prefetch=1)] == []
+        await client.markets.spread("ETH/USD", is_long=True, coin_size=1)
+
+    assert seen == [
+        ("history", Priority.BACKGROUND),
+        ("twap", Priority.BACKGROUND),
+        ("data", Priority.READ),  # pair lookup
+        ("risk-v2", Priority.READ),
+    ]
@@ -0,0 +1,110 @@
+"""Stale-while-revalidate caches: a stale value is served at once while one
+background fetch replaces it, only an empty or too-stale cache blocks, and
+the client and the execution engine share one /v2/meta cache."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from avantis_trader_sdk import AsyncAvantis
+from avantis_trader_sdk.errors import ConfigError
+from avantis_trader_sdk.refresh import Refreshing
+from tests.conftest import META, TEST_KEY, TRADER
+
+TXB = "https://txb.test"
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Source:
+    """Returns 1, 2, 3, ... after ``delay_s``; raises while ``fail`` is set."""
+
+    def __init__(self, delay_s: float = 0.0) -> None:
+        self.delay_s = delay_s
+        self.calls = 0
+        self.fail = False
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        await asyncio.sleep(self.delay_s)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return self.calls
+
+
+@pytest.mark.asyncio
+async def test_stale_value_is_served_while_one_fetch_refreshes_it():
+    clock, source = Clock(), Source(delay_s=0.01)
+    cache = Refreshing(source, ttl_s=5, max_stale_s=30, clock=clock)
+    assert await asyncio.gather(cache.get(), cache.get(), cache.get()) == [1, 1, 1]
+    assert source.calls == 1  # concurrent cold reads share one fetch
+
+    clock.now += 6  # stale: served immediately, one background refetch
+    assert await asyncio.gather(cache.get(), cache.get()) == [1, 1]
+    assert source.calls == 2
+    await asyncio.sleep(0.02)
+    assert await cache.get() == 2 and cache.age_s == 0
+
+    source.fail = True
+    clock.now += 6
+    assert await cache.get() == 2
+    await asyncio.sleep(0.02)
+    assert isinstance(cache.last_error, RuntimeError) and cache.peek() == 2
+
+    clock.now += 30  # past max_stale_s: the caller waits and sees the error
+    with pytest.raises(RuntimeError):
+        await cache.get()
+    source.fail = False
+    assert await cache.get() == 5 and cache.last_error is None
+    assert await cache.get(force=True) == 6
+
+    with pytest.raises(ConfigError):
+        Refreshing(source, ttl_s=5, max_stale_s=1)
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_runs_ahead_of_expiry_with_jitter():
+    source = Source()
+    cache = Refreshing(source, ttl_s=0.05, refresh_ahead=0.5, jitter=0.5, rng=lambda: 1.0)
+    await cache.get()
+    cache.fetched_at -= 0.01
+    assert cache.next_delay_s() == pytest.approx(0.015 * 1.5, abs=0.005)
+    cache.start()
+    await asyncio.sleep(0.2)
+    await cache.stop()
+    assert source.calls >= 4 and cache.age_s < cache.ttl_s
+
+    source.fail = True
+    with pytest.raises(RuntimeError):
+        await cache.refresh()
+    assert cache.next_delay_s() == pytest.approx(0.05 * 1.5)  # back off, capped at ttl
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_client_and_engine_share_one_meta_cache():
+    route = respx.get(f"{TXB}/v2/meta").mock(
+        return_value=httpx.Response(200, json={"ok": True, "data": META})
+    )
+    async with AsyncAvantis(
+        network="testnet", private_key=TEST_KEY, trader_address=TRADER, tx_builder_url=TXB
+    ) as client:
+        meta, chain_id, router = await asyncio.gather(
+            client.meta(), client.engine.chain_id(), client.engine.trading_router()
+        )
+        assert chain_id == int(meta["chainId"]) == await client.chain_id()
+        assert router == meta["addresses"]["tradingRouter"]
+        assert route.call_count == 1
+
+        client.engine.meta_cache.fetched_at -= 301  # stale: order paths never wait
+        assert await client.engine.chain_id() == chain_id
+        await asyncio.sleep(0.01)
+        assert route.call_count == 2
@@ -0,0 +1,114 @@
+"""Multi-endpoint JSON-RPC: reads follow the lowest EWMA latency, failing
+endpoints are ejected and later re-admitted, and raw transactions are
+broadcast to every healthy endpoint."""
+
+import json
+
+import httpx
+import pytest
+import respx
+from eth_utils import keccak
+
+from avantis_trader_sdk.config import AvantisConfig
+from avantis_trader_sdk.errors import RpcError
+from avantis_trader_sdk.execution import JsonRpcClient
+
+A, B, C = "https://rpc-a.test", "https://rpc-b.test", "https://rpc-c.test"
+RAW = "0x02" + "ab" * 40
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _node(clock: Clock, *, latency_s: float = 0.0, status: int = 200, result="0x1", error=None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        clock.now += latency_s
+        body = json.loads(request.content)
+        reply = {"jsonrpc": "2.0", "id": body["id"]}
+        if error is not None:
+            reply["error"] = {"code": -32000, "message": error}
+        else:
+            reply["result"] = result
+        return httpx.Response(status, json=reply)
+
+    return handler
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_reads_prefer_the_lowest_latency_endpoint():
+    clock = Clock()
+    slow = respx.post(A).mock(side_effect=_node(clock, latency_s=0.2))
+    fast = respx.post(B).mock(side_effect=_node(clock, latency_s=0.02))
+    rpc = JsonRpcClient([A, B], clock=clock)
+    await rpc.chain_id()  # both unmeasured: first in the list
+    await rpc.chain_id()  # B still unmeasured: tried before measured A
+    for _ in range(5):
+        await rpc.chain_id()
+    assert slow.call_count == 1 and fast.call_count == 6
+    a, b = rpc.endpoints
+    assert a.latency_ms == pytest.approx(200) and b.latency_ms == pytest.approx(20)
+    assert (a.requests, a.errors, b.requests, b.errors) == (1, 0, 6, 0)
+    await rpc.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_failing_endpoint_is_ejected_and_recovers():
+    clock = Clock()
+    route_a = respx.post(A).mock(side_effect=_node(clock, status=503))
+    route_b = respx.post(B).mock(side_effect=_node(clock, latency_s=0.05, result="0x5"))
+    rpc = JsonRpcClient([A, B], eject_after=3, eject_s=30.0, clock=clock)
+    for _ in range(3):  # A is still ranked first (unmeasured), fails over to B
+        assert await rpc.get_transaction_count("0x" + "11" * 20) == 5
+    a = rpc.endpoints[0]
+    assert (a.errors, a.consecutive_errors) == (3, 3)
+    assert not a.healthy(clock.now)
+
+    await rpc.get_transaction_count("0x" + "11" * 20)
+    assert route_a.call_count == 3 and route_b.call_count == 4  # A skipped
+
+    clock.now += 31
+    route_a.side_effect = _node(clock, latency_s=0.01, result="0x5")
+    await rpc.get_transaction_count("0x" + "11" * 20)
+    assert route_a.call_count == 4 and a.consecutive_errors == 0
+
+    route_b.side_effect = _node(clock, error="nonce too low")  # a node verdict, not an outage
+    route_a.side_effect = _node(clock, error="nonce too low")
+    with pytest.raises(RpcError, match="nonce too low"):
+        await rpc.call("eth_call")
+    assert route_b.call_count == 4  # answered by A, no failover
+    await rpc.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_send_raw_transaction_broadcasts_to_every_healthy_endpoint():
+    clock = Clock()
+    tx_hash = "0x" + "22" * 32
+    routes = [
+        respx.post(A).mock(side_effect=_node(clock, status=502)),
+        respx.post(B).mock(side_effect=_node(clock, error="already known")),
+        respx.post(C).mock(side_effect=_node(clock, result=tx_hash)),
+    ]
+    rpc = JsonRpcClient([A, B, C], clock=clock)
+    result = await rpc.send_raw_transaction(RAW)
+    assert result in (tx_hash, "0x" + keccak(hexstr=RAW).hex())
+    assert all(r.call_count == 1 for r in routes)
+
+    routes[1].side_effect = _node(clock, error="nonce too low")
+    routes[2].side_effect = _node(clock, status=503)
+    with pytest.raises(RpcError, match="nonce too low"):
+        await rpc.send_raw_transaction(RAW)
+    await rpc.aclose()
+
+
+def test_rpc_endpoints_from_config(monkeypatch):
+    monkeypatch.setenv("AVANTIS_RPC_URL", f"{A}, {B}")
+    cfg = AvantisConfig.load(network="testnet", rpc_urls=[B, C])
+    assert cfg.rpc_endpoints == [A, B, C]
@@ -1,4 +1,5 @@
-"""Stream parsing tests (SSE price stream via mocked HTTP)."""
+"""Stream parsing tests (SSE price stream via mocked HTTP) and recorded-stream
+capture/replay."""
 
 import asyncio
 
@@ -6,7 +7,7 @@ import httpx
 import pytest
 import respx
 
-from avantis_trader_sdk.streams import LazerPriceStream
+from avantis_trader_sdk.streams import BarBuilder, LazerPriceStream, PriceUpdate
 
 SSE_BODY = (
     b"event: price_update\n"
@@ -46,3 +47,127 @@ async def test_lazer_sse_parses_price_updates():
     assert u.best_bid == pytest.approx(6176.0)
     assert u.best_ask == pytest.approx(6177.0)
     assert u.timestamp_ms == 1782374525000
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_recorded_lazer_stream_replays_unchanged(tmp_path):
+    """Tap a live stream with a recorder, then replay the capture through the
+    same run(callback) interface: identical messages, in receive order."""
+    from avantis_trader_sdk.streams import OrderEvent, StreamRecorder, StreamReplay
+
+    respx.get("https://feed.test/v1/stream").mock(
+        return_value=httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, content=SSE_BODY
+        )
+    )
+    path = tmp_path / "capture.avsrec"
+    stream = LazerPriceStream("https://feed.test", [2])
+    live = []
+
+    async def collect(update):
+        live.append(update)
+        stream.stop()
+
+    with StreamRecorder(path) as recorder:
+        await asyncio.wait_for(stream.run(recorder.tap(collect)), timeout=5)
+        recorder.record(PriceUpdate(feed_id="ab12", price=1.5))  # Hermes-style id
+        recorder.record({"pairs": {"1": {"oi": 3}}})  # PairDataStream payload
+        recorder.record(OrderEvent("OrderFilled", {"orderId": 9}, "events-0xabc"))
+        recorder.record(PriceUpdate(feed_id=2, price=6180.0))
+
+    replayed = []
+    await StreamReplay(path).run(replayed.append)
+
+    assert replayed[0] == PriceUpdate(
+        feed_id=2, price=live[0].price, timestamp_ms=1782374525000,
+        best_bid=live[0].best_bid, best_ask=live[0].best_ask,
+    )
+    assert replayed[1] == PriceUpdate(feed_id="ab12", price=1.5)
+    assert replayed[2] == {"pairs": {"1": {"oi": 3}}}
+    assert replayed[3] == OrderEvent("OrderFilled", {"orderId": 9}, "events-0xabc")
+    assert replayed[4].price == 6180.0
+
+    prices = [u async for u in StreamReplay(path, kinds={"price"})]
+    assert [u.price for u in prices] == [live[0].price, 1.5, 6180.0]
+
+
+@pytest.mark.asyncio
+async def test_replay_paces_to_recorded_gaps_and_stops(tmp_path):
+    from avantis_trader_sdk.streams import StreamRecorder, StreamReplay
+
+    path = tmp_path / "paced.avsrec"
+    with StreamRecorder(path, block_size=2) as recorder:
+        for i in range(5):
+            recorder.record(PriceUpdate(feed_id=2, price=float(i)), recv_ns=i * 20_000_000)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    seen = []
+    await StreamReplay(path, speed=2.0).run(lambda u: seen.append(u.price))
+    assert seen == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert loop.time() - started >= 0.035  # 80ms recorded at 2x
+
+    replay = StreamReplay(path)
+    seen.clear()
+
+    async def first_only(update):
+        seen.append(update.price)
+        replay.stop()
+
+    await replay.run(first_only)
+    assert seen == [0.0]
+
+
+def _tick(price: float, seconds: float, feed_id: int = 2) -> PriceUpdate:
+    return PriceUpdate(feed_id=feed_id, price=price, timestamp_ms=int(seconds * 1000))
+
+
+@pytest.mark.asyncio
+async def test_bar_builder_rolls_bars_at_several_resolutions():
+    closes = []
+    bars = BarBuilder(["5", "1"], capacity=3, on_close=closes.append)
+    for i, price in enumerate([10, 12, 9, 11, 13, 8, 10]):
+        await bars.on_price(_tick(price, 30 * i))  # one tick every 30s
+    await bars.on_price(_tick(99, 30))  # late: dropped at 1m, high only at 5m
+
+    one = bars.series(2, "1")
+    assert list(one.time) == [0, 60, 120, 180]
+    assert list(one.open) == [10, 9, 13, 10]
+    assert list(one.high) == [12, 11, 13, 10]
+    assert list(one.low) == [10, 9, 8, 10]
+    assert list(one.volume) == [2, 2, 2, 1]  # tick counts
+    assert [c.bar.time for c in closes] == [0, 60, 120]
+    assert all(c.resolution == "1" and c.feed_id == 2 for c in closes)
+
+    # the 5m bar is still forming, and reflects the last tick
+    assert len(bars.bars(2, "5")) == 0
+    forming = bars.bars(2, "5").current
+    assert (forming.high, forming.close) == (99, 10)
+
+    # ring holds `capacity` closed bars
+    for i in range(7, 12):
+        bars.update(_tick(1, 60 * i))
+    ring = bars.bars(2, "1")
+    assert len(ring) == 3 and ring[-1].time == 600 and ring[0].time == 480
+    assert list(bars.series(2, "1", include_current=False).time) == [480, 540, 600]
+
+
+@pytest.mark.asyncio
+async def test_bar_builder_backfills_then_continues_the_forming_bar():
+    requested = []
+
+    async def candles(symbol, resolution, start, end):
+        requested.append((symbol, resolution, start, end))
+        return {"s": "ok", "t": [0, 60, 120], "o": [1, 2, 3], "h": [2, 3, 4],
+                "l": [0.5, 1.5, 2.5], "c": [2, 3, 3.5], "v": [5, 5, 5]}
+
+    bars = BarBuilder(["1"], capacity=10, clock=lambda: 150)
+    await bars.backfill(candles, "ETH/USD", "0xABCD", bars=3)
+    assert requested == [("ETH/USD", "1", -30, 210)]
+
+    closed = bars.update(PriceUpdate(feed_id="abcd", price=5, timestamp_ms=170_000))
+    assert closed == [] and bars.bars("0xabcd", "1").current.high == 5
+    [event] = bars.update(PriceUpdate(feed_id="abcd", price=6, timestamp_ms=185_000))
+    assert (event.bar.time, event.bar.open, event.bar.close) == (120, 3, 5)
+    assert list(bars.series("abcd", "1").close) == [2, 3, 5, 6]
@@ -0,0 +1,203 @@
+"""Shared TP/SL confirmation watcher: one /user-data poll resolves every
+pending update, zero-TP resets keep their settle-on-timeout semantics."""
+
+import asyncio
+
+import pytest
+
+from avantis_trader_sdk.account.models import UserData
+from avantis_trader_sdk.errors import ApiError, RelayTimeoutError, ValidationError
+from avantis_trader_sdk.trading import TpSlConfirmations
+from tests.conftest import TRADER
+
+
+def _position(index: int, tp_raw: str, sl_raw: str) -> dict:
+    return {
+        "trader": TRADER,
+        "pairIndex": 1,
+        "index": index,
+        "buy": True,
+        "collateral": "100000000",
+        "leverage": "100000000000",
+        "openPrice": "40000000000000",
+        "tp": tp_raw,
+        "sl": sl_raw,
+    }
+
+
+class _Account:
+    """Scripted /user-data: returns the current positions, counts fetches."""
+
+    def __init__(self, positions: list[dict]) -> None:
+        self.positions = positions
+        self.fetches = 0
+
+    async def fetch(self) -> UserData:
+        self.fetches += 1
+        return UserData.model_validate({"positions": self.positions})
+
+
+@pytest.mark.asyncio
+async def test_many_pending_updates_share_one_poll():
+    account = _Account(
+        [_position(i, "60000000000000", "35000000000000") for i in range(30)]
+    )
+    confirmations = TpSlConfirmations(account.fetch, poll_interval_s=0.01, timeout_s=5)
+
+    await asyncio.gather(
+        *(
+            confirmations.expect(
+                1,
+                i,
+                before=("50000000000000", "35000000000000"),
+                expected=("60000000000000", "35000000000000"),
+            )
+            for i in range(30)
+        )
+    )
+
+    assert account.fetches == 1
+    assert confirmations.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_pending_update_resolves_once_levels_land():
+    account = _Account([_position(0, "50000000000000", "35000000000000")])
+    confirmations = TpSlConfirmations(account.fetch, poll_interval_s=0.01, timeout_s=5)
+
+    waiter = asyncio.create_task(
+        confirmations.expect(
+            1, 0,
+            before=("50000000000000", "35000000000000"),
+            expected=("60000000000000", "30000000000000"),
+        )
+    )
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+    account.positions = [_position(0, "60000000000000", "30000000000000")]
+    await asyncio.wait_for(waiter, timeout=1)
+    assert account.fetches >= 2
+
+
+@pytest.mark.asyncio
+async def test_observe_resolves_without_a_poll():
+    account = _Account([_position(0, "50000000000000", "35000000000000")])
+    confirmations = TpSlConfirmations(account.fetch, poll_interval_s=10, timeout_s=30)
+
+    waiter = asyncio.create_task(
+        confirmations.expect(
+            1, 0,
+            before=("50000000000000", "35000000000000"),
+            expected=("50000000000000", "0"),
+        )
+    )
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    confirmations.observe(
+        UserData.model_validate({"positions": [_position(0, "50000000000000", "0")]})
+    )
+    await asyncio.wait_for(waiter, timeout=1)
+    assert account.fetches == 1  # only the initial poll; observe() settled it
+    await confirmations.aclose()
+
+
+@pytest.mark.asyncio
+async def test_zero_tp_reset_settles_on_timeout_when_sl_confirmed():
+    # TP already sits at the corrected default: tp=0 re-stores the same value
+    account = _Account([_position(0, "50000000000000", "30000000000000")])
+    confirmations = TpSlConfirmations(account.fetch, poll_interval_s=0.01, timeout_s=0.05)
+
+    await confirmations.expect(
+        1, 0,
+        before=("50000000000000", "35000000000000"),
+        expected=("0", "30000000000000"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_timeout_raises_with_observed_levels():
+    account = _Account([_position(0, "50000000000000", "35000000000000")])
+    confirmations = TpSlConfirmations(account.fetch, poll_interval_s=0.01, timeout_s=0.05)
+
+    with pytest.raises(RelayTimeoutError, match="position still shows tp=5000 sl=3500"):
+        await confirmations.expect(
+            1, 0,
+            before=("50000000000000", "35000000000000"),
+            expected=("60000000000000", "35000000000000"),
+        )
+    assert confirmations.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_vanished_position_fails_with_no_position():
+    account = _Account([])
+    confirmations = TpSlConfirmations(account.fetch, poll_interval_s=0.01, timeout_s=5)
+
+    with pytest.raises(ValidationError) as exc:
+        await confirmations.expect(
+            1, 0,
+            before=("50000000000000", "35000000000000"),
+            expected=("60000000000000", "35000000000000"),
+        )
+    assert exc.value.code == "NO_POSITION"
+
+
+class _Flaky(_Account):
+    """/user-data that fails while ``down`` is set."""
+
+    down = True
+
+    async def fetch(self) -> UserData:
+        if self.down:
+            self.fetches += 1
+            raise ApiError("user-data unavailable", status=503)
+        return await super().fetch()
+
+
+@pytest.mark.asyncio
+async def test_failed_poll_only_fails_entries_past_their_deadline():
+    account = _Flaky([_position(i, "60000000000000", "35000000000000") for i in range(2)])
+    confirmations = TpSlConfirmations(account.fetch, poll_interval_s=0.01, timeout_s=5)
+
+    def expect(index: int, timeout_s: float):
+        return asyncio.create_task(
+            confirmations.expect(
+                1, index,
+                before=("50000000000000", "35000000000000"),
+                expected=("60000000000000", "35000000000000"),
+                timeout_s=timeout_s,
+            )
+        )
+
+    short, long = expect(0, 0.05), expect(1, 5)
+    with pytest.raises(RelayTimeoutError) as exc:
+        await short
+    assert isinstance(exc.value.__cause__, ApiError)
+    assert isinstance(confirmations.last_error, ApiError)
+    assert not long.done() and account.fetches >= 2
+
+    account.down = False
+    await asyncio.wait_for(long, timeout=1)
+    assert confirmations.last_error is None and confirmations.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_client_aclose_stops_the_watcher():
+    from avantis_trader_sdk import AsyncAvantis
+    from tests.conftest import TEST_KEY
+
+    client = AsyncAvantis(network="testnet", private_key=TEST_KEY, trader_address=TRADER)
+    account = _Flaky([])
+    client.trade._confirmations = TpSlConfirmations(account.fetch, poll_interval_s=0.01)
+    waiter = asyncio.create_task(
+        client.trade.tp_sl_confirmations.expect(
+            1, 0, before=("0", "0"), expected=("60000000000000", "0")
+        )
+    )
+    await asyncio.sleep(0.03)
+
+    await client.aclose()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert client.trade.tp_sl_confirmations.pending == 0